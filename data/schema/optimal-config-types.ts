@@ -6,6 +6,9 @@
  *
  * Used by: data/optimal-configs/src/{version}/{model}.yaml
  * Compiled to: data/optimal-configs/generated/{version}/{model}.json
+ *
+ * The compiler validates its output against the mirror of these types in
+ * data/scripts/config_schema.py.
  */
 
 export interface OptimalConfigFile {
@@ -14,6 +17,47 @@ export interface OptimalConfigFile {
   ui_options: UIOptions;
   configs: OptimalConfig[];
   validation?: ValidationRule[];
+  /** Generated: hardware -> quantization -> gpu_count -> scenario -> index into configs */
+  lookup?: OptimalConfigLookup;
+  /** Generated: ui_options IDs of each dimension that have at least one config */
+  available?: AvailableOptions;
+  /** Generated: which ui_options combinations have a config */
+  validity?: ValidityMatrix;
+  /** Generated with --benchmarks: measured trade-off curve per hardware/quantization/gpu_count */
+  frontiers?: ParetoFrontier[];
+}
+
+export type OptimalConfigLookup = Record<
+  string,
+  Record<string, Record<string, Record<string, number>>>
+>;
+
+export interface AvailableOptions {
+  hardware: string[];
+  quantization: string[];
+  gpu_count: number[];
+  scenario: string[];
+}
+
+/**
+ * Validity of every hardware x quantization x gpu_count x scenario combination,
+ * packed as a bitset.
+ *
+ * Axes follow `dimensions` (always hardware, quantization, gpu_count, scenario),
+ * each in ui_options order. The bit index of a combination is
+ * sum(position[d] * strides[d]) over the dimensions, where position is the
+ * option's index in ui_options[d]; `strides` is row-major, so the last
+ * dimension has stride 1. Bit i is bit (i % 8), least significant first, of
+ * byte floor(i / 8), and `bits` holds the bytes as lowercase hex:
+ *
+ *   (parseInt(bits.substr((i >> 3) * 2, 2), 16) >> (i & 7)) & 1
+ *
+ * A set bit means a config exists for the combination.
+ */
+export interface ValidityMatrix {
+  dimensions: ("hardware" | "quantization" | "gpu_count" | "scenario")[];
+  strides: number[];
+  bits: string;
 }
 
 export interface UIOptions {
@@ -36,6 +80,34 @@ export interface OptimalConfig {
   gpu_count: number;
   scenario: "low-latency" | "high-throughput";
   parameters: ServerParameters;
+  /** Generated with --benchmarks: measured bench_serving results for this entry */
+  benchmark?: BenchmarkSummary;
+}
+
+export interface BenchmarkMetrics {
+  max_concurrency?: number;
+  concurrency?: number;
+  request_throughput?: number;
+  output_throughput?: number;
+  median_ttft_ms?: number;
+  p99_ttft_ms?: number;
+  median_tpot_ms?: number;
+  p99_tpot_ms?: number;
+}
+
+export interface BenchmarkSummary {
+  /** Metric the scenario is ranked by */
+  objective?: keyof BenchmarkMetrics;
+  /** Number of runs measured on this hardware/quantization/gpu_count/scenario */
+  runs: number;
+  /** Best run with this entry's parameters, null if none was measured */
+  measured: BenchmarkMetrics | null;
+  best?: {
+    parameters: Partial<ServerParameters>;
+    metrics: BenchmarkMetrics;
+  };
+  /** Whether this entry's parameters produced the best run */
+  is_best?: boolean;
 }
 
 export interface ServerParameters {
@@ -63,6 +135,23 @@ export interface ServerParameters {
   fp8_gemm_backend?: string;
 }
 
+export interface ParetoFrontier {
+  hardware: string;
+  quantization: string;
+  gpu_count: number;
+  axes: { throughput: keyof BenchmarkMetrics; latency: keyof BenchmarkMetrics };
+  /** Non-dominated runs, from lowest latency to highest throughput */
+  points: FrontierPoint[];
+  /** Index into points of the run that best serves each scenario */
+  scenarios: Record<"low-latency" | "high-throughput", number>;
+}
+
+export interface FrontierPoint {
+  parameters: Partial<ServerParameters>;
+  scenario?: "low-latency" | "high-throughput";
+  metrics: BenchmarkMetrics;
+}
+
 export interface ValidationRule {
   hardware: string | string[];
   quantization: string | string[];
@@ -2,7 +2,8 @@
  * Model Configuration Schema Types
  *
  * This file defines the TypeScript interfaces for the model configuration hierarchy.
- * It serves as the source of truth for the data structure.
+ * It serves as the source of truth for the data structure; the compiler validates
+ * its output against the mirror of these types in data/scripts/config_schema.py.
  *
  * Hierarchy: Vendor -> Family -> Model -> Hardware -> Named Configuration
  * Note: Version is now a top-level folder (e.g., data/models/generated/v0.5.6/)
@@ -28,7 +29,7 @@ export interface ModelFamily {
   /** Family name (e.g., "DeepSeek-V3.2", "DeepSeek-R1") */
   name: string;
   /** Optional description of the model family */
-  description?: string;
+  description?: string | null;
   /** List of models in this family */
   models: Model[];
 }
@@ -42,6 +43,8 @@ export interface Model {
   name: string;
   /** HuggingFace model path (e.g., "deepseek-ai/DeepSeek-V3.2") */
   model_path: string;
+  /** Draft model path used by the model's speculative configurations */
+  speculative_draft_model?: string | null;
   /** Model-level attributes (capabilities, parsers, etc.) */
   attributes: ModelAttributes;
   /** Hardware-specific configurations, keyed by hardware type */
@@ -80,15 +83,15 @@ export interface DiffusionAttributes {
   /** Type of diffusion model */
   model_type: "image" | "video" | "image_edit";
   /** Task types supported by the model (e.g., text-to-image, image-to-video) */
-  task_types?: string[];
+  task_types?: string[] | null;
   /** Whether the model supports LoRA fine-tuning */
-  supports_lora?: boolean;
+  supports_lora?: boolean | null;
   /** Default ulysses degree for sequence parallelism */
-  ulysses_degree?: number;
+  ulysses_degree?: number | null;
   /** Default ring degree for sequence parallelism */
-  ring_degree?: number;
+  ring_degree?: number | null;
   /** Whether to enable layerwise offload by default */
-  dit_layerwise_offload?: boolean;
+  dit_layerwise_offload?: boolean | null;
 }
 
 // ============ Level 4: Hardware Config ============
@@ -122,6 +125,31 @@ export interface NamedConfiguration {
   prefill?: EngineConfig | null;
   /** Decode phase config (requires prefill, mutually exclusive with engine) */
   decode?: EngineConfig | null;
+  /** Compiler-estimated resource needs, present when the model declares `resources` */
+  estimate?: ResourceEstimate;
+}
+
+/**
+ * Estimated GPU count, memory fit and KV-cache capacity of a configuration,
+ * computed from the model's declared parameter count and KV-cache shape, the
+ * configuration's quantization and parallelism, and the hardware memory size.
+ * Memory figures are in GB (1e9 bytes).
+ */
+export interface ResourceEstimate {
+  /** GPUs used: tp, times dp unless DP attention is enabled */
+  gpus: number;
+  /** Nodes needed for the GPUs */
+  nodes: number;
+  /** Total weight memory at the configured quantization */
+  weight_memory_gb: number;
+  /** Weight memory per GPU (weights are sharded across tp) */
+  weight_memory_per_gpu_gb: number;
+  /** Static memory pool per GPU left for the KV cache after weights (negative if weights do not fit) */
+  kv_cache_headroom_per_gpu_gb: number;
+  /** Tokens the KV cache can hold across the deployment (requires a declared KV-cache shape) */
+  max_concurrent_tokens?: number;
+  /** False when weights do not fit, or a single-node configuration needs several nodes */
+  fits: boolean;
 }
 
 /**
@@ -0,0 +1,346 @@
+#!/usr/bin/env python3
+"""
+Model Config Compiler Benchmarks
+
+Measures how compile_models.py scales by synthesizing vendor files at multiples
+of the current catalog size (counted in generated configurations) and timing:
+- end-to-end compile (`compile_models.py --no-cache`) of the synthetic tree
+- end-to-end `--check` of the freshly compiled tree
+- per-call cost of generate_model_variants, get_merged_hardware_config and
+  merge_extra_args on inputs drawn from the synthetic sources
+
+Synthetic files vary the number of families, capabilities x quantizations,
+per-model hardware overrides and quant_overrides, and are generated from a
+fixed seed so runs are comparable. Results are compared against a recorded
+baseline (bench_baseline.json next to this script).
+
+Usage:
+    python bench_compile_models.py [--scales 10,100,1000] [--repeat N]
+    python bench_compile_models.py --record    # overwrite the baseline
+"""
+
+import argparse
+import contextlib
+import io
+import json
+import platform
+import random
+import shutil
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+import yaml
+
+from compile_models import (
+    compile_config,
+    generate_model_variants,
+    get_merged_hardware_config,
+    load_vendors,
+    load_yaml,
+    merge_extra_args,
+)
+
+SCRIPTS_DIR = Path(__file__).parent
+MODELS_DIR = SCRIPTS_DIR.parent / "models"
+BASELINE_PATH = SCRIPTS_DIR / "bench_baseline.json"
+
+DEFAULT_SCALES = (10, 100, 1000)
+SEED = 20250101
+
+HARDWARE = ("H100", "H200", "B200", "B300", "GB200", "MI300X", "MI355X")
+CAPABILITIES = ("base", "instruct", "thinking")
+QUANTIZATIONS = ("bf16", "fp8", "fp4", "int4")
+TUNING_ARGS = (
+    ["--mem-fraction-static", "0.85"],
+    ["--kv-cache-dtype", "fp8_e4m3"],
+    ["--chunked-prefill-size", "8192"],
+    ["--attention-backend", "flashinfer"],
+    ["--moe-runner-backend", "flashinfer_trtllm"],
+    ["--enable-symm-mem"],
+)
+
+
+# =============================================================================
+# Synthetic Catalogs
+# =============================================================================
+
+
+def synth_extra_args(rng: random.Random, count: int) -> list[str]:
+    """Pick count distinct tuning flags, flattened into an extra_args list."""
+    args = []
+    for flags in rng.sample(TUNING_ARGS, count):
+        args.extend(flags)
+    return args
+
+
+def synth_source(rng: random.Random, index: int, vendor_ids: list[str]) -> dict:
+    """Build one synthetic simplified source file."""
+    hardware = rng.sample(HARDWARE, rng.randint(2, 4))
+    configurations = [{"name": "default", "nodes": "single", "optimization": "balanced"}]
+    if rng.random() < 0.7:
+        configurations.append({
+            "name": "high-throughput-dp",
+            "nodes": "single",
+            "optimization": "high-throughput",
+            "dp": 8,
+            "enable_dp_attention": True,
+            "extra_args": synth_extra_args(rng, 1),
+        })
+    if rng.random() < 0.5:
+        configurations.append({
+            "name": "speculative-mtp",
+            "nodes": "single",
+            "optimization": "low-latency",
+            "extra_args": [
+                "--speculative-algorithm", "EAGLE",
+                "--speculative-num-steps", "3",
+            ] + synth_extra_args(rng, 2),
+        })
+
+    families = []
+    for family_index in range(rng.randint(1, 4)):
+        models = []
+        for model_index in range(rng.randint(1, 4)):
+            if rng.random() < 0.75:
+                model = {
+                    "base_name": f"{rng.choice((7, 14, 32, 72, 235))}B-M{model_index}",
+                    "capabilities": rng.sample(CAPABILITIES, rng.randint(1, 3)),
+                    "quantizations": rng.sample(QUANTIZATIONS, rng.randint(1, 3)),
+                }
+                if rng.random() < 0.4:
+                    model["quant_overrides"] = {
+                        model["quantizations"][0]: {"ep": 2, "extra_args": synth_extra_args(rng, 1)}
+                    }
+            else:
+                model = {"name": f"Synth{index}-F{family_index}-Explicit{model_index}"}
+            if rng.random() < 0.5:
+                model["hardware"] = {
+                    hw_name: {"tp": rng.choice((1, 2, 4, 8)), "extra_args": synth_extra_args(rng, 1)}
+                    for hw_name in rng.sample(hardware, rng.randint(1, len(hardware)))
+                }
+            models.append(model)
+        families.append({
+            "name": f"Synth{index}-F{family_index}",
+            "llm": {"thinking_capability": "hybrid", "tool_parser": "qwen"},
+            "hardware": {"default": {"extra_args": synth_extra_args(rng, 1)}} if rng.random() < 0.3 else {},
+            "models": models,
+        })
+
+    return {
+        "vendor": rng.choice(vendor_ids),
+        "defaults": {
+            "hardware": {hw_name: {"tp": rng.choice((4, 8))} for hw_name in hardware},
+            "configurations": configurations,
+        },
+        "families": families,
+    }
+
+
+def count_configurations(compiled: dict) -> int:
+    """Count the named configurations in a compiled document."""
+    return sum(
+        len(hardware["configurations"])
+        for family in compiled["families"]
+        for model in family["models"]
+        for hardware in model["hardware"].values()
+    )
+
+
+def catalog_size(vendors: dict) -> int:
+    """Count the configurations the real catalog compiles to."""
+    source_dir = MODELS_DIR / "src"
+    # Resource-fit warnings printed while compiling are not benchmark output
+    with contextlib.redirect_stdout(io.StringIO()), contextlib.redirect_stderr(io.StringIO()):
+        return sum(
+            count_configurations(compile_config(load_yaml(path), vendors))
+            for path in sorted(source_dir.glob("*/*.yaml"))
+        )
+
+
+def write_synthetic_tree(root: Path, target: int, vendors: dict) -> tuple[list[dict], int]:
+    """
+    Write synthetic sources under root/src until they compile to target configurations.
+
+    Returns (sources, configuration count). root also gets a copy of
+    vendors.yaml so the compiler resolves vendors as it does for the real tree.
+    """
+    rng = random.Random(SEED)
+    source_dir = root / "src" / "v0.0.0"
+    source_dir.mkdir(parents=True)
+    shutil.copy(MODELS_DIR / "vendors.yaml", root / "vendors.yaml")
+
+    vendor_ids = sorted(vendors)
+    sources = []
+    configurations = 0
+    while configurations < target:
+        source = synth_source(rng, len(sources), vendor_ids)
+        configurations += count_configurations(compile_config(source, vendors))
+        with open(source_dir / f"synth-{len(sources):05d}.yaml", "w") as f:
+            yaml.safe_dump(source, f, sort_keys=False)
+        sources.append(source)
+    return sources, configurations
+
+
+# =============================================================================
+# Measurements
+# =============================================================================
+
+
+def time_command(args: list[str], repeat: int) -> float:
+    """Best wall time of running the compiler with args, in seconds."""
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        subprocess.run(
+            [sys.executable, str(SCRIPTS_DIR / "compile_models.py"), *args],
+            check=True,
+            stdout=subprocess.DEVNULL,
+        )
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def time_calls(calls: list, repeat: int) -> float:
+    """Best mean time per call over repeat passes of calls, in microseconds."""
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        for call in calls:
+            call()
+        best = min(best, (time.perf_counter() - start) / len(calls))
+    return best * 1e6
+
+
+def bench_functions(sources: list[dict], vendors: dict, repeat: int) -> dict:
+    """Per-call cost of the hot builder functions on inputs from sources."""
+    variant_calls = []
+    merge_calls = []
+    extra_args_calls = []
+    for source in sources:
+        company = vendors[source["vendor"]]["huggingface_org"]
+        defaults = source["defaults"]
+        for family in source["families"]:
+            for model_def in family["models"]:
+                merge_calls.append(
+                    lambda f=family, m=model_def, d=defaults: get_merged_hardware_config(f, m, d)
+                )
+                if "base_name" in model_def:
+                    variant_calls.append(
+                        lambda c=company, f=family, m=model_def, d=defaults: generate_model_variants(c, f, m, d)
+                    )
+                for hw_config in model_def.get("hardware", {}).values():
+                    for template in defaults["configurations"]:
+                        extra_args_calls.append(
+                            lambda h=hw_config.get("extra_args", []), c=template.get("extra_args", []):
+                            merge_extra_args(h, c)
+                        )
+
+    return {
+        name: {"calls": len(calls), "us_per_call": round(time_calls(calls, repeat), 3)}
+        for name, calls in (
+            ("generate_model_variants", variant_calls),
+            ("get_merged_hardware_config", merge_calls),
+            ("merge_extra_args", extra_args_calls),
+        )
+    }
+
+
+def bench_scale(scale: int, base_size: int, vendors: dict, repeat: int) -> dict:
+    """Synthesize a catalog scale times the base size and time the compiler on it."""
+    with tempfile.TemporaryDirectory() as tmp:
+        root = Path(tmp)
+        sources, configurations = write_synthetic_tree(root, scale * base_size, vendors)
+        io_args = ["--input-dir", str(root / "src"), "--output-dir", str(root / "generated")]
+        compile_seconds = time_command([*io_args, "--no-cache"], repeat)
+        check_seconds = time_command([*io_args, "--no-cache", "--check"], repeat)
+        functions = bench_functions(sources, vendors, repeat)
+
+    return {
+        "files": len(sources),
+        "configurations": configurations,
+        "compile_seconds": round(compile_seconds, 3),
+        "check_seconds": round(check_seconds, 3),
+        "functions": functions,
+    }
+
+
+# =============================================================================
+# Reporting
+# =============================================================================
+
+
+def format_results(results: dict, baseline: dict | None) -> str:
+    """Render results as a table, with ratios to the baseline where recorded."""
+    def ratio(value: float, scale: str, *keys: str) -> str:
+        reference = (baseline or {}).get("scales", {}).get(scale)
+        for key in keys:
+            reference = (reference or {}).get(key)
+        if not reference:
+            return ""
+        return f" ({value / reference:.2f}x)"
+
+    lines = [f"Base catalog: {results['base_configurations']} configurations"]
+    for scale, entry in results["scales"].items():
+        lines += [
+            "",
+            f"{scale}x: {entry['files']} files, {entry['configurations']} configurations",
+            f"  compile  {entry['compile_seconds']:>9.3f}s{ratio(entry['compile_seconds'], scale, 'compile_seconds')}",
+            f"  check    {entry['check_seconds']:>9.3f}s{ratio(entry['check_seconds'], scale, 'check_seconds')}",
+        ]
+        for name, function in entry["functions"].items():
+            cost = function["us_per_call"]
+            lines.append(
+                f"  {name:<28}{cost:>10.2f}us/call x {function['calls']}"
+                f"{ratio(cost, scale, 'functions', name, 'us_per_call')}"
+            )
+    return "\n".join(lines)
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Benchmark compile_models.py on synthetic catalogs")
+    parser.add_argument(
+        "--scales",
+        default=",".join(str(scale) for scale in DEFAULT_SCALES),
+        help="Comma-separated multiples of the current catalog size (default: 10,100,1000)",
+    )
+    parser.add_argument("--repeat", type=int, default=1, help="Runs per measurement; the best is kept")
+    parser.add_argument("--record", action="store_true", help=f"Write results to {BASELINE_PATH.name}")
+    parser.add_argument("--json", action="store_true", help="Print results as JSON")
+    args = parser.parse_args()
+
+    vendors = load_vendors(MODELS_DIR)
+    base_size = catalog_size(vendors)
+
+    results = {
+        "python": platform.python_version(),
+        "libyaml": yaml.__with_libyaml__,
+        "base_configurations": base_size,
+        "scales": {},
+    }
+    for scale in (int(value) for value in args.scales.split(",")):
+        print(f"Benchmarking {scale}x...", file=sys.stderr)
+        results["scales"][str(scale)] = bench_scale(scale, base_size, vendors, args.repeat)
+
+    baseline = None
+    if BASELINE_PATH.exists():
+        with open(BASELINE_PATH) as f:
+            baseline = json.load(f)
+
+    if args.json:
+        print(json.dumps(results, indent=2))
+    else:
+        print(format_results(results, baseline))
+
+    if args.record:
+        with open(BASELINE_PATH, "w") as f:
+            json.dump(results, f, indent=2)
+            f.write("\n")
+        print(f"\nRecorded baseline in {BASELINE_PATH}", file=sys.stderr)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
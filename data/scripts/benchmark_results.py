@@ -0,0 +1,243 @@
+"""
+Benchmark Results Ingestion
+
+Reads SGLang bench_serving result files (JSONL, one run per line) and attaches
+the measured numbers to optimal config entries.
+
+Each record is a bench_serving result line, tagged with the deployment it
+was measured on:
+
+    {"hardware": "b200", "quantization": "fp8", "gpu_count": 8,
+     "scenario": "low-latency", "parameters": {"cuda_graph_max_bs": 128},
+     "max_concurrency": 8, "output_throughput": 1234.5,
+     "median_ttft_ms": 210.3, "median_tpot_ms": 9.8, ...}
+
+`parameters` lists the server parameters that were set for the run (usually
+the swept ones). A run backs a config entry when the four UI dimensions match
+and every listed parameter equals the entry's value, so a run that lists no
+parameters backs every entry with its dimensions.
+
+For each entry, runs are grouped by parameter set and ranked by the entry's
+scenario objective (SCENARIO_OBJECTIVES). The entry gets a `benchmark`
+summary with the measured numbers of its own parameters and of the best
+parameter set, and whether its own parameters are the best.
+
+Runs may omit `scenario`, e.g. a concurrency sweep of one deployment. Those
+runs feed only the throughput-vs-latency Pareto frontier that is computed
+per (hardware, quantization, gpu_count) from all runs (build_frontiers).
+"""
+
+import json
+from pathlib import Path
+
+# Dimensions tagging each run, matching the optimal config entries
+RUN_DIMENSIONS = ("hardware", "quantization", "gpu_count", "scenario")
+
+# Dimensions every run must carry; a Pareto frontier is computed per combination
+SWEEP_DIMENSIONS = ("hardware", "quantization", "gpu_count")
+
+# Frontier axes: (throughput metric, maximized; latency metric, minimized)
+FRONTIER_THROUGHPUT = "output_throughput"
+FRONTIER_LATENCY = "median_tpot_ms"
+
+# bench_serving result fields carried into the compiled output
+BENCHMARK_METRICS = (
+    "max_concurrency",
+    "concurrency",
+    "request_throughput",
+    "output_throughput",
+    "median_ttft_ms",
+    "p99_ttft_ms",
+    "median_tpot_ms",
+    "p99_tpot_ms",
+)
+
+# Scenario -> (metric, True when higher is better)
+SCENARIO_OBJECTIVES = {
+    "low-latency": ("median_tpot_ms", False),
+    "high-throughput": ("output_throughput", True),
+}
+
+
+def load_runs(path: Path) -> list[dict]:
+    """
+    Load bench_serving runs from a JSONL file.
+
+    Args:
+        path: JSONL file with one tagged bench_serving result per line
+
+    Returns:
+        List of run records, in file order
+
+    Raises:
+        ValueError: If a line is not valid JSON or lacks a tag dimension
+    """
+    runs = []
+    with open(path) as f:
+        for line_number, line in enumerate(f, 1):
+            if not line.strip():
+                continue
+            try:
+                run = json.loads(line)
+            except json.JSONDecodeError as e:
+                raise ValueError(f"{path}:{line_number}: invalid JSON: {e}") from e
+            missing = [key for key in SWEEP_DIMENSIONS if key not in run]
+            if missing:
+                raise ValueError(f"{path}:{line_number}: missing {', '.join(missing)}")
+            runs.append(run)
+    return runs
+
+
+def run_metrics(run: dict) -> dict:
+    """Extract the BENCHMARK_METRICS present in a run, in BENCHMARK_METRICS order."""
+    return {key: run[key] for key in BENCHMARK_METRICS if run.get(key) is not None}
+
+
+def best_run(runs: list[dict], scenario: str) -> dict | None:
+    """Pick the run that best meets the scenario objective, or None if none can be ranked."""
+    objective = SCENARIO_OBJECTIVES.get(scenario)
+    if objective is None:
+        return None
+    metric, higher_is_better = objective
+    ranked = [run for run in runs if run.get(metric) is not None]
+    if not ranked:
+        return None
+    # min/max keep the first of equal runs, so ties go to file order
+    pick = max if higher_is_better else min
+    return pick(ranked, key=lambda run: run[metric])
+
+
+def summarize_benchmarks(config: dict, runs: list[dict]) -> dict | None:
+    """
+    Summarize the runs that apply to one optimal config entry.
+
+    Args:
+        config: Optimal config entry (hardware, quantization, gpu_count, scenario, parameters)
+        runs: All runs loaded for the config file
+
+    Returns:
+        Benchmark summary dict, or None when no run matches the entry's dimensions:
+        - objective: ranking metric of the scenario (absent if the scenario has none)
+        - runs: number of matching runs
+        - measured: metrics of the best run with the entry's own parameters, or None
+        - best: parameters and metrics of the best run overall
+        - is_best: whether the entry's parameters produced the best run
+    """
+    candidates = [
+        run for run in runs
+        if all(run.get(key) == config[key] for key in RUN_DIMENSIONS)
+    ]
+    if not candidates:
+        return None
+
+    parameters = config["parameters"]
+    own = [
+        run for run in candidates
+        if all(parameters.get(key) == value for key, value in (run.get("parameters") or {}).items())
+    ]
+
+    scenario = config["scenario"]
+    summary = {}
+    if scenario in SCENARIO_OBJECTIVES:
+        summary["objective"] = SCENARIO_OBJECTIVES[scenario][0]
+    summary["runs"] = len(candidates)
+
+    own_best = best_run(own, scenario) or (own[0] if own else None)
+    summary["measured"] = run_metrics(own_best) if own_best else None
+
+    overall_best = best_run(candidates, scenario)
+    if overall_best is not None:
+        summary["best"] = {
+            "parameters": overall_best.get("parameters") or {},
+            "metrics": run_metrics(overall_best),
+        }
+        summary["is_best"] = overall_best is own_best
+    return summary
+
+
+def attach_benchmarks(compiled: dict, runs: list[dict]) -> list[str]:
+    """
+    Attach benchmark summaries to each entry of compiled["configs"] in place.
+
+    Returns warnings for entries whose own parameters are unmeasured or
+    outperformed by another measured parameter set.
+    """
+    warnings = []
+    for i, config in enumerate(compiled["configs"]):
+        summary = summarize_benchmarks(config, runs)
+        if summary is None:
+            continue
+        config["benchmark"] = summary
+        label = "/".join(str(config[key]) for key in RUN_DIMENSIONS)
+        if summary["measured"] is None:
+            warnings.append(f"configs[{i}] ({label}): parameters have no matching benchmark run")
+        elif summary.get("is_best") is False:
+            best = summary["best"]
+            warnings.append(
+                f"configs[{i}] ({label}): {best['parameters']} measured better "
+                f"{summary['objective']} ({best['metrics'][summary['objective']]} vs "
+                f"{summary['measured'].get(summary['objective'])})"
+            )
+    return warnings
+
+
+def pareto_frontier(runs: list[dict]) -> list[dict]:
+    """
+    Select the runs on the throughput-vs-latency Pareto frontier.
+
+    A run is on the frontier when no other run has both lower or equal
+    FRONTIER_LATENCY and higher FRONTIER_THROUGHPUT. Runs are sorted by latency
+    (ties by descending throughput) and kept while their throughput exceeds
+    every lower-latency run, which takes O(n log n) for the whole sweep.
+
+    Returns:
+        Frontier runs, ordered from lowest latency to highest throughput
+    """
+    measured = [
+        run for run in runs
+        if run.get(FRONTIER_THROUGHPUT) is not None and run.get(FRONTIER_LATENCY) is not None
+    ]
+    measured.sort(key=lambda run: (run[FRONTIER_LATENCY], -run[FRONTIER_THROUGHPUT]))
+
+    frontier = []
+    best_throughput = float("-inf")
+    for run in measured:
+        if run[FRONTIER_THROUGHPUT] > best_throughput:
+            frontier.append(run)
+            best_throughput = run[FRONTIER_THROUGHPUT]
+    return frontier
+
+
+def build_frontiers(runs: list[dict]) -> list[dict]:
+    """
+    Compute the Pareto frontier of each (hardware, quantization, gpu_count) sweep.
+
+    Each frontier lists its points (parameters, scenario tag if any, and
+    metrics) from lowest latency to highest throughput. `scenarios` maps each
+    scenario to the frontier point that best serves it: the lowest-latency
+    point for low-latency and the highest-throughput point for high-throughput.
+    Groups appear in order of their first run.
+    """
+    groups: dict[tuple, list[dict]] = {}
+    for run in runs:
+        groups.setdefault(tuple(run[key] for key in SWEEP_DIMENSIONS), []).append(run)
+
+    frontiers = []
+    for key, group in groups.items():
+        frontier = pareto_frontier(group)
+        if not frontier:
+            continue
+        points = []
+        for run in frontier:
+            point = {"parameters": run.get("parameters") or {}}
+            if run.get("scenario") is not None:
+                point["scenario"] = run["scenario"]
+            point["metrics"] = run_metrics(run)
+            points.append(point)
+        frontiers.append({
+            **dict(zip(SWEEP_DIMENSIONS, key)),
+            "axes": {"throughput": FRONTIER_THROUGHPUT, "latency": FRONTIER_LATENCY},
+            "points": points,
+            "scenarios": {"low-latency": 0, "high-throughput": len(points) - 1},
+        })
+    return frontiers
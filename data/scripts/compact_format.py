@@ -0,0 +1,260 @@
+"""
+Compact Binary Format for Generated Configs
+
+Encodes compiled model configuration documents in a private format built on
+CBOR (RFC 8949), using only the standard library, as a smaller and
+faster-to-load alternative to generated YAML.
+
+The data is well-formed CBOR, but its string references and records use two
+private tags (STRING_REF_TAG, RECORD_TAG). They come from the
+first-come-first-served range of the IANA CBOR tag registry and are not
+registered. A generic decoder sees unknown tags, so only load_compact
+restores the document.
+
+Two kinds of repetition are factored out:
+- Strings: every string value is stored once in a string table and referenced
+  with STRING_REF_TAG followed by its table index.
+- Dict shapes: every dict is stored as a RECORD_TAG record, [shape index, *values].
+  The shape table holds each distinct ordered key list once. Keys whose value
+  is None are marked in the shape (as -(index + 1)), so nulls such as
+  `prefill: null` take no space in the record.
+
+The container is a CBOR map:
+    {"format": FORMAT_NAME, "version": FORMAT_VERSION,
+     "strings": [...], "shapes": [[key refs], ...], "data": <record>}
+
+load_compact restores the exact document, including key order and None values;
+it compares equal to the same document loaded from generated YAML.
+"""
+
+import struct
+from typing import Any
+
+FORMAT_NAME = "sglang-model-config"
+FORMAT_VERSION = 2
+
+# Private tags (unregistered, first-come-first-served range). Version 1 used
+# the registered tags 25 (stringref) and 27 (serialised object) with other
+# meanings.
+STRING_REF_TAG = 50592
+RECORD_TAG = 50593
+
+
+# =============================================================================
+# CBOR Primitives
+# =============================================================================
+
+
+def _encode_head(out: bytearray, major: int, value: int) -> None:
+    """Append a CBOR initial byte and argument for the given major type."""
+    if value < 24:
+        out.append((major << 5) | value)
+    elif value < 0x100:
+        out += bytes(((major << 5) | 24, value))
+    elif value < 0x10000:
+        out.append((major << 5) | 25)
+        out += struct.pack(">H", value)
+    elif value < 0x100000000:
+        out.append((major << 5) | 26)
+        out += struct.pack(">I", value)
+    else:
+        out.append((major << 5) | 27)
+        out += struct.pack(">Q", value)
+
+
+def _encode_plain(out: bytearray, value: Any) -> None:
+    """Encode a plain JSON-like value (no interning), used for the container."""
+    if value is None:
+        out.append(0xF6)
+    elif value is True:
+        out.append(0xF5)
+    elif value is False:
+        out.append(0xF4)
+    elif isinstance(value, int):
+        if value >= 0:
+            _encode_head(out, 0, value)
+        else:
+            _encode_head(out, 1, -1 - value)
+    elif isinstance(value, float):
+        out.append(0xFB)
+        out += struct.pack(">d", value)
+    elif isinstance(value, str):
+        data = value.encode("utf-8")
+        _encode_head(out, 3, len(data))
+        out += data
+    elif isinstance(value, (bytes, bytearray)):
+        _encode_head(out, 2, len(value))
+        out += value
+    elif isinstance(value, (list, tuple)):
+        _encode_head(out, 4, len(value))
+        for item in value:
+            _encode_plain(out, item)
+    elif isinstance(value, dict):
+        _encode_head(out, 5, len(value))
+        for key, item in value.items():
+            _encode_plain(out, key)
+            _encode_plain(out, item)
+    else:
+        raise TypeError(f"Cannot encode {type(value).__name__} as CBOR")
+
+
+class _Decoder:
+    """Minimal CBOR decoder for the subset produced by this module."""
+
+    def __init__(self, data: bytes) -> None:
+        self.data = data
+        self.pos = 0
+
+    def _argument(self, info: int) -> int:
+        if info < 24:
+            return info
+        size = {24: 1, 25: 2, 26: 4, 27: 8}.get(info)
+        if size is None:
+            raise ValueError(f"Unsupported CBOR additional info {info} at byte {self.pos}")
+        value = int.from_bytes(self.data[self.pos:self.pos + size], "big")
+        self.pos += size
+        return value
+
+    def decode(self) -> Any:
+        initial = self.data[self.pos]
+        self.pos += 1
+        major, info = initial >> 5, initial & 0x1F
+
+        if major == 7:
+            if info == 20:
+                return False
+            if info == 21:
+                return True
+            if info == 22:
+                return None
+            if info == 27:
+                value = struct.unpack(">d", self.data[self.pos:self.pos + 8])[0]
+                self.pos += 8
+                return value
+            raise ValueError(f"Unsupported CBOR simple value {info} at byte {self.pos - 1}")
+
+        value = self._argument(info)
+        if major == 0:
+            return value
+        if major == 1:
+            return -1 - value
+        if major in (2, 3):
+            data = self.data[self.pos:self.pos + value]
+            self.pos += value
+            return bytes(data) if major == 2 else data.decode("utf-8")
+        if major == 4:
+            return [self.decode() for _ in range(value)]
+        if major == 5:
+            result = {}
+            for _ in range(value):
+                key = self.decode()
+                result[key] = self.decode()
+            return result
+        # major == 6: tags are returned as (tag, content) and resolved by the caller
+        return _Tagged(value, self.decode())
+
+
+class _Tagged:
+    __slots__ = ("tag", "content")
+
+    def __init__(self, tag: int, content: Any) -> None:
+        self.tag = tag
+        self.content = content
+
+
+# =============================================================================
+# Interned Document Encoding
+# =============================================================================
+
+
+def dump_compact(data: dict) -> bytes:
+    """Encode a compiled document in the compact CBOR format."""
+    strings: dict[str, int] = {}
+    shapes: dict[tuple[int, ...], int] = {}
+
+    def intern(value: str) -> int:
+        index = strings.get(value)
+        if index is None:
+            index = strings[value] = len(strings)
+        return index
+
+    def encode(out: bytearray, value: Any) -> None:
+        if isinstance(value, str):
+            _encode_head(out, 6, STRING_REF_TAG)
+            _encode_head(out, 0, intern(value))
+        elif isinstance(value, dict):
+            shape = []
+            present = []
+            for key, item in value.items():
+                if not isinstance(key, str):
+                    raise TypeError(f"Only string keys are supported, got {key!r}")
+                if item is None:
+                    shape.append(-1 - intern(key))
+                else:
+                    shape.append(intern(key))
+                    present.append(item)
+            shape_key = tuple(shape)
+            shape_index = shapes.get(shape_key)
+            if shape_index is None:
+                shape_index = shapes[shape_key] = len(shapes)
+            _encode_head(out, 6, RECORD_TAG)
+            _encode_head(out, 4, len(present) + 1)
+            _encode_head(out, 0, shape_index)
+            for item in present:
+                encode(out, item)
+        elif isinstance(value, (list, tuple)):
+            _encode_head(out, 4, len(value))
+            for item in value:
+                encode(out, item)
+        else:
+            _encode_plain(out, value)
+
+    body = bytearray()
+    encode(body, data)
+
+    out = bytearray()
+    _encode_head(out, 5, 5)
+    _encode_plain(out, "format")
+    _encode_plain(out, FORMAT_NAME)
+    _encode_plain(out, "version")
+    _encode_plain(out, FORMAT_VERSION)
+    _encode_plain(out, "strings")
+    _encode_plain(out, list(strings))
+    _encode_plain(out, "shapes")
+    _encode_plain(out, [list(shape) for shape in shapes])
+    _encode_plain(out, "data")
+    out += body
+    return bytes(out)
+
+
+def load_compact(raw: bytes) -> dict:
+    """Decode a document written by dump_compact, restoring None values and key order."""
+    container = _Decoder(raw).decode()
+    if not isinstance(container, dict) or container.get("format") != FORMAT_NAME:
+        raise ValueError("Not a compact model config document")
+    if container.get("version") != FORMAT_VERSION:
+        raise ValueError(f"Unsupported compact format version {container.get('version')!r}")
+
+    strings = container["strings"]
+    shapes = [
+        [(strings[-1 - ref], True) if ref < 0 else (strings[ref], False) for ref in shape]
+        for shape in container["shapes"]
+    ]
+
+    def restore(value: Any) -> Any:
+        if isinstance(value, _Tagged):
+            if value.tag == STRING_REF_TAG:
+                return strings[value.content]
+            if value.tag == RECORD_TAG:
+                shape_index, *items = value.content
+                result = {}
+                values = iter(items)
+                for key, is_null in shapes[shape_index]:
+                    result[key] = None if is_null else restore(next(values))
+                return result
+            raise ValueError(f"Unexpected CBOR tag {value.tag}")
+        if isinstance(value, list):
+            return [restore(item) for item in value]
+        return value
+
+    return restore(container["data"])
@@ -5,23 +5,104 @@ Model Configuration Compiler
 Compiles simplified model configuration YAML files into the full schema format.
 
 Usage:
-    python compile_models.py [--input-dir DIR] [--output-dir DIR] [--check]
+    python compile_models.py [--input-dir DIR] [--output-dir DIR] [--check] [--no-cache] [--jobs N]
+                             [--format {yaml,cbor}] [--normalize]
+    python compile_models.py --watch [--input-dir DIR] [--output-dir DIR]
+    python compile_models.py --catalog [--catalog-dir DIR]
+    python compile_models.py --profile [--profile-output PATH] [--no-cache] [--check]
 
 The compiler reads simplified YAML files from the input directory and generates
 full schema-compliant YAML files in the output directory.
 
+Every compiled document is validated in-process against the schema of
+data/schema/types.ts (config_schema.py) before it is written or checked;
+schema errors name the family, model, hardware and configuration at fault.
+
+Compilation is incremental: a manifest in the output directory records content
+hashes of each source file, of the vendors.yaml entries it references, of the
+compiler itself and of the generated output. Files whose hashes all match are
+skipped without being parsed, so a vendors.yaml edit only recompiles the files
+that reference a changed vendor. --affected-by PATH lists the outputs that a
+change to PATH (a source file, vendors.yaml or the compiler) would touch.
+
+With --jobs N, the remaining files are compiled in a pool of N worker processes.
+Each worker's output is captured and printed in input order, so the log is the
+same as a serial run.
+
+With --format cbor, outputs are written in a compact binary form (see
+compact_format.py) with interned strings and omitted nulls instead of YAML.
+
+With --normalize, each distinct engine block is stored once in a per-file
+`engines` table and configurations reference it by ID; inflate_config restores
+the full schema shape.
+
+With --watch, the compiler stays running, keeps the vendors table and parsed
+sources in memory, and recompiles only the outputs affected by each change.
+
+With --catalog, the generated files of each SGLang version are also consolidated
+into one JSON catalog per version (catalog-dir/<version>.json) carrying indexes
+by model name, model_path, hardware, quantization and optimization, and the
+pre-rendered launch command (shell, env file and argv) of every configuration.
+
+A version directory may declare a base version in _version.yaml; its files are
+then overlays merged onto the same-named files of the base, and families an
+overlay leaves unchanged are reused from the base's current output.
+
+The compiler can also be used as a library: iter_compiled_models yields one
+compiled model at a time, and write_yaml_stream/write_json_stream write those
+models out as they are produced.
+
 Supports two patterns:
 1. Variant Generation: Define base_name + capabilities + quantizations
 2. Explicit Models: Define name directly (no variant expansion)
 """
 
 import argparse
+import contextlib
+import copy
+import hashlib
+import io
+import json
+import os
+import shlex
 import sys
+import textwrap
+import time
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
-from typing import Any
+from typing import Any, Iterable, Iterator, TextIO
 
 import yaml
 
+from compact_format import dump_compact, load_compact
+from config_schema import validate_model_config
+from profiling import (
+    active_profile,
+    format_profile,
+    merge_file,
+    phase,
+    profile_file,
+    profile_report,
+    record_counts,
+    start_profile,
+    write_profile,
+)
+
+# Use libyaml's C loader/dumper when available; both produce the same documents
+# and byte-identical output as the pure-Python implementations they replace.
+try:
+    from yaml import CSafeDumper as YamlDumper, CSafeLoader as YamlLoader
+except ImportError:
+    from yaml import SafeDumper as YamlDumper, SafeLoader as YamlLoader
+
+# Formatting of generated YAML; tests/test_yaml_parity.py dumps with both the
+# libyaml and pure-Python dumpers using these options
+YAML_DUMP_OPTIONS = {
+    "default_flow_style": False,
+    "allow_unicode": True,
+    "sort_keys": False,
+    "width": 120,
+}
 
 # =============================================================================
 # Variant Generation Constants
@@ -40,19 +121,190 @@ DEFAULT_QUANT_SUFFIXES = {
     "int4": "-INT4",
 }
 
+# =============================================================================
+# Resource Estimation Constants
+# =============================================================================
+
+# Per-GPU memory (GB) and GPUs per node of each supported hardware
+HARDWARE_SPECS = {
+    "A100": {"memory_gb": 80, "gpus_per_node": 8},
+    "H100": {"memory_gb": 80, "gpus_per_node": 8},
+    "H200": {"memory_gb": 141, "gpus_per_node": 8},
+    "B200": {"memory_gb": 180, "gpus_per_node": 8},
+    "B300": {"memory_gb": 288, "gpus_per_node": 8},
+    "GB200": {"memory_gb": 186, "gpus_per_node": 4},
+    "GB300": {"memory_gb": 288, "gpus_per_node": 4},
+    "MI300X": {"memory_gb": 192, "gpus_per_node": 8},
+    "MI325X": {"memory_gb": 256, "gpus_per_node": 8},
+    "MI350X": {"memory_gb": 288, "gpus_per_node": 8},
+    "MI355X": {"memory_gb": 288, "gpus_per_node": 8},
+}
+
+# Bytes per weight for each quantization
+QUANT_WEIGHT_BYTES = {
+    "bf16": 2,
+    "fp8": 1,
+    "int4": 0.5,
+    "fp4": 0.5,
+    "mxfp4": 0.5,
+    "nvfp4": 0.5,
+}
+
+# SGLang defaults assumed when a configuration does not set them
+DEFAULT_MEM_FRACTION_STATIC = 0.85
+DEFAULT_KV_CACHE_BYTES = 2
+
+# Incremental compilation manifest, stored in the output directory
+MANIFEST_NAME = ".compile-manifest.json"
+MANIFEST_VERSION = 3
+
+# Version overlays: a version directory's _version.yaml names its base version.
+# Files starting with '_' are not compiled.
+VERSION_FILE = "_version.yaml"
+
+# Lists merged entry by entry in overlays, keyed by the first identity key present
+OVERLAY_LIST_KEYS = {
+    "families": ("name",),
+    "models": ("name", "base_name"),
+    "configurations": ("name",),
+}
+
+# Output formats and their file suffixes
+OUTPUT_FORMATS = {
+    "yaml": ".yaml",
+    "cbor": ".cbor",
+}
+
+# Normalized layout: per-file table of distinct engine blocks
+ENGINES_TABLE_KEY = "engines"
+ENGINE_BLOCK_KEYS = ("engine", "prefill", "decode")
+
+# Modules whose source affects compiled output or its validation (hashed into the manifest)
+# (benchmark_results.py supplies the metric names config_schema.py validates)
+COMPILER_MODULES = ("compile_models.py", "compact_format.py", "config_schema.py", "benchmark_results.py")
+
+# Schema errors printed per file; the rest are counted
+MAX_REPORTED_ERRORS = 20
+
+# Consolidated per-version catalogs
+CATALOG_FORMAT_VERSION = 2
+UNVERSIONED_CATALOG = "unversioned"
+
+# SGLang server flags that take no value (argparse store_true)
+BOOLEAN_FLAGS = frozenset({
+    "--disable-cuda-graph",
+    "--disable-custom-all-reduce",
+    "--disable-overlap-schedule",
+    "--disable-radix-cache",
+    "--disable-shared-experts-fusion",
+    "--enable-cfg-parallel",
+    "--enable-dp-attention",
+    "--enable-dp-lm-head",
+    "--enable-eplb",
+    "--enable-metrics",
+    "--enable-mixed-chunk",
+    "--enable-multimodal",
+    "--enable-symm-mem",
+    "--enable-torch-compile",
+    "--enable-two-batch-overlap",
+    "--mm-enable-dp-encoder",
+    "--skip-server-warmup",
+    "--trust-remote-code",
+})
+
+# SGLang server flags that take several values (argparse nargs="+" / "*")
+MULTI_VALUE_FLAGS = frozenset({
+    "--cuda-graph-bs",
+    "--lora-paths",
+    "--lora-target-modules",
+})
+
 
 # =============================================================================
 # Engine Configuration Builders
 # =============================================================================
 
 
+class ExtraArgs:
+    """
+    SGLang server flags from an extra_args list, keyed by flag in order.
+
+    Each flag maps to its list of values: none for a boolean flag
+    (`--enable-dp-lm-head`), one for `--flag value` or `--flag=value`, and
+    several for a multi-value flag (`--cuda-graph-bs 1 2 4`). Flags are tokens
+    starting with '--'; every other token, including negative numbers, is a
+    value of the preceding flag. A flag given twice keeps its first position
+    and the values of its last occurrence, which is what the server parses.
+    to_argv() writes the flags back in the canonical `--flag value...` form.
+
+    Arity is declared for known flags: BOOLEAN_FLAGS take no value and
+    MULTI_VALUE_FLAGS take one or more. Any other flag takes at most one
+    value, so a bare token after a boolean flag or a second value after a
+    single-value flag is rejected instead of being read as a value.
+    """
+
+    __slots__ = ("flags",)
+
+    def __init__(self, args: list | None = None) -> None:
+        self.flags: dict[str, list] = {}
+        flag = values = None
+        for arg in args or ():
+            if isinstance(arg, str) and arg.startswith("--"):
+                if "=" in arg:
+                    flag, value = arg.split("=", 1)
+                    if flag in BOOLEAN_FLAGS:
+                        raise ValueError(f"extra_args boolean flag {flag} takes no value: {args}")
+                    values = self.flags[flag] = [value]
+                else:
+                    flag = arg
+                    values = self.flags[flag] = []
+            elif values is None:
+                raise ValueError(f"extra_args value {arg!r} does not follow a flag: {args}")
+            elif flag in BOOLEAN_FLAGS:
+                raise ValueError(f"extra_args value {arg!r} follows boolean flag {flag}: {args}")
+            elif values and flag not in MULTI_VALUE_FLAGS:
+                raise ValueError(f"extra_args flag {flag} takes one value, got another {arg!r}: {args}")
+            else:
+                values.append(arg)
+
+    def __contains__(self, flag: str) -> bool:
+        return flag in self.flags
+
+    def get(self, flag: str) -> list | None:
+        """Return the values of flag ([] for a boolean flag), or None if unset."""
+        return self.flags.get(flag)
+
+    def set(self, flag: str, *values: Any) -> None:
+        """Set flag to values (none for a boolean flag), replacing any earlier values."""
+        self.flags[flag] = list(values)
+
+    def setdefault(self, flag: str, *values: Any) -> None:
+        """Set flag to values unless it is already set."""
+        if flag not in self.flags:
+            self.flags[flag] = list(values)
+
+    def add_defaults(self, other: "ExtraArgs") -> None:
+        """Append the flags of other that are not set here, keeping these values."""
+        flags = self.flags
+        for flag, values in other.flags.items():
+            if flag not in flags:
+                flags[flag] = list(values)
+
+    def to_argv(self) -> list:
+        """Serialize the flags back to an extra_args list."""
+        argv = []
+        for flag, values in self.flags.items():
+            argv.append(flag)
+            argv.extend(values)
+        return argv
+
+
 def merge_extra_args(hw_args: list, config_args: list) -> list:
     """
     Merge extra_args from hardware config and config template.
 
-    Hardware args come first, then config args are appended. Arguments starting
-    with '--' are treated as keys. If a key exists in hw_args, the corresponding
-    key-value pair from config_args is skipped to avoid duplicates.
+    Hardware flags come first, then the config flags that the hardware args do
+    not set. A flag set by both keeps the hardware values.
 
     Args:
         hw_args: Hardware-specific extra arguments (higher priority)
@@ -61,40 +313,10 @@ def merge_extra_args(hw_args: list, config_args: list) -> list:
     Returns:
         Merged list of extra arguments with hw_args taking precedence
     """
-    if not config_args:
-        return list(hw_args)
-    if not hw_args:
-        return list(config_args)
-
-    # Extract keys (args starting with --) from hw_args
-    hw_keys = {arg for arg in hw_args if isinstance(arg, str) and arg.startswith("--")}
-
-    # Start with all hw_args
-    result = list(hw_args)
-
-    # Add config_args, skipping key-value pairs where key is already in hw_args
-    i = 0
-    while i < len(config_args):
-        arg = config_args[i]
-        if isinstance(arg, str) and arg.startswith("--"):
-            if arg not in hw_keys:
-                # Add the key
-                result.append(arg)
-                # Add the value if present (next arg that doesn't start with --)
-                if i + 1 < len(config_args):
-                    next_arg = config_args[i + 1]
-                    if not (isinstance(next_arg, str) and next_arg.startswith("--")):
-                        result.append(next_arg)
-                        i += 1
-            else:
-                # Skip this key and its value
-                if i + 1 < len(config_args):
-                    next_arg = config_args[i + 1]
-                    if not (isinstance(next_arg, str) and next_arg.startswith("--")):
-                        i += 1  # Skip the value too
-        i += 1
-
-    return result
+    merged = ExtraArgs(hw_args)
+    if config_args:
+        merged.add_defaults(ExtraArgs(config_args))
+    return merged.to_argv()
 
 
 def build_engine_config(
@@ -102,6 +324,7 @@ def build_engine_config(
     config_template: dict,
     quant: str | None = None,
     quant_overrides: dict | None = None,
+    draft_model_path: str | None = None,
 ) -> dict:
     """
     Build a full engine configuration block.
@@ -111,6 +334,8 @@ def build_engine_config(
         config_template: Named configuration template (default, tp2, speculative-mtp, etc.)
         quant: Quantization type (bf16, fp8, etc.)
         quant_overrides: Per-quantization overrides (e.g., fp8: { ep: 2 })
+        draft_model_path: Speculative draft model, added as --speculative-draft-model-path
+            unless extra_args already set one
 
     Returns:
         Engine configuration dict with tp, dp, ep, extra_args, etc.
@@ -119,10 +344,10 @@ def build_engine_config(
     # This allows named configs like "tp2", "tp4", "tp8" to set specific tp values
     tp = config_template.get("tp", hw_config.get("tp", 8))
 
-    # Merge extra_args: hardware args take precedence for duplicate keys
-    hw_extra_args = hw_config.get("extra_args", [])
-    config_extra_args = config_template.get("extra_args", [])
-    merged_extra_args = merge_extra_args(hw_extra_args, config_extra_args)
+    # Merge extra_args: hardware flags take precedence over the template's
+    extra_args = ExtraArgs(hw_config.get("extra_args"))
+    if config_template.get("extra_args"):
+        extra_args.add_defaults(ExtraArgs(config_template["extra_args"]))
 
     # Build base engine config from config template, overridden by hardware config
     engine = {
@@ -133,13 +358,20 @@ def build_engine_config(
         "enable_dp_attention": hw_config.get(
             "enable_dp_attention", config_template.get("enable_dp_attention")
         ),
-        "extra_args": merged_extra_args,
     }
 
-    # Apply quantization-specific overrides (e.g., fp8: { ep: 2 })
+    # Apply quantization-specific overrides (e.g., fp8: { ep: 2 }); an
+    # extra_args override replaces the merged flags
     if quant and quant_overrides:
         for key, value in quant_overrides.items():
-            engine[key] = value
+            if key == "extra_args":
+                extra_args = ExtraArgs(value)
+            else:
+                engine[key] = value
+
+    if draft_model_path:
+        extra_args.setdefault("--speculative-draft-model-path", draft_model_path)
+    engine["extra_args"] = extra_args.to_argv()
 
     return engine
 
@@ -166,17 +398,12 @@ def build_named_configuration(
     Returns:
         Full configuration block with attributes, engine config, etc.
     """
-    engine_config = build_engine_config(
-        hw_config, config_template, quant, quant_overrides
-    )
-
     # Add speculative draft model to extra_args for speculative configurations
     config_name = config_template.get("name", "")
-    if speculative_draft_model and "speculative" in config_name.lower():
-        engine_config["extra_args"].extend([
-            "--speculative-draft-model-path",
-            speculative_draft_model,
-        ])
+    draft_model_path = speculative_draft_model if "speculative" in config_name.lower() else None
+    engine_config = build_engine_config(
+        hw_config, config_template, quant, quant_overrides, draft_model_path
+    )
 
     return {
         "name": config_template["name"],
@@ -218,6 +445,13 @@ def build_hardware_config(
     # like GB300 where dp/throughput recommendations differ from the file-level defaults.
     config_templates = hw_config.get("configurations", defaults.get("configurations", []))
 
+    # Append the configurations generated by a parallelism sweep, if declared
+    sweep = hw_config.get("parallelism_sweep", defaults.get("parallelism_sweep"))
+    if sweep:
+        config_templates = config_templates + expand_parallelism_sweep(
+            sweep, hw_name, hw_config, quant, {template["name"] for template in config_templates}
+        )
+
     configurations = []
     for config_template in config_templates:
         configurations.append(
@@ -228,6 +462,107 @@ def build_hardware_config(
     return {"configurations": configurations}
 
 
+def expand_parallelism_sweep(
+    sweep: dict,
+    hw_name: str,
+    hw_config: dict,
+    quant: str,
+    existing_names: set[str],
+) -> list[dict]:
+    """
+    Expand a parallelism_sweep spec into named configuration templates.
+
+    The sweep lists candidate tp, dp and ep sizes (each defaults to [1]) plus
+    optional nodes, optimization, quantization and extra_args shared by every
+    generated configuration. Each combination becomes a template named like
+    "sweep-tp8-dp8-ep8" (dp and ep omitted when 1). dp > 1 uses DP attention.
+
+    Combinations are pruned when:
+    - dp or ep does not divide tp
+    - a single-node configuration needs more GPUs than the hardware has per node
+    - the hardware entry pins dp or ep to a different value
+    - the quantization is excluded by the hardware's valid_quants
+    - a configuration with the same name already exists
+
+    Args:
+        sweep: parallelism_sweep spec from the defaults or hardware entry
+        hw_name: Hardware name, looked up in HARDWARE_SPECS for GPUs per node
+        hw_config: Merged hardware configuration
+        quant: Quantization of the model variant being built
+        existing_names: Names of the hand-written configurations
+
+    Returns:
+        Configuration templates in tp, dp, ep order
+    """
+    quantization = sweep.get("quantization", quant)
+    valid_quants = hw_config.get("valid_quants")
+    if valid_quants and quantization not in valid_quants:
+        return []
+
+    nodes = sweep.get("nodes", "single")
+    gpus_per_node = HARDWARE_SPECS.get(hw_name, {}).get("gpus_per_node")
+
+    templates = []
+    for tp in sweep.get("tp", [1]):
+        for dp in sweep.get("dp", [1]):
+            for ep in sweep.get("ep", [1]):
+                if tp % dp or tp % ep:
+                    continue
+                # DP attention keeps the dp ranks inside the tp GPUs
+                if nodes == "single" and gpus_per_node and tp > gpus_per_node:
+                    continue
+                if hw_config.get("dp", dp if dp > 1 else None) != (dp if dp > 1 else None):
+                    continue
+                if hw_config.get("ep", ep if ep > 1 else None) != (ep if ep > 1 else None):
+                    continue
+
+                name = f"sweep-tp{tp}"
+                template = {
+                    "name": name,
+                    "nodes": nodes,
+                    "optimization": sweep.get("optimization", "balanced"),
+                    "quantization": quantization,
+                    "tp": tp,
+                }
+                if dp > 1:
+                    template["name"] = name = f"{name}-dp{dp}"
+                    template["dp"] = dp
+                    template["enable_dp_attention"] = True
+                if ep > 1:
+                    template["name"] = name = f"{name}-ep{ep}"
+                    template["ep"] = ep
+                if name in existing_names:
+                    continue
+                if sweep.get("extra_args"):
+                    template["extra_args"] = sweep["extra_args"]
+                existing_names.add(name)
+                templates.append(template)
+    return templates
+
+
+def copy_hardware_config(hardware_config: dict) -> dict:
+    """
+    Copy a hardware block built by build_hardware_config for reuse.
+
+    Containers created by the builders (configurations, attributes, engine,
+    extra_args and the empty env_vars default) are copied so that no two models
+    share them; values taken from the source files, such as non-empty env_vars,
+    stay shared exactly as when the block is built from scratch.
+    """
+    configurations = []
+    for configuration in hardware_config["configurations"]:
+        engine = dict(configuration["engine"])
+        engine["extra_args"] = list(engine["extra_args"])
+        if not engine["env_vars"]:
+            engine["env_vars"] = {}
+        configurations.append({
+            **configuration,
+            "attributes": dict(configuration["attributes"]),
+            "engine": engine,
+        })
+    return {"configurations": configurations}
+
+
 # =============================================================================
 # Model Builders
 # =============================================================================
@@ -332,6 +667,31 @@ def get_merged_hardware_config(
     return merged_hw_configs, hardware_list
 
 
+def resolve_hardware_configs(
+    family: dict,
+    model_def: dict,
+    defaults: dict,
+) -> tuple[dict[str, dict], list[str]]:
+    """
+    Resolve the effective configuration of each target hardware for a model.
+
+    Applies the merged 'default' entry under each hardware-specific entry from
+    get_merged_hardware_config, once per model definition rather than once per
+    generated variant.
+
+    Returns (hw_configs, hardware_list) where hw_configs maps each hardware name
+    in hardware_list to its fully merged configuration.
+    """
+    with phase("merge"):
+        merged_hw_configs, hardware_list = get_merged_hardware_config(family, model_def, defaults)
+        default_hw_config = merged_hw_configs.get("default", {})
+        hw_configs = {
+            hw_name: {**default_hw_config, **merged_hw_configs.get(hw_name, {})}
+            for hw_name in hardware_list
+        }
+    return hw_configs, hardware_list
+
+
 def get_diffusion_attr(obj: dict, key: str, default: Any = None) -> Any:
     """Get a diffusion attribute from either obj.diffusion.key or obj.key."""
     diffusion = obj.get("diffusion", {})
@@ -475,9 +835,12 @@ def generate_model_variants(
     # Get speculative draft model if present
     speculative_draft_model = model_def.get("speculative_draft_model")
 
-    # Get merged hardware config from family and model levels
-    hw_configs, hardware_list = get_merged_hardware_config(family, model_def, defaults)
-    default_hw_config = hw_configs.get("default", {})
+    # Resolve each hardware's merged config once for all variants
+    hw_configs, hardware_list = resolve_hardware_configs(family, model_def, defaults)
+
+    # Hardware blocks depend only on (hardware, quantization), not on capability,
+    # so each is built once and copied for the other capability variants
+    hardware_cache: dict[tuple[str, str], dict] = {}
 
     models = []
 
@@ -509,18 +872,23 @@ def generate_model_variants(
             # Build hardware configurations
             hardware = {}
             for hw_name in hardware_list:
-                # Start with default config, then merge hardware-specific overrides
-                hw_config = {**default_hw_config, **hw_configs.get(hw_name, {})}
+                hw_config = hw_configs[hw_name]
 
                 # Check hardware constraints (valid_quants)
                 valid_quants = hw_config.get("valid_quants")
                 if valid_quants and quant not in valid_quants:
                     continue  # Skip this hardware for this quantization
 
+                cached = hardware_cache.get((hw_name, quant))
+                if cached is not None:
+                    hardware[hw_name] = copy_hardware_config(cached)
+                    continue
+
                 hardware[hw_name] = build_hardware_config(
                     hw_name, hw_config, defaults, quant, quant_overrides,
                     speculative_draft_model=speculative_draft_model
                 )
+                hardware_cache[(hw_name, quant)] = hardware[hw_name]
 
             # Skip if no valid hardware
             if not hardware:
@@ -569,9 +937,8 @@ def build_explicit_model(
     # Derive model_path if not specified
     model_path = model_def.get("model_path", f"{company}/{model_name}")
 
-    # Get merged hardware config from family and model levels
-    hw_configs, hardware_list = get_merged_hardware_config(family, model_def, defaults)
-    default_hw_config = hw_configs.get("default", {})
+    # Resolve each hardware's merged config from family and model levels
+    hw_configs, hardware_list = resolve_hardware_configs(family, model_def, defaults)
 
     # Default quantization for explicit models
     quant = model_def.get("quantization", "fp8")
@@ -583,18 +950,18 @@ def build_explicit_model(
     quant_overrides_section = model_def.get("quant_overrides", {})
     quant_overrides = quant_overrides_section.get(quant, {})
 
-    # Use model-level configurations if present, otherwise file-level defaults
+    # Use model-level configurations and sweep if present, otherwise file-level defaults
     effective_defaults = defaults
     if "configurations" in model_def:
         effective_defaults = {**defaults, "configurations": model_def["configurations"]}
+    if "parallelism_sweep" in model_def:
+        effective_defaults = {**effective_defaults, "parallelism_sweep": model_def["parallelism_sweep"]}
 
     # Build hardware configurations
     hardware = {}
     for hw_name in hardware_list:
-        # Start with default config, then merge hardware-specific overrides
-        hw_config = {**default_hw_config, **hw_configs.get(hw_name, {})}
         hardware[hw_name] = build_hardware_config(
-            hw_name, hw_config, effective_defaults, quant, quant_overrides,
+            hw_name, hw_configs[hw_name], effective_defaults, quant, quant_overrides,
             speculative_draft_model=speculative_draft_model
         )
 
@@ -612,12 +979,15 @@ def build_explicit_model(
     return result
 
 
-def build_family(
+def iter_family_models(
     company: str, family: dict, defaults: dict, vendors: dict
-) -> dict:
-    """Build a full family configuration."""
-    models = []
+) -> Iterator[dict]:
+    """
+    Yield the fully resolved models of a family in source order.
 
+    Models are built one source entry at a time, so only the variants of the
+    current entry are held in memory.
+    """
     for model_def in family.get("models", []):
         # Resolve per-model vendor override for model_path
         model_company = company
@@ -631,26 +1001,143 @@ def build_family(
         # Determine if this is variant generation or explicit model
         if isinstance(model_def, dict) and "base_name" in model_def:
             # Variant generation mode
-            variants = generate_model_variants(model_company, family, model_def, defaults)
-            models.extend(variants)
+            built = generate_model_variants(model_company, family, model_def, defaults)
         else:
             # Explicit model mode
-            models.append(build_explicit_model(model_company, family, model_def, defaults))
+            built = [build_explicit_model(model_company, family, model_def, defaults)]
+
+        # Estimate memory fit when the model declares its resources
+        resources = resolve_resources(family, model_def)
+        if resources:
+            attach_estimates(built, resources)
+        yield from built
 
+
+def build_family(
+    company: str, family: dict, defaults: dict, vendors: dict
+) -> dict:
+    """Build a full family configuration."""
     return {
         "name": family["name"],
         "description": family.get("description"),
-        "models": models,
+        "models": list(iter_family_models(company, family, defaults, vendors)),
     }
 
 
+# =============================================================================
+# Resource Estimation
+# =============================================================================
+
+
+def resolve_resources(family: dict, model_def: dict | str) -> dict | None:
+    """Merge the family and model `resources` specs; None if neither declares one."""
+    model_resources = model_def.get("resources", {}) if isinstance(model_def, dict) else {}
+    resources = {**family.get("resources", {}), **model_resources}
+    return resources or None
+
+
+def get_extra_arg(extra_args: list | None, flag: str) -> str | None:
+    """Return the (first) value of flag in extra_args, if set."""
+    values = ExtraArgs(extra_args).get(flag)
+    return str(values[0]) if values else None
+
+
+def kv_cache_elements_per_token(kv_cache: dict, attention_tp: int) -> float:
+    """
+    KV-cache elements stored per token on one GPU.
+
+    kv_cache is either {layers, latent_dim} for compressed (MLA) caches, which
+    every attention rank stores in full, or {layers, kv_heads, head_dim} for
+    K/V heads, which are split across up to attention_tp ranks.
+    """
+    layers = kv_cache["layers"]
+    if "latent_dim" in kv_cache:
+        return layers * kv_cache["latent_dim"]
+    kv_heads = kv_cache["kv_heads"]
+    return 2 * layers * kv_heads * kv_cache["head_dim"] / min(attention_tp, kv_heads)
+
+
+def estimate_configuration(resources: dict, hw_name: str, configuration: dict) -> dict | None:
+    """
+    Estimate GPU count, memory fit and KV-cache capacity of a named configuration.
+
+    Args:
+        resources: Model resources spec: parameters (billions) and optional kv_cache shape
+        hw_name: Hardware name, looked up in HARDWARE_SPECS
+        configuration: Named configuration built by build_named_configuration
+
+    Returns:
+        Estimate dict, or None when the hardware, quantization or engine block is
+        unknown. Memory figures are in GB (1e9 bytes) and rounded to 0.1 GB.
+    """
+    spec = HARDWARE_SPECS.get(hw_name)
+    weight_bytes = QUANT_WEIGHT_BYTES.get(configuration["attributes"]["quantization"])
+    engine = configuration.get("engine")
+    if spec is None or weight_bytes is None or not engine or "parameters" not in resources:
+        return None
+
+    tp = engine.get("tp") or 1
+    dp = engine.get("dp") or 1
+    # DP attention runs the dp ranks inside the tp group; plain DP adds replicas
+    gpus = tp if engine.get("enable_dp_attention") else tp * dp
+    attention_tp = max(tp // dp, 1) if engine.get("enable_dp_attention") else tp
+    nodes = -(-gpus // spec["gpus_per_node"])
+
+    extra_args = engine.get("extra_args")
+    mem_fraction = float(
+        get_extra_arg(extra_args, "--mem-fraction-static") or DEFAULT_MEM_FRACTION_STATIC
+    )
+    kv_dtype = get_extra_arg(extra_args, "--kv-cache-dtype") or ""
+    kv_bytes = 1 if kv_dtype.startswith("fp8") else DEFAULT_KV_CACHE_BYTES
+
+    weight_gb = resources["parameters"] * weight_bytes
+    weight_per_gpu_gb = weight_gb / tp
+    headroom_gb = spec["memory_gb"] * mem_fraction - weight_per_gpu_gb
+
+    estimate = {
+        "gpus": gpus,
+        "nodes": nodes,
+        "weight_memory_gb": round(float(weight_gb), 1),
+        "weight_memory_per_gpu_gb": round(weight_per_gpu_gb, 1),
+        "kv_cache_headroom_per_gpu_gb": round(headroom_gb, 1),
+    }
+    kv_cache = resources.get("kv_cache")
+    if kv_cache:
+        token_bytes = kv_cache_elements_per_token(kv_cache, attention_tp) * kv_bytes
+        tokens_per_rank = max(headroom_gb, 0) * 1e9 // token_bytes
+        estimate["max_concurrent_tokens"] = int(tokens_per_rank * dp)
+    estimate["fits"] = headroom_gb > 0 and (
+        configuration["attributes"]["nodes"] != "single" or nodes == 1
+    )
+    return estimate
+
+
+def attach_estimates(models: list[dict], resources: dict) -> None:
+    """Attach an `estimate` to every configuration of models, warning about misfits."""
+    for model in models:
+        for hw_name, hardware_config in model["hardware"].items():
+            for configuration in hardware_config["configurations"]:
+                estimate = estimate_configuration(resources, hw_name, configuration)
+                if estimate is None:
+                    continue
+                configuration["estimate"] = estimate
+                if not estimate["fits"]:
+                    print(
+                        f"  Warning: {model['name']} {hw_name} {configuration['name']} does not fit: "
+                        f"{estimate['weight_memory_per_gpu_gb']} GB weights per GPU, "
+                        f"{estimate['kv_cache_headroom_per_gpu_gb']} GB KV-cache headroom, "
+                        f"{estimate['gpus']} GPUs on {estimate['nodes']} node(s)",
+                        file=sys.stderr,
+                    )
+
+
 # =============================================================================
 # Main Compilation Functions
 # =============================================================================
 
 
-def compile_config(source: dict, vendors: dict) -> dict:
-    """Compile a simplified config into full schema format."""
+def resolve_vendor(source: dict, vendors: dict) -> tuple[str, str]:
+    """Return the vendor ID of a source and the company used in its model paths."""
     # Support both 'vendor' (new) and 'company' (legacy) keys
     vendor_id = source.get("vendor") or source.get("company")
     if not vendor_id:
@@ -658,17 +1145,30 @@ def compile_config(source: dict, vendors: dict) -> dict:
 
     # Look up vendor to get huggingface_org (used for model paths)
     if vendor_id in vendors:
-        company = vendors[vendor_id]["huggingface_org"]
-    else:
-        # Fallback: use vendor_id directly as company (for backwards compatibility)
-        print(f"  Warning: Vendor '{vendor_id}' not found in vendors.yaml, using as literal")
-        company = vendor_id
+        return vendor_id, vendors[vendor_id]["huggingface_org"]
+
+    # Fallback: use vendor_id directly as company (for backwards compatibility)
+    print(f"  Warning: Vendor '{vendor_id}' not found in vendors.yaml, using as literal", file=sys.stderr)
+    return vendor_id, vendor_id
+
 
+def compile_config(source: dict, vendors: dict, reused: dict[str, dict] | None = None) -> dict:
+    """
+    Compile a simplified config into full schema format.
+
+    reused maps family names to already compiled families that are known to
+    be current (see load_reusable_families); they are used instead of
+    rebuilding those families.
+    """
+    vendor_id, company = resolve_vendor(source, vendors)
     defaults = source.get("defaults", {})
 
     families = []
     for family in source.get("families", []):
-        families.append(build_family(company, family, defaults, vendors))
+        if reused and family["name"] in reused:
+            families.append(reused[family["name"]])
+        else:
+            families.append(build_family(company, family, defaults, vendors))
 
     return {
         "vendor": vendor_id,
@@ -676,31 +1176,144 @@ def compile_config(source: dict, vendors: dict) -> dict:
     }
 
 
+def engine_block_id(block: dict, table: dict[str, dict]) -> str:
+    """
+    Return the content-derived ID of an engine block, adding it to table.
+
+    IDs are a short hash of the block's JSON form, so they stay stable when
+    unrelated blocks are added or removed and diffs remain reviewable.
+    """
+    canonical = json.dumps(block, ensure_ascii=False)
+    digest = hashlib.sha256(canonical.encode()).hexdigest()
+    length = 8
+    while True:
+        block_id = digest[:length]
+        existing = table.get(block_id)
+        if existing is None:
+            table[block_id] = block
+            return block_id
+        if json.dumps(existing, ensure_ascii=False) == canonical:
+            return block_id
+        length += 4
+
+
+def normalize_config(compiled: dict) -> dict:
+    """
+    Store each distinct engine/prefill/decode block of a compiled file once.
+
+    Returns a copy of the document in which those blocks are replaced by IDs
+    into a top-level 'engines' table. inflate_config reverses this.
+    """
+    table: dict[str, dict] = {}
+    families = []
+    for family in compiled["families"]:
+        models = []
+        for model in family["models"]:
+            hardware = {}
+            for hw_name, hw_config in model["hardware"].items():
+                configurations = []
+                for configuration in hw_config["configurations"]:
+                    configuration = dict(configuration)
+                    for key in ENGINE_BLOCK_KEYS:
+                        if isinstance(configuration.get(key), dict):
+                            configuration[key] = engine_block_id(configuration[key], table)
+                    configurations.append(configuration)
+                hardware[hw_name] = {**hw_config, "configurations": configurations}
+            models.append({**model, "hardware": hardware})
+        families.append({**family, "models": models})
+
+    return {**compiled, "families": families, ENGINES_TABLE_KEY: table}
+
+
+def inflate_config(document: dict) -> dict:
+    """Restore the full schema shape of a document written with --normalize."""
+    if ENGINES_TABLE_KEY not in document:
+        return document
+
+    table = document[ENGINES_TABLE_KEY]
+    families = []
+    for family in document["families"]:
+        models = []
+        for model in family["models"]:
+            hardware = {}
+            for hw_name, hw_config in model["hardware"].items():
+                configurations = []
+                for configuration in hw_config["configurations"]:
+                    configuration = dict(configuration)
+                    for key in ENGINE_BLOCK_KEYS:
+                        if isinstance(configuration.get(key), str):
+                            configuration[key] = copy.deepcopy(table[configuration[key]])
+                    configurations.append(configuration)
+                hardware[hw_name] = {**hw_config, "configurations": configurations}
+            models.append({**model, "hardware": hardware})
+        families.append({**family, "models": models})
+
+    inflated = {key: value for key, value in document.items() if key != ENGINES_TABLE_KEY}
+    inflated["families"] = families
+    return inflated
+
+
 def load_yaml(path: Path) -> dict:
     """Load a YAML file."""
     with open(path) as f:
-        return yaml.safe_load(f)
+        return yaml.load(f, Loader=YamlLoader)
+
+
+class UnaliasedYamlDumper(YamlDumper):
+    """YamlDumper that writes shared values out in full instead of as anchors."""
+
+    def ignore_aliases(self, data: Any) -> bool:
+        return True
+
+
+def dump_yaml(data: dict, aliases: bool = True) -> str:
+    """Serialize data to YAML text with consistent formatting."""
+    # The safe dumpers represent None as 'null'
+    return yaml.dump(data, Dumper=YamlDumper if aliases else UnaliasedYamlDumper, **YAML_DUMP_OPTIONS)
 
 
 def save_yaml(data: dict, path: Path) -> None:
     """Save data to a YAML file with consistent formatting."""
     path.parent.mkdir(parents=True, exist_ok=True)
+    with open(path, "w") as f:
+        f.write(dump_yaml(data))
 
-    # Custom representer to handle None values as 'null'
-    def represent_none(dumper: yaml.Dumper, _: Any) -> yaml.Node:
-        return dumper.represent_scalar("tag:yaml.org,2002:null", "null")
 
-    yaml.add_representer(type(None), represent_none)
+def describe_differences(
+    expected: Any, actual: Any, path: str = "", limit: int = 10
+) -> list[str]:
+    """
+    Describe structural differences between two parsed documents.
 
-    with open(path, "w") as f:
-        yaml.dump(
-            data,
-            f,
-            default_flow_style=False,
-            allow_unicode=True,
-            sort_keys=False,
-            width=120,
-        )
+    Returns at most `limit` human-readable lines, each naming the path of a
+    differing value (e.g. "families[0].models[2].hardware.H200").
+    """
+    differences: list[str] = []
+
+    def walk(exp: Any, act: Any, where: str) -> None:
+        if len(differences) >= limit or exp == act:
+            return
+        if isinstance(exp, dict) and isinstance(act, dict):
+            for key in exp:
+                child = f"{where}.{key}" if where else str(key)
+                if key not in act:
+                    differences.append(f"{child}: missing")
+                else:
+                    walk(exp[key], act[key], child)
+            for key in act:
+                if key not in exp:
+                    child = f"{where}.{key}" if where else str(key)
+                    differences.append(f"{child}: unexpected")
+        elif isinstance(exp, list) and isinstance(act, list):
+            for i, (exp_item, act_item) in enumerate(zip(exp, act)):
+                walk(exp_item, act_item, f"{where}[{i}]")
+            if len(exp) != len(act):
+                differences.append(f"{where}: expected {len(exp)} items, found {len(act)}")
+        else:
+            differences.append(f"{where or '<root>'}: expected {exp!r}, found {act!r}")
+
+    walk(expected, actual, path)
+    return differences[:limit]
 
 
 def load_vendors(models_dir: Path) -> dict:
@@ -722,35 +1335,1098 @@ def load_vendors(models_dir: Path) -> dict:
     return vendors
 
 
-def compile_file(
-    input_path: Path, output_path: Path, vendors: dict, check_only: bool = False
+# =============================================================================
+# Streaming Library API
+# =============================================================================
+
+
+def iter_compiled_models(paths: Iterable[Path], vendors: dict) -> Iterator[dict]:
+    """
+    Compile source files lazily, yielding one fully resolved model at a time.
+
+    Only the current source file and the variants of its current model entry
+    are held in memory, so memory use stays flat however many variants the
+    sources expand to.
+
+    Args:
+        paths: Simplified source files, compiled in the given order (version
+            overlays are resolved)
+        vendors: Vendors table from load_vendors
+
+    Yields:
+        Dict with:
+        - source: path of the source file
+        - vendor: vendor ID of the source file
+        - family: name and description of the model's family
+        - model: the compiled model, as in the families[].models[] of compile_config
+
+    Raises:
+        ValueError: If a compiled model fails schema validation, as compile_file
+            would reject its file; models already yielded stay valid
+
+    Warnings (e.g. configurations that do not fit) go to stderr, so a stream
+    written to stdout stays clean.
+    """
+    for path in paths:
+        path = Path(path)
+        source, _ = resolve_source(path)
+        vendor_id, company = resolve_vendor(source, vendors)
+        defaults = source.get("defaults", {})
+        for family in source.get("families", []):
+            family_info = {"name": family["name"], "description": family.get("description")}
+            for model in iter_family_models(company, family, defaults, vendors):
+                # Validated as a one-model document, so errors read as in compile_file
+                errors = validate_model_config(
+                    {"vendor": vendor_id, "families": [{**family_info, "models": [model]}]}
+                )
+                if errors:
+                    raise ValueError(f"{path.name}: invalid compiled model: {format_schema_errors(errors)}")
+                yield {"source": path, "vendor": vendor_id, "family": family_info, "model": model}
+
+
+def write_yaml_stream(records: Iterable[dict], stream: TextIO) -> int:
+    """
+    Write records from iter_compiled_models as YAML, one document per source file.
+
+    Each model is written as soon as it is yielded. Documents load to the
+    same data as compile_config, but values that save_yaml would share
+    between models through anchors and aliases are written out in full, since
+    later models are not known yet. Families without models are not written.
+
+    Returns:
+        Number of models written
+    """
+    source = family = None
+    count = 0
+    for record in records:
+        if record["source"] != source:
+            if source is not None:
+                stream.write("---\n")
+            stream.write(dump_yaml({"vendor": record["vendor"]}))
+            stream.write("families:\n")
+            source, family = record["source"], None
+        if record["family"] != family:
+            family = record["family"]
+            stream.write(dump_yaml([family]))
+            stream.write("  models:\n")
+        stream.write(textwrap.indent(dump_yaml([record["model"]], aliases=False), "  "))
+        count += 1
+    return count
+
+
+def write_json_stream(records: Iterable[dict], stream: TextIO) -> int:
+    """
+    Write records from iter_compiled_models as JSON Lines, one line per source file.
+
+    Each line is the compile_config document of a source, written
+    incrementally as its models are yielded. Families without models are
+    not written.
+
+    Returns:
+        Number of models written
+    """
+    source = family = None
+    count = 0
+    for record in records:
+        if record["source"] != source:
+            if source is not None:
+                stream.write("]}]}\n")
+            stream.write(f'{{"vendor": {json.dumps(record["vendor"])}, "families": [')
+            source, family = record["source"], None
+        if record["family"] != family:
+            if family is not None:
+                stream.write("]}, ")
+            family = record["family"]
+            stream.write(json.dumps(family)[:-1] + ', "models": [')
+        else:
+            stream.write(", ")
+        stream.write(json.dumps(record["model"]))
+        count += 1
+    if source is not None:
+        stream.write("]}]}\n")
+    return count
+
+
+# =============================================================================
+# Version Overlays
+# =============================================================================
+
+
+def is_source_file(path: Path) -> bool:
+    """Whether a YAML file in the input directory is a source to compile (not '_'-prefixed)."""
+    return not path.name.startswith("_")
+
+
+def overlay_entry_id(entry: Any, id_keys: tuple[str, ...]) -> tuple | None:
+    """Identity of an entry in an overlay-merged list, or None if it has none."""
+    if isinstance(entry, str):
+        # Explicit models may be given as a bare name
+        return (id_keys[0], entry)
+    if isinstance(entry, dict):
+        for id_key in id_keys:
+            if id_key in entry:
+                return (id_key, entry[id_key])
+    return None
+
+
+def merge_overlay(base: Any, overlay: Any, key: str | None = None) -> Any:
+    """
+    Merge an overlay source onto its base.
+
+    Dicts are merged key by key. The families, models and configurations lists
+    are merged entry by entry: an overlay entry with the same name (or base_name)
+    as a base entry is merged onto it in place, other entries are appended.
+    Any other value, including other lists such as extra_args, replaces the
+    base value.
+    """
+    if isinstance(base, dict) and isinstance(overlay, dict):
+        merged = dict(base)
+        for child_key, value in overlay.items():
+            merged[child_key] = (
+                merge_overlay(base[child_key], value, child_key) if child_key in base else value
+            )
+        return merged
+
+    if key in OVERLAY_LIST_KEYS and isinstance(base, list) and isinstance(overlay, list):
+        id_keys = OVERLAY_LIST_KEYS[key]
+        merged = list(base)
+        positions = {}
+        for i, entry in enumerate(merged):
+            entry_id = overlay_entry_id(entry, id_keys)
+            if entry_id is not None:
+                positions[entry_id] = i
+        for entry in overlay:
+            entry_id = overlay_entry_id(entry, id_keys)
+            if entry_id in positions:
+                i = positions[entry_id]
+                merged[i] = merge_overlay(merged[i], entry)
+            else:
+                merged.append(entry)
+        return merged
+
+    return overlay
+
+
+def load_version_base(version_dir: Path) -> Path | None:
+    """Return the base version directory declared by version_dir's _version.yaml, if any."""
+    version_path = version_dir / VERSION_FILE
+    if not version_path.exists():
+        return None
+    spec = load_yaml(version_path) or {}
+    unknown = set(spec) - {"base"}
+    if unknown:
+        raise ValueError(f"{version_path}: unknown keys {', '.join(sorted(unknown))}")
+    base = spec.get("base")
+    if not base:
+        return None
+    if "/" in str(base) or base in (".", ".."):
+        raise ValueError(f"{version_path}: base must name a sibling version directory, got {base!r}")
+    base_dir = version_dir.parent / str(base)
+    if not base_dir.is_dir():
+        raise ValueError(f"{version_path}: base version directory {base_dir} does not exist")
+    return base_dir
+
+
+def resolve_source(path: Path) -> tuple[dict, list[Path]]:
+    """
+    Load a source file, merged onto its base version's file of the same name.
+
+    The chain of bases is followed, so each version directory only holds the
+    changes from its base. A file without a counterpart in the base version
+    is used as is.
+
+    Returns:
+        (resolved source, dependency paths): the dependencies are the
+        _version.yaml of each directory in the chain and the base files that
+        were or would be merged, including missing ones, so that creating any
+        of them is noticed by the manifest
+    """
+    chain = [path]
+    dependencies = []
+    version_dir = path.parent
+    seen = {version_dir.resolve()}
+    while True:
+        dependencies.append(version_dir / VERSION_FILE)
+        base_dir = load_version_base(version_dir)
+        if base_dir is None:
+            break
+        if base_dir.resolve() in seen:
+            raise ValueError(f"{version_dir / VERSION_FILE}: base versions form a cycle")
+        seen.add(base_dir.resolve())
+        base_path = base_dir / path.name
+        dependencies.append(base_path)
+        if base_path.exists():
+            chain.append(base_path)
+        version_dir = base_dir
+
+    source = load_yaml(chain[-1]) or {}
+    for overlay_path in reversed(chain[:-1]):
+        source = merge_overlay(source, load_yaml(overlay_path) or {})
+    return source, dependencies
+
+
+def family_digest(source: dict, family: dict, vendors: dict) -> str:
+    """
+    Digest of everything a family's compiled output depends on.
+
+    Covers the family definition, the file's vendor and defaults, and the
+    vendors.yaml entries the family references. Equal digests (under the
+    same compiler) mean equal compiled families.
+    """
+    vendor_ids = referenced_vendors({**source, "families": [family]})
+    inputs = {
+        "vendor": source.get("vendor") or source.get("company"),
+        "defaults": source.get("defaults", {}),
+        "family": family,
+        "vendors": {vendor_id: vendors.get(vendor_id) for vendor_id in sorted(vendor_ids)},
+    }
+    canonical = json.dumps(inputs, sort_keys=True, ensure_ascii=False, default=str)
+    return hashlib.sha256(canonical.encode()).hexdigest()
+
+
+def container_ids(value: Any) -> set[int]:
+    """Return the ids of every dict and list in value, including value itself."""
+    ids = set()
+    stack = [value]
+    while stack:
+        item = stack.pop()
+        if isinstance(item, (dict, list)) and id(item) not in ids:
+            ids.add(id(item))
+            stack.extend(item.values() if isinstance(item, dict) else item)
+    return ids
+
+
+def reusable_family_digests(source: dict, compiled: dict, vendors: dict) -> dict[str, str]:
+    """
+    Map the names of the compiled families that an overlay may reuse to their family_digest.
+
+    A family whose output holds an object from the file's defaults (such as
+    a shared env_vars dict) is left out. The same object may appear in other
+    families, and save_yaml writes such shared values with anchors that span
+    families. A family read back from an output file no longer shares them,
+    so reusing it would change the output text.
+    """
+    defaults_ids = container_ids(source.get("defaults", {}))
+    families = {family["name"]: family for family in source.get("families", [])}
+    return {
+        family["name"]: family_digest(source, families[family["name"]], vendors)
+        for family in compiled["families"]
+        if not container_ids(family) & defaults_ids
+    }
+
+
+def load_reusable_families(
+    source: dict, vendors: dict, base_output: Path, base_families: dict[str, str]
+) -> dict[str, dict]:
+    """
+    Return the compiled families of a base output that an overlay can reuse.
+
+    A family is reusable when its digest equals the one recorded for the
+    family of the same name when the base output was compiled. base_output
+    is only read when at least one family matches.
+    """
+    names = {
+        family["name"]
+        for family in source.get("families", [])
+        if base_families.get(family["name"]) == family_digest(source, family, vendors)
+    }
+    if not names:
+        return {}
+    if base_output.suffix == OUTPUT_FORMATS["cbor"]:
+        compiled = load_compact(base_output.read_bytes())
+    else:
+        compiled = load_yaml(base_output)
+    return {
+        family["name"]: family
+        for family in inflate_config(compiled)["families"]
+        if family["name"] in names
+    }
+
+
+# =============================================================================
+# Incremental Compilation Manifest and Dependency Graph
+# =============================================================================
+
+
+def referenced_vendors(source: dict) -> set[str]:
+    """Return the vendor IDs a source file depends on (file-level and per-model)."""
+    vendor_ids = set()
+    vendor_id = source.get("vendor") or source.get("company")
+    if vendor_id:
+        vendor_ids.add(vendor_id)
+    for family in source.get("families", []):
+        for model_def in family.get("models", []):
+            if isinstance(model_def, dict) and "vendor" in model_def:
+                vendor_ids.add(model_def["vendor"])
+    return vendor_ids
+
+
+def vendor_digest(vendors: dict, vendor_id: str) -> str:
+    """Return a digest of a single vendors.yaml entry (missing vendors hash as null)."""
+    entry = json.dumps(vendors.get(vendor_id), sort_keys=True)
+    return hashlib.sha256(entry.encode()).hexdigest()
+
+
+def file_digest(path: Path) -> str | None:
+    """Return the SHA-256 hex digest of a file's contents, or None if it is missing."""
+    try:
+        return hashlib.sha256(path.read_bytes()).hexdigest()
+    except FileNotFoundError:
+        return None
+
+
+def load_manifest(path: Path) -> dict:
+    """
+    Load the incremental compilation manifest.
+
+    A missing, unreadable or incompatible manifest yields an empty one, which
+    simply forces a full compile.
+    """
+    try:
+        with open(path) as f:
+            manifest = json.load(f)
+    except (OSError, ValueError):
+        return {"version": MANIFEST_VERSION, "files": {}}
+
+    if not isinstance(manifest, dict) or manifest.get("version") != MANIFEST_VERSION:
+        return {"version": MANIFEST_VERSION, "files": {}}
+    manifest.setdefault("files", {})
+    return manifest
+
+
+def save_manifest(manifest: dict, path: Path) -> None:
+    """Save the incremental compilation manifest."""
+    path.parent.mkdir(parents=True, exist_ok=True)
+    with open(path, "w") as f:
+        json.dump(manifest, f, indent=2, sort_keys=True)
+        f.write("\n")
+
+
+def output_layout(output_format: str, normalize: bool) -> dict:
+    """Describe the output layout of a run, as recorded in manifest entries."""
+    return {"format": output_format, "normalize": normalize}
+
+
+def is_up_to_date(
+    entry: dict | None,
+    source_hash: str | None,
+    output_path: Path,
+    vendors: dict,
+    input_dir: Path,
+    layout: dict,
 ) -> bool:
+    """
+    Check whether a manifest entry proves that an output is current.
+
+    The entry must record the same source hash, the same output layout
+    (format and normalization), the same hash for every vendor the source
+    references and for every overlay dependency (base files and _version.yaml
+    files, keyed relative to input_dir), and the output on disk must still
+    hash to the value recorded when it was last written or verified.
+    """
+    if not entry or source_hash is None:
+        return False
+    if entry.get("source") != source_hash or entry.get("layout") != layout:
+        return False
+    for vendor_id, recorded in entry.get("vendors", {}).items():
+        if recorded != vendor_digest(vendors, vendor_id):
+            return False
+    for key, recorded in entry.get("bases", {}).items():
+        if recorded != file_digest(input_dir / key):
+            return False
+    recorded_output = entry.get("output")
+    return recorded_output is not None and recorded_output == file_digest(output_path)
+
+
+def build_vendor_index(files: dict) -> dict[str, list[str]]:
+    """Build the reverse index from vendor ID to the manifest keys that reference it."""
+    index: dict[str, list[str]] = {}
+    for key in sorted(files):
+        for vendor_id in files[key].get("vendors", {}):
+            index.setdefault(vendor_id, []).append(key)
+    return {vendor_id: index[vendor_id] for vendor_id in sorted(index)}
+
+
+def dependency_key(path: Path, input_dir: Path) -> str:
+    """Manifest key of an overlay dependency: its path relative to input_dir."""
+    return Path(os.path.relpath(path, input_dir)).as_posix()
+
+
+def build_dependency_graph(
+    input_files: list[Path], input_dir: Path, files: dict
+) -> tuple[dict[str, set[str]], dict[str, set[str]]]:
+    """
+    Map each source file's manifest key to what its output depends on.
+
+    Returns (vendor IDs it references, keys of its overlay dependencies).
+    Dependencies recorded in the manifest are reused while the entry is
+    current; other sources are resolved to discover them.
+    """
+    vendor_graph = {}
+    base_graph = {}
+    for input_path in input_files:
+        key = input_path.relative_to(input_dir).as_posix()
+        entry = files.get(key)
+        if (
+            entry
+            and entry.get("source") == file_digest(input_path)
+            and all(
+                recorded == file_digest(input_dir / base_key)
+                for base_key, recorded in entry.get("bases", {}).items()
+            )
+        ):
+            vendor_graph[key] = set(entry.get("vendors", {}))
+            base_graph[key] = set(entry.get("bases", {}))
+        else:
+            source, dependencies = resolve_source(input_path)
+            vendor_graph[key] = referenced_vendors(source)
+            base_graph[key] = {dependency_key(path, input_dir) for path in dependencies}
+    return vendor_graph, base_graph
+
+
+def affected_outputs(
+    changed_paths: list[Path],
+    input_files: list[Path],
+    input_dir: Path,
+    vendors: dict,
+    files: dict,
+) -> list[str]:
+    """
+    Return the manifest keys of the outputs that a change to changed_paths touches.
+
+    - A source file affects its own output and the outputs of the overlays
+      built on it; a _version.yaml affects the outputs of its version and of
+      the versions built on it.
+    - vendors.yaml affects the outputs that reference a vendor whose entry
+      differs from the one recorded at the last compile (or every dependent
+      output if nothing was recorded yet).
+    - The compiler itself affects every output.
+    """
+    graph, base_graph = build_dependency_graph(input_files, input_dir, files)
+    vendors_path = (input_dir.parent / "vendors.yaml").resolve()
+    input_root = input_dir.resolve()
+    compiler_paths = {(Path(__file__).parent / module).resolve() for module in COMPILER_MODULES}
+
+    affected: set[str] = set()
+    for path in changed_paths:
+        path = path.resolve()
+        if path in compiler_paths:
+            affected.update(graph)
+        elif path == vendors_path:
+            for key, vendor_ids in graph.items():
+                recorded = files.get(key, {}).get("vendors")
+                if recorded is None or any(
+                    recorded.get(vendor_id) != vendor_digest(vendors, vendor_id)
+                    for vendor_id in vendor_ids
+                ):
+                    affected.add(key)
+        elif path.is_relative_to(input_root):
+            key = path.relative_to(input_root).as_posix()
+            if key in graph:
+                affected.add(key)
+            affected.update(
+                output_key for output_key, base_keys in base_graph.items() if key in base_keys
+            )
+    return sorted(affected)
+
+
+def compiler_digest() -> str:
+    """Return a digest over the source of every module that affects compiled output."""
+    digest = hashlib.sha256()
+    for module in COMPILER_MODULES:
+        digest.update((Path(__file__).parent / module).read_bytes())
+    return digest.hexdigest()
+
+
+def compile_file(
+    input_path: Path,
+    output_path: Path,
+    vendors: dict,
+    check_only: bool = False,
+    output_format: str = "yaml",
+    normalize: bool = False,
+    base_output: tuple[Path, dict[str, str]] | None = None,
+) -> tuple[bool, dict[str, str]]:
     """
     Compile a single file.
 
-    Returns True if successful (or if check passes), False otherwise.
+    base_output is the current output of the file's base version and the
+    family digests recorded for it; families the overlay leaves unchanged
+    are taken from it instead of being rebuilt.
+
+    Returns (ok, reusable family digests): ok is True if successful (or if
+    check passes); the digests are those of reusable_family_digests, for
+    the manifest.
     """
     print(f"Compiling {input_path.name}...")
 
-    source = load_yaml(input_path)
-    compiled = compile_config(source, vendors)
+    with phase("load"):
+        source, _ = resolve_source(input_path)
+        reused = load_reusable_families(source, vendors, *base_output) if base_output else {}
+    if reused:
+        print(f"  Reusing {len(reused)} unchanged famil{'y' if len(reused) == 1 else 'ies'} from {base_output[0]}")
+    with phase("expand"):
+        compiled = compile_config(source, vendors, reused)
+        reusable = reusable_family_digests(source, compiled, vendors)
+    with phase("validate"):
+        errors = validate_model_config(compiled)
+    if errors:
+        report_schema_errors(errors)
+        return False, {}
+    if active_profile() is not None:
+        models = [model for family in compiled["families"] for model in family["models"]]
+        hardware_configs = [hw for model in models for hw in model["hardware"].values()]
+        record_counts(
+            models=len(models),
+            hardware=len(hardware_configs),
+            configurations=sum(len(hw["configurations"]) for hw in hardware_configs),
+        )
 
-    if check_only:
-        if output_path.exists():
-            existing = load_yaml(output_path)
-            if existing == compiled:
-                print(f"  OK: {output_path.name} is up to date")
-                return True
-            else:
-                print(f"  FAIL: {output_path.name} is out of date")
-                return False
+    with phase("dump"):
+        if normalize:
+            compiled = normalize_config(compiled)
+        if output_format == "cbor":
+            serialized = dump_compact(compiled)
         else:
+            serialized = dump_yaml(compiled)
+
+    if check_only:
+        if not output_path.exists():
             print(f"  FAIL: {output_path.name} does not exist")
-            return False
+            return False, reusable
 
-    save_yaml(compiled, output_path)
+        # Compare serialized output first; only parse the (much larger) generated
+        # file when it differs, to explain the mismatch.
+        with phase("check"):
+            if output_format == "cbor":
+                existing = output_path.read_bytes()
+            else:
+                existing = output_path.read_text()
+            unchanged = existing == serialized
+        if unchanged:
+            print(f"  OK: {output_path.name} is up to date")
+            return True, reusable
+
+        print(f"  FAIL: {output_path.name} is out of date")
+        try:
+            with phase("diff"):
+                if output_format == "cbor":
+                    differences = describe_differences(compiled, load_compact(existing))
+                else:
+                    differences = describe_differences(compiled, load_yaml(output_path))
+        except (ValueError, IndexError, yaml.YAMLError) as e:
+            differences = [f"cannot parse existing output: {e}"]
+        if not differences:
+            differences = ["formatting differs from compiler output"]
+        for difference in differences:
+            print(f"    {difference}")
+        return False, reusable
+
+    with phase("write"):
+        output_path.parent.mkdir(parents=True, exist_ok=True)
+        if output_format == "cbor":
+            output_path.write_bytes(serialized)
+        else:
+            with open(output_path, "w") as f:
+                f.write(serialized)
     print(f"  Wrote {output_path}")
-    return True
+    return True, reusable
+
+
+def format_schema_errors(errors: list[str]) -> str:
+    """Join schema errors into one message, up to MAX_REPORTED_ERRORS."""
+    message = "; ".join(errors[:MAX_REPORTED_ERRORS])
+    if len(errors) > MAX_REPORTED_ERRORS:
+        message += f"; ... and {len(errors) - MAX_REPORTED_ERRORS} more"
+    return message
+
+
+def report_schema_errors(errors: list[str]) -> None:
+    """Print the schema errors of a compiled document, up to MAX_REPORTED_ERRORS."""
+    for error in errors[:MAX_REPORTED_ERRORS]:
+        print(f"  ERROR: {error}")
+    if len(errors) > MAX_REPORTED_ERRORS:
+        print(f"  ... and {len(errors) - MAX_REPORTED_ERRORS} more schema error(s)")
+
+
+def profile_name(input_path: Path) -> str:
+    """Name of a source file in --profile reports: its version directory and file name."""
+    return f"{input_path.parent.name}/{input_path.name}"
+
+
+def try_compile_file(
+    input_path: Path,
+    output_path: Path,
+    vendors: dict,
+    check_only: bool = False,
+    output_format: str = "yaml",
+    normalize: bool = False,
+    base_output: tuple[Path, dict[str, str]] | None = None,
+) -> tuple[bool, dict[str, str]]:
+    """
+    Compile a single file, reporting an exception as a failed compile.
+
+    Serial runs and pool workers both go through here, so an error in one
+    file is reported the same way and does not stop the others, whatever
+    --jobs is.
+    """
+    try:
+        return compile_file(
+            input_path, output_path, vendors, check_only, output_format, normalize, base_output
+        )
+    except Exception as e:
+        print(f"  ERROR: {input_path.name}: {type(e).__name__}: {e}")
+        return False, {}
+
+
+class RecordedStream(io.TextIOBase):
+    """Text stream that appends each write to a shared list of (stream name, text) chunks."""
+
+    def __init__(self, chunks: list[tuple[str, str]], stream_name: str) -> None:
+        self.chunks = chunks
+        self.stream_name = stream_name
+
+    def writable(self) -> bool:
+        return True
+
+    def write(self, text: str) -> int:
+        self.chunks.append((self.stream_name, text))
+        return len(text)
+
+
+def compile_file_captured(
+    input_path: Path,
+    output_path: Path,
+    vendors: dict,
+    check_only: bool = False,
+    output_format: str = "yaml",
+    normalize: bool = False,
+    profile: bool = False,
+    base_output: tuple[Path, dict[str, str]] | None = None,
+) -> tuple[tuple[bool, dict[str, str]], list[tuple[str, str]], dict | None]:
+    """
+    Compile a single file in a worker process, capturing its output.
+
+    Returns (compile_file result, output, profile record) so the parent
+    process can print results in input order. output holds the
+    ("stdout" or "stderr", text) chunks written, in order, so warnings stay
+    on stderr and interleave as in a serial run. The record is None unless
+    profile is set. Exceptions are reported as a failed compile rather than
+    aborting the pool.
+    """
+    chunks: list[tuple[str, str]] = []
+    worker_profile = start_profile() if profile else None
+    with (
+        contextlib.redirect_stdout(RecordedStream(chunks, "stdout")),
+        contextlib.redirect_stderr(RecordedStream(chunks, "stderr")),
+        profile_file(profile_name(input_path)),
+    ):
+        result = try_compile_file(
+            input_path, output_path, vendors, check_only, output_format, normalize, base_output
+        )
+    record = worker_profile.files[profile_name(input_path)] if worker_profile else None
+    return result, chunks, record
+
+
+def compile_files(
+    tasks: list[tuple[Path, Path, tuple[Path, dict[str, str]] | None]],
+    vendors: dict,
+    check_only: bool,
+    jobs: int,
+    output_format: str = "yaml",
+    normalize: bool = False,
+) -> list[tuple[bool, dict[str, str]]]:
+    """
+    Compile (input_path, output_path, base_output) tasks, serially or across a process pool.
+
+    compile_file results are returned, and worker output printed, in the
+    order of tasks.
+    """
+    if jobs <= 1 or len(tasks) <= 1:
+        results = []
+        for input_path, output_path, base_output in tasks:
+            with profile_file(profile_name(input_path)):
+                results.append(try_compile_file(
+                    input_path, output_path, vendors, check_only, output_format, normalize, base_output
+                ))
+        return results
+
+    profile = active_profile()
+    results = []
+    with ProcessPoolExecutor(max_workers=min(jobs, len(tasks))) as executor:
+        futures = [
+            executor.submit(
+                compile_file_captured,
+                input_path,
+                output_path,
+                vendors,
+                check_only,
+                output_format,
+                normalize,
+                profile is not None,
+                base_output,
+            )
+            for input_path, output_path, base_output in tasks
+        ]
+        for (input_path, _, _), future in zip(tasks, futures):
+            result, output, record = future.result()
+            for stream_name, text in output:
+                getattr(sys, stream_name).write(text)
+            if record is not None:
+                merge_file(profile, profile_name(input_path), record)
+            results.append(result)
+    return results
+
+
+# =============================================================================
+# Launch Commands
+# =============================================================================
+
+LAUNCH_MODULE = "sglang.launch_server"
+
+
+def build_launch_argv(model: dict, configuration: dict) -> list[str]:
+    """
+    Build the sglang.launch_server argument list for a compiled configuration.
+
+    Args:
+        model: Compiled model (name, model_path, attributes, hardware)
+        configuration: One named configuration of that model
+
+    Returns:
+        argv starting with "python -m sglang.launch_server", using the CLI
+        mapping documented in data/models/README.md
+    """
+    engine = configuration.get("engine") or {}
+    model_path = configuration.get("quantized_model_path") or model["model_path"]
+
+    argv = ["python", "-m", LAUNCH_MODULE, "--model-path", model_path]
+    argv += ["--tp-size", str(engine.get("tp", 1))]
+    if engine.get("dp") is not None:
+        argv += ["--dp-size", str(engine["dp"])]
+    if engine.get("ep") is not None:
+        argv += ["--ep-size", str(engine["ep"])]
+    if engine.get("enable_dp_attention"):
+        argv.append("--enable-dp-attention")
+
+    llm = model.get("attributes", {}).get("llm") or {}
+    if llm.get("tool_parser"):
+        argv += ["--tool-call-parser", llm["tool_parser"]]
+    if llm.get("reasoning_parser"):
+        argv += ["--reasoning-parser", llm["reasoning_parser"]]
+    if llm.get("chat_template"):
+        argv += ["--chat-template", llm["chat_template"]]
+
+    argv += [str(arg) for arg in engine.get("extra_args") or []]
+    return argv
+
+
+def format_shell_command(argv: list[str], env_vars: dict | None = None) -> str:
+    """Format argv (and env vars) as a multi-line shell command, one flag per line."""
+    lines = [" ".join(shlex.quote(arg) for arg in argv[:3])]
+    for arg in argv[3:]:
+        if arg.startswith("--") or len(lines) == 1:
+            lines.append(shlex.quote(arg))
+        else:
+            lines[-1] += f" {shlex.quote(arg)}"
+
+    command = " \\\n  ".join(lines)
+    if env_vars:
+        env = " ".join(f"{key}={shlex.quote(str(value))}" for key, value in env_vars.items())
+        command = f"{env} {command}"
+    return command
+
+
+def format_env_file(env_vars: dict | None) -> str:
+    """
+    Format env vars as an env file (KEY=value per line), as read by `docker run --env-file`.
+
+    Docker takes each value verbatim up to the end of the line, without
+    removing quotes, so values are written raw.
+
+    Raises:
+        ValueError: If a value contains a newline, which an env file cannot hold
+    """
+    lines = []
+    for key, value in (env_vars or {}).items():
+        value = str(value)
+        if "\n" in value or "\r" in value:
+            raise ValueError(f"env var {key} cannot be written to an env file: value contains a newline")
+        lines.append(f"{key}={value}\n")
+    return "".join(lines)
+
+
+def render_launch(model: dict, configuration: dict) -> dict:
+    """
+    Render the canonical launch forms of a compiled configuration.
+
+    Returns a dict with:
+    - argv: JSON argument vector, without environment
+    - env: environment variables to set (string values)
+    - shell: ready-to-run multi-line shell command, env vars inlined
+    - env_file: env vars in KEY=value form, one per line
+    """
+    engine = configuration.get("engine") or {}
+    env_vars = {key: str(value) for key, value in (engine.get("env_vars") or {}).items()}
+    argv = build_launch_argv(model, configuration)
+    return {
+        "argv": argv,
+        "env": env_vars,
+        "shell": format_shell_command(argv, env_vars),
+        "env_file": format_env_file(env_vars),
+    }
+
+
+# =============================================================================
+# Consolidated Catalog
+# =============================================================================
+
+
+def catalog_version(manifest_key: str) -> str:
+    """Return the SGLang version folder of a generated file (e.g. 'v0.5.6/qwen.yaml')."""
+    parts = manifest_key.split("/")
+    return parts[0] if len(parts) > 1 else UNVERSIONED_CATALOG
+
+
+def build_catalog(version: str, documents: list[tuple[str, dict]]) -> dict:
+    """
+    Consolidate the generated documents of one SGLang version into a catalog.
+
+    Args:
+        version: SGLang version folder (e.g. 'v0.5.6')
+        documents: (generated file name, compiled document) pairs
+
+    Returns:
+        Catalog dict with:
+        - models: every model, annotated with its vendor, family and source file
+        - configurations: [model index, hardware, configuration index] references
+        - launch: render_launch() forms for each entry of configurations
+        - indexes: name/model_path -> model indexes, and
+          hardware/quantization/optimization/nodes -> configuration indexes
+    """
+    models = []
+    configurations = []
+    launch = []
+    indexes: dict[str, dict[str, list[int]]] = {
+        "name": {},
+        "model_path": {},
+        "hardware": {},
+        "quantization": {},
+        "optimization": {},
+        "nodes": {},
+    }
+
+    for file_name, document in documents:
+        for family in document.get("families", []):
+            for model in family.get("models", []):
+                model_index = len(models)
+                models.append({
+                    "vendor": document.get("vendor"),
+                    "family": family.get("name"),
+                    "source": file_name,
+                    **model,
+                })
+                indexes["name"].setdefault(model["name"], []).append(model_index)
+                indexes["model_path"].setdefault(model["model_path"], []).append(model_index)
+
+                for hw_name, hw_config in model.get("hardware", {}).items():
+                    for config_index, configuration in enumerate(
+                        hw_config.get("configurations", [])
+                    ):
+                        ref_index = len(configurations)
+                        configurations.append([model_index, hw_name, config_index])
+                        launch.append(render_launch(model, configuration))
+                        attributes = configuration.get("attributes", {})
+                        indexes["hardware"].setdefault(hw_name, []).append(ref_index)
+                        for key in ("quantization", "optimization", "nodes"):
+                            value = attributes.get(key)
+                            if value is not None:
+                                indexes[key].setdefault(str(value), []).append(ref_index)
+
+    return {
+        "format": CATALOG_FORMAT_VERSION,
+        "version": version,
+        "models": models,
+        "configurations": configurations,
+        "launch": launch,
+        "indexes": indexes,
+    }
+
+
+def write_catalogs(
+    output_dir: Path, catalog_dir: Path, keys: list[str], force: bool = False
+) -> None:
+    """
+    Write one catalog per SGLang version from the generated files in output_dir.
+
+    A catalog is rebuilt only when the digests of its generated files differ
+    from those recorded in the existing catalog (or force is set).
+    """
+    by_version: dict[str, list[str]] = {}
+    for key in sorted(keys):
+        by_version.setdefault(catalog_version(key), []).append(key)
+
+    for version, version_keys in by_version.items():
+        catalog_path = catalog_dir / f"{version}.json"
+        digests = {key: file_digest(output_dir / key) for key in version_keys}
+
+        if not force and catalog_path.exists():
+            try:
+                with open(catalog_path) as f:
+                    existing = json.load(f)
+            except (OSError, ValueError):
+                existing = {}
+            if existing.get("format") == CATALOG_FORMAT_VERSION and existing.get("outputs") == digests:
+                print(f"Catalog {catalog_path.name} is up to date")
+                continue
+
+        documents = [
+            (Path(key).name, load_yaml(output_dir / key))
+            for key in version_keys
+            if digests[key] is not None
+        ]
+        catalog = build_catalog(version, documents)
+        catalog["outputs"] = digests
+
+        catalog_path.parent.mkdir(parents=True, exist_ok=True)
+        with open(catalog_path, "w") as f:
+            json.dump(catalog, f, ensure_ascii=False, separators=(",", ":"))
+            f.write("\n")
+        print(f"Wrote catalog {catalog_path} ({len(catalog['models'])} models)")
+
+
+def load_catalog(path: Path) -> dict:
+    """Load a consolidated catalog written by write_catalogs."""
+    with open(path) as f:
+        catalog = json.load(f)
+    if catalog.get("format") != CATALOG_FORMAT_VERSION:
+        raise ValueError(f"{path}: unsupported catalog format {catalog.get('format')!r}")
+    return catalog
+
+
+# =============================================================================
+# Watch Mode
+# =============================================================================
+
+
+def source_mtimes(input_dir: Path) -> dict[Path, int]:
+    """Map each source YAML file in input_dir and its version subdirectories to its mtime."""
+    mtimes = {}
+    for pattern in ("*.yaml", "*/*.yaml"):
+        for path in input_dir.glob(pattern):
+            try:
+                mtimes[path] = path.stat().st_mtime_ns
+            except FileNotFoundError:
+                continue
+    return mtimes
+
+
+def file_mtime(path: Path) -> int | None:
+    """Return a file's mtime in nanoseconds, or None if it does not exist."""
+    try:
+        return path.stat().st_mtime_ns
+    except FileNotFoundError:
+        return None
+
+
+def watch(input_dir: Path, output_dir: Path, interval: float = 0.5) -> int:
+    """
+    Recompile model configs whenever a source file or vendors.yaml changes.
+
+    Parsed sources and the vendors table are kept in memory. A source change
+    recompiles only that file and the overlays built on it; a vendors.yaml
+    change recompiles only the files that reference a vendor whose entry
+    changed. Outputs are rewritten only
+    when their content changes. Runs until interrupted.
+    """
+    models_dir = input_dir.parent
+    vendors_path = models_dir / "vendors.yaml"
+    vendors = load_vendors(models_dir)
+    vendors_mtime = file_mtime(vendors_path)
+    sources: dict[Path, dict] = {}
+    dependencies: dict[Path, set[Path]] = {}
+
+    def load_source(path: Path) -> bool:
+        try:
+            sources[path], source_dependencies = resolve_source(path)
+        except (OSError, ValueError, yaml.YAMLError) as e:
+            print(f"  ERROR: {path.name}: {e}")
+            return False
+        dependencies[path] = set(source_dependencies)
+        return True
+
+    def rebuild(path: Path) -> None:
+        output_path = output_dir / path.relative_to(input_dir)
+        print(f"Compiling {path.name}...")
+        try:
+            compiled = compile_config(sources[path], vendors)
+        except Exception as e:
+            print(f"  ERROR: {path.name}: {type(e).__name__}: {e}")
+            return
+        errors = validate_model_config(compiled)
+        if errors:
+            report_schema_errors(errors)
+            return
+        text = dump_yaml(compiled)
+        if output_path.exists() and output_path.read_text() == text:
+            print(f"  OK: {output_path.name} is up to date")
+            return
+        output_path.parent.mkdir(parents=True, exist_ok=True)
+        output_path.write_text(text)
+        print(f"  Wrote {output_path}")
+
+    mtimes = source_mtimes(input_dir)
+    for path in sorted(mtimes):
+        if is_source_file(path) and load_source(path):
+            rebuild(path)
+    print(f"\nWatching {input_dir} and {vendors_path} for changes (Ctrl+C to stop)")
+
+    try:
+        while True:
+            time.sleep(interval)
+            current = source_mtimes(input_dir)
+            changed = sorted(path for path, mtime in current.items() if mtimes.get(path) != mtime)
+
+            removed = sorted(set(mtimes) - set(current))
+            for path in removed:
+                if sources.pop(path, None) is not None:
+                    dependencies.pop(path, None)
+                    print(f"Removed {path.name} (generated output left in place)")
+            mtimes = current
+
+            # Overlays are rebuilt when a base file or _version.yaml they resolve through changes
+            touched = set(changed) | set(removed)
+            candidates = {path for path in changed if is_source_file(path)}
+            candidates.update(path for path, paths in dependencies.items() if paths & touched)
+            affected = {path for path in candidates if path in current and load_source(path)}
+
+            current_vendors_mtime = file_mtime(vendors_path)
+            if current_vendors_mtime != vendors_mtime:
+                vendors_mtime = current_vendors_mtime
+                try:
+                    new_vendors = load_vendors(models_dir)
+                except (OSError, ValueError, yaml.YAMLError) as e:
+                    print(f"  ERROR: vendors.yaml: {e}")
+                    new_vendors = vendors
+                changed_ids = {
+                    vendor_id
+                    for vendor_id in set(vendors) | set(new_vendors)
+                    if vendors.get(vendor_id) != new_vendors.get(vendor_id)
+                }
+                vendors = new_vendors
+                if changed_ids:
+                    print(f"vendors.yaml changed: {', '.join(sorted(changed_ids))}")
+                    affected.update(
+                        path
+                        for path, source in sources.items()
+                        if referenced_vendors(source) & changed_ids
+                    )
+
+            for path in sorted(affected):
+                rebuild(path)
+    except KeyboardInterrupt:
+        print("\nStopped watching")
+    return 0
 
 
 def main() -> int:
@@ -774,6 +2450,63 @@ def main() -> int:
         action="store_true",
         help="Check if generated files are up to date without writing",
     )
+    parser.add_argument(
+        "--no-cache",
+        action="store_true",
+        help="Ignore the incremental compilation manifest and compile every file",
+    )
+    parser.add_argument(
+        "--jobs",
+        "-j",
+        type=int,
+        default=1,
+        help="Number of worker processes (0 uses all CPUs, default: 1)",
+    )
+    parser.add_argument(
+        "--affected-by",
+        type=Path,
+        action="append",
+        metavar="PATH",
+        help="List the outputs a change to PATH would touch, without compiling (repeatable)",
+    )
+    parser.add_argument(
+        "--format",
+        choices=sorted(OUTPUT_FORMATS),
+        default="yaml",
+        help="Output format: schema YAML (default) or compact binary CBOR",
+    )
+    parser.add_argument(
+        "--normalize",
+        action="store_true",
+        help="Store each distinct engine block once per file and reference it by ID",
+    )
+    parser.add_argument(
+        "--catalog",
+        action="store_true",
+        help="Also write one consolidated, indexed JSON catalog per SGLang version",
+    )
+    parser.add_argument(
+        "--catalog-dir",
+        type=Path,
+        default=Path(__file__).parent.parent / "models" / "catalog",
+        help="Directory for consolidated catalogs (default: data/models/catalog)",
+    )
+    parser.add_argument(
+        "--watch",
+        action="store_true",
+        help="Keep running and recompile affected outputs when sources or vendors change",
+    )
+    parser.add_argument(
+        "--profile",
+        action="store_true",
+        help="Print per-phase and per-file timings, output counts and peak memory",
+    )
+    parser.add_argument(
+        "--profile-output",
+        type=Path,
+        metavar="PATH",
+        help="Also write the --profile report as JSON to PATH (implies --profile)",
+    )
     parser.add_argument(
         "files",
         nargs="*",
@@ -782,34 +2515,157 @@ def main() -> int:
 
     args = parser.parse_args()
 
+    if (args.format != "yaml" or args.normalize) and (args.watch or args.catalog):
+        parser.error("--watch and --catalog require the default --format yaml layout")
+
+    profiling = args.profile or args.profile_output is not None
+
+    if args.watch:
+        if args.check or args.files or profiling:
+            parser.error("--watch cannot be combined with --check, --profile or explicit files")
+        return watch(args.input_dir, args.output_dir)
+
+    if profiling:
+        profile = start_profile()
+
     # Load vendors from models directory (parent of input-dir)
     models_dir = args.input_dir.parent
-    vendors = load_vendors(models_dir)
+    with phase("vendors"):
+        vendors = load_vendors(models_dir)
+
+    # Cached results are only valid for the same compiler source; per-vendor
+    # hashes are checked per file
+    manifest_path = args.output_dir / MANIFEST_NAME
+    with phase("manifest"):
+        manifest = load_manifest(manifest_path)
+        compiler_hash = compiler_digest()
+    if args.no_cache or manifest.get("compiler") != compiler_hash:
+        manifest = {"version": MANIFEST_VERSION, "files": {}}
+    manifest["compiler"] = compiler_hash
+    cached_files = manifest["files"]
 
     # Find input files
     if args.files:
         input_files = [Path(f) for f in args.files]
     else:
         # Search for YAML files in input-dir and all version subdirectories
-        input_files = list(args.input_dir.glob("*.yaml"))
-        input_files.extend(args.input_dir.glob("*/*.yaml"))
+        input_files = sorted(args.input_dir.glob("*.yaml"))
+        input_files.extend(sorted(args.input_dir.glob("*/*.yaml")))
+        input_files = [path for path in input_files if is_source_file(path)]
 
     if not input_files:
         print(f"No YAML files found in {args.input_dir}")
         return 1
 
-    # Compile each file
+    if args.affected_by:
+        for key in affected_outputs(
+            args.affected_by, input_files, args.input_dir, vendors, cached_files
+        ):
+            print((args.output_dir / key).with_suffix(OUTPUT_FORMATS[args.format]))
+        return 0
+
+    jobs = args.jobs if args.jobs > 0 else (os.cpu_count() or 1)
+
+    # Skip files whose inputs, output and output layout are unchanged, compile the rest
+    layout = output_layout(args.format, args.normalize)
+    pending = []
+    with phase("manifest"):
+        for input_path in input_files:
+            # Preserve version subdirectory structure in output
+            relative_path = input_path.relative_to(args.input_dir)
+            output_path = (args.output_dir / relative_path).with_suffix(OUTPUT_FORMATS[args.format])
+            manifest_key = relative_path.as_posix()
+            source_hash = file_digest(input_path)
+
+            if is_up_to_date(
+                cached_files.get(manifest_key), source_hash, output_path, vendors, args.input_dir, layout
+            ):
+                print(f"Skipping {input_path.name} (unchanged)")
+                continue
+
+            pending.append((input_path, output_path, manifest_key, source_hash))
+
+        # An overlay reuses families from its base's output when the base is
+        # current and is not being recompiled in this run
+        pending_keys = {manifest_key for _, _, manifest_key, _ in pending}
+        tasks = []
+        for input_path, output_path, _, _ in pending:
+            base_output = None
+            base_dir = load_version_base(input_path.parent)
+            if base_dir is not None:
+                base_key = dependency_key(base_dir / input_path.name, args.input_dir)
+                base_entry = cached_files.get(base_key) or {}
+                base_path = (args.output_dir / base_key).with_suffix(OUTPUT_FORMATS[args.format])
+                if (
+                    base_key not in pending_keys
+                    and base_entry.get("layout") == layout
+                    and base_entry.get("families")
+                    and base_entry.get("output") == file_digest(base_path)
+                ):
+                    base_output = (base_path, base_entry["families"])
+            tasks.append((input_path, output_path, base_output))
+
+    results = compile_files(
+        tasks,
+        vendors,
+        args.check,
+        jobs,
+        args.format,
+        args.normalize,
+    )
+
     all_ok = True
-    for input_path in input_files:
-        # Preserve version subdirectory structure in output
-        relative_path = input_path.relative_to(args.input_dir)
-        output_path = args.output_dir / relative_path
-        if not compile_file(input_path, output_path, vendors, args.check):
-            all_ok = False
+    with phase("manifest"):
+        for (input_path, output_path, manifest_key, source_hash), (ok, families) in zip(pending, results):
+            if ok:
+                source, dependencies = resolve_source(input_path)
+                vendor_ids = referenced_vendors(source)
+                cached_files[manifest_key] = {
+                    "source": source_hash,
+                    "output": file_digest(output_path),
+                    "layout": layout,
+                    "vendors": {
+                        vendor_id: vendor_digest(vendors, vendor_id)
+                        for vendor_id in sorted(vendor_ids)
+                    },
+                    "bases": {
+                        dependency_key(path, args.input_dir): file_digest(path)
+                        for path in dependencies
+                    },
+                    "families": families,
+                }
+            else:
+                cached_files.pop(manifest_key, None)
+                all_ok = False
+
+        manifest["vendor_index"] = build_vendor_index(cached_files)
+        save_manifest(manifest, manifest_path)
+
+    if args.catalog and not args.check and all_ok:
+        # Catalogs cover the whole generated tree, not just the files compiled now
+        generated_files = sorted(args.output_dir.glob("*.yaml"))
+        generated_files.extend(sorted(args.output_dir.glob("*/*.yaml")))
+        with phase("catalog"):
+            write_catalogs(
+                args.output_dir,
+                args.catalog_dir,
+                [path.relative_to(args.output_dir).as_posix() for path in generated_files],
+                force=args.no_cache,
+            )
+
+    if profiling:
+        report = profile_report(profile)
+        print("\n" + format_profile(report))
+        if args.profile_output:
+            write_profile(report, args.profile_output)
+            print(f"\nWrote profile to {args.profile_output}")
 
     if args.check and not all_ok:
         print("\nSome files are out of date. Run without --check to regenerate.")
         return 1
+    if not all_ok:
+        print("\nSome files failed to compile.")
+        return 1
 
     return 0
 
@@ -5,26 +5,58 @@ Optimal Configuration Compiler
 Compiles optimal config YAML files to JSON format for React consumption.
 
 Usage:
-    python compile_optimal_configs.py [--input-dir DIR] [--output-dir DIR] [--check]
+    python compile_optimal_configs.py [--input-dir DIR] [--output-dir DIR] [--check] [--jobs N]
+    python compile_optimal_configs.py --benchmarks DIR [--input-dir DIR] [--output-dir DIR]
+    python compile_optimal_configs.py --profile [--profile-output PATH] [--check]
+    python compile_optimal_configs.py --watch [--input-dir DIR] [--output-dir DIR]
 """
 
 import argparse
+import contextlib
+import io
 import json
 import logging
+import os
 import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
 
 import yaml
 
+from benchmark_results import attach_benchmarks, build_frontiers, load_runs
+from compile_models import describe_differences, profile_name, source_mtimes
+from config_schema import validate_optimal_config
+from profiling import (
+    active_profile,
+    format_profile,
+    merge_file,
+    phase,
+    profile_file,
+    profile_report,
+    record_counts,
+    start_profile,
+    write_profile,
+)
+
+# Use libyaml's C loader when available, falling back to pure Python
+try:
+    from yaml import CSafeLoader as YamlLoader
+except ImportError:
+    from yaml import SafeLoader as YamlLoader
+
 logging.basicConfig(level=logging.INFO, format='%(levelname)s: %(message)s')
 logger = logging.getLogger(__name__)
 
+# Config selector dimensions, in lookup nesting order
+UI_DIMENSIONS = ("hardware", "quantization", "gpu_count", "scenario")
+
 
 def load_yaml(path: Path) -> dict:
     """Load a YAML file."""
     try:
         with open(path) as f:
-            return yaml.safe_load(f)
+            return yaml.load(f, Loader=YamlLoader)
     except FileNotFoundError:
         logger.error(f"YAML file not found: {path}")
         raise
@@ -33,13 +65,17 @@ def load_yaml(path: Path) -> dict:
         raise
 
 
-def save_json(data: dict, path: Path) -> None:
-    """Save data to a JSON file."""
+def dump_json(data: dict) -> str:
+    """Serialize data to JSON text in the generated file format."""
+    return json.dumps(data, indent=2, ensure_ascii=False) + "\n"
+
+
+def save_json(text: str, path: Path) -> None:
+    """Save JSON text produced by dump_json to a file."""
     try:
         path.parent.mkdir(parents=True, exist_ok=True)
         with open(path, "w") as f:
-            json.dump(data, f, indent=2, ensure_ascii=False)
-            f.write("\n")
+            f.write(text)
     except OSError as e:
         logger.error(f"Failed to write JSON file {path}: {e}")
         raise
@@ -63,74 +99,260 @@ def add_metadata(source: dict, input_path: Path) -> dict:
 
 
 def validate_config(config: dict, filename: str) -> list[str]:
-    """Basic validation of the config structure."""
-    errors = []
+    """Validate a source config against the optimal config schema and its declared ui_options."""
+    errors = [f"{filename}: {error}" for error in validate_optimal_config(config)]
+    if errors:
+        return errors
+    for i, cfg in enumerate(config["configs"]):
+        errors.extend(undeclared_options(cfg, config["ui_options"], f"{filename} configs[{i}]"))
+    return errors
 
-    if "ui_options" not in config:
-        errors.append(f"{filename}: 'ui_options' is required")
-    else:
-        ui_opts = config["ui_options"]
-        for key in ["hardware", "quantization", "scenario", "gpu_count"]:
-            if key not in ui_opts:
-                errors.append(f"{filename}: 'ui_options.{key}' is required")
-            elif not isinstance(ui_opts[key], list):
-                errors.append(f"{filename}: 'ui_options.{key}' must be an array")
-
-    if "configs" not in config:
-        errors.append(f"{filename}: 'configs' is required")
-    elif not isinstance(config["configs"], list):
-        errors.append(f"{filename}: 'configs' must be an array")
-    else:
-        for i, cfg in enumerate(config["configs"]):
-            prefix = f"{filename} configs[{i}]"
-            if not cfg.get("hardware"):
-                errors.append(f"{prefix}: 'hardware' is required")
-            if not cfg.get("quantization"):
-                errors.append(f"{prefix}: 'quantization' is required")
-            if "gpu_count" not in cfg:
-                errors.append(f"{prefix}: 'gpu_count' is required")
-            if not cfg.get("scenario"):
-                errors.append(f"{prefix}: 'scenario' is required")
-            if not cfg.get("parameters"):
-                errors.append(f"{prefix}: 'parameters' is required")
-            elif not cfg["parameters"].get("model_path"):
-                errors.append(f"{prefix}: 'parameters.model_path' is required")
 
+def undeclared_options(cfg: dict, ui_opts: dict | None, prefix: str) -> list[str]:
+    """Report config dimension values that are not declared as ui_options IDs."""
+    errors = []
+    if not isinstance(ui_opts, dict):
+        return errors
+    for key in UI_DIMENSIONS:
+        options = ui_opts.get(key)
+        if not isinstance(options, list) or cfg.get(key) is None:
+            continue
+        declared = [option.get("id") for option in options if isinstance(option, dict)]
+        if cfg[key] not in declared:
+            errors.append(
+                f"{prefix}: {key} {cfg[key]!r} is not declared in ui_options.{key} {declared}"
+            )
     return errors
 
 
-def compile_file(input_path: Path, output_path: Path, check_only: bool = False) -> bool:
-    """Compile a single YAML file to JSON."""
+def build_lookup(config: dict) -> tuple[dict, dict]:
+    """
+    Index configs by the four UI dimensions.
+
+    Returns (lookup, available):
+    - lookup: hardware -> quantization -> gpu_count -> scenario -> index into
+      configs. gpu_count keys are strings, as JSON object keys must be. When
+      several configs share a combination, the first one wins.
+    - available: for each dimension, the ui_options IDs that at least one
+      config uses, in ui_options order.
+    """
+    lookup: dict = {}
+    used: dict[str, set] = {key: set() for key in UI_DIMENSIONS}
+    for index, cfg in enumerate(config["configs"]):
+        by_quant = lookup.setdefault(cfg["hardware"], {})
+        by_gpu_count = by_quant.setdefault(cfg["quantization"], {})
+        by_scenario = by_gpu_count.setdefault(str(cfg["gpu_count"]), {})
+        by_scenario.setdefault(cfg["scenario"], index)
+        for key in UI_DIMENSIONS:
+            used[key].add(cfg[key])
+
+    available = {
+        key: [
+            option["id"]
+            for option in config["ui_options"][key]
+            if option.get("id") in used[key]
+        ]
+        for key in UI_DIMENSIONS
+    }
+    return lookup, available
+
+
+def build_validity(config: dict) -> dict:
+    """
+    Compute the validity bitset of all ui_options combinations.
+
+    The matrix spans hardware x quantization x gpu_count x scenario, each axis
+    in ui_options order. A combination's bit index is the sum of its option
+    positions times the axis `strides` (row-major). Bit i is bit i % 8
+    (least significant first) of byte i // 8, and the bytes are written as a
+    lowercase hex string; a set bit means a config backs the combination.
+    """
+    axes = [
+        {option["id"]: position for position, option in enumerate(config["ui_options"][key])}
+        for key in UI_DIMENSIONS
+    ]
+    strides = []
+    size = 1
+    for axis in reversed(axes):
+        strides.insert(0, size)
+        size *= len(axis)
+
+    bits = bytearray((size + 7) // 8)
+    for cfg in config["configs"]:
+        index = sum(axis[cfg[key]] * stride for key, axis, stride in zip(UI_DIMENSIONS, axes, strides))
+        bits[index >> 3] |= 1 << (index & 7)
+    return {"dimensions": list(UI_DIMENSIONS), "strides": strides, "bits": bits.hex()}
+
+
+def compile_file(
+    input_path: Path,
+    output_path: Path,
+    check_only: bool = False,
+    benchmark_path: Path | None = None,
+) -> bool:
+    """Compile a single YAML file to JSON, attaching benchmark runs from benchmark_path if it exists."""
     print(f"Compiling {input_path.name}...")
 
-    source = load_yaml(input_path)
+    with phase("load"):
+        source = load_yaml(input_path)
     compiled = add_metadata(source, input_path)
 
-    errors = validate_config(compiled, input_path.name)
+    with phase("validate"):
+        errors = validate_config(compiled, input_path.name)
     if errors:
         for err in errors:
             print(f"  ERROR: {err}")
         return False
 
+    with phase("index"):
+        compiled["lookup"], compiled["available"] = build_lookup(compiled)
+        compiled["validity"] = build_validity(compiled)
+    record_counts(
+        configs=len(compiled["configs"]),
+        hardware=len(compiled["available"]["hardware"]),
+    )
+
+    if benchmark_path is not None and benchmark_path.exists():
+        try:
+            with phase("benchmarks"):
+                runs = load_runs(benchmark_path)
+                warnings = attach_benchmarks(compiled, runs)
+                frontiers = build_frontiers(runs)
+        except ValueError as e:
+            print(f"  ERROR: {e}")
+            return False
+        print(f"  Attaching {len(runs)} benchmark run(s) from {benchmark_path.name}")
+        for warning in warnings:
+            print(f"  WARNING: {warning}")
+        if frontiers:
+            compiled["frontiers"] = frontiers
+        record_counts(benchmark_runs=len(runs))
+
+    # The generated indexes and benchmark sections are validated with the rest
+    with phase("validate"):
+        errors = validate_optimal_config(compiled)
+    if errors:
+        for err in errors:
+            print(f"  ERROR: {input_path.name}: {err}")
+        return False
+
+    with phase("dump"):
+        serialized = dump_json(compiled)
+
     if check_only:
-        if output_path.exists():
-            with open(output_path) as f:
-                existing = json.load(f)
-            if existing == compiled:
-                print(f"  OK: {output_path.name} is up to date")
-                return True
-            else:
-                print(f"  FAIL: {output_path.name} is out of date")
-                return False
-        else:
+        if not output_path.exists():
             print(f"  FAIL: {output_path.name} does not exist")
             return False
 
-    save_json(compiled, output_path)
+        # Compare serialized text; parse the existing JSON only to explain a mismatch
+        with phase("check"):
+            existing_text = output_path.read_text()
+            unchanged = existing_text == serialized
+        if unchanged:
+            print(f"  OK: {output_path.name} is up to date")
+            return True
+
+        print(f"  FAIL: {output_path.name} is out of date")
+        try:
+            differences = describe_differences(compiled, json.loads(existing_text))
+        except ValueError as e:
+            differences = [f"invalid JSON: {e}"]
+        if not differences:
+            differences = ["formatting differs from compiler output"]
+        for difference in differences:
+            print(f"    {difference}")
+        return False
+
+    with phase("write"):
+        save_json(serialized, output_path)
     print(f"  Wrote {output_path}")
     return True
 
 
+def try_compile_file(
+    input_path: Path,
+    output_path: Path,
+    check_only: bool = False,
+    benchmark_path: Path | None = None,
+) -> bool:
+    """Compile a single file, reporting an exception as a failed compile whatever --jobs is."""
+    try:
+        return compile_file(input_path, output_path, check_only, benchmark_path)
+    except Exception as e:
+        print(f"  ERROR: {input_path.name}: {type(e).__name__}: {e}")
+        return False
+
+
+def compile_file_captured(
+    input_path: Path,
+    output_path: Path,
+    check_only: bool = False,
+    benchmark_path: Path | None = None,
+    profile: bool = False,
+) -> tuple[bool, str, dict | None]:
+    """Compile a single file in a worker process, capturing its output and profile record."""
+    buffer = io.StringIO()
+    worker_profile = start_profile() if profile else None
+    with contextlib.redirect_stdout(buffer), profile_file(profile_name(input_path)):
+        ok = try_compile_file(input_path, output_path, check_only, benchmark_path)
+    record = worker_profile.files[profile_name(input_path)] if worker_profile else None
+    return ok, buffer.getvalue(), record
+
+
+def compile_files(
+    tasks: list[tuple[Path, Path, Path | None]], check_only: bool, jobs: int
+) -> list[bool]:
+    """Compile (input_path, output_path, benchmark_path) tasks, printing results in task order."""
+    if jobs <= 1 or len(tasks) <= 1:
+        results = []
+        for input_path, output_path, benchmark_path in tasks:
+            with profile_file(profile_name(input_path)):
+                results.append(try_compile_file(input_path, output_path, check_only, benchmark_path))
+        return results
+
+    profile = active_profile()
+    results = []
+    with ProcessPoolExecutor(max_workers=min(jobs, len(tasks))) as executor:
+        futures = [
+            executor.submit(
+                compile_file_captured,
+                input_path,
+                output_path,
+                check_only,
+                benchmark_path,
+                profile is not None,
+            )
+            for input_path, output_path, benchmark_path in tasks
+        ]
+        for (input_path, _, _), future in zip(tasks, futures):
+            ok, output, record = future.result()
+            print(output, end="")
+            if record is not None:
+                merge_file(profile, profile_name(input_path), record)
+            results.append(ok)
+    return results
+
+
+def watch(input_dir: Path, output_dir: Path, interval: float = 0.5) -> int:
+    """Recompile each optimal config source when it changes. Runs until interrupted."""
+    mtimes: dict[Path, int] = {}
+    print(f"Watching {input_dir} for changes (Ctrl+C to stop)")
+    try:
+        while True:
+            current = source_mtimes(input_dir)
+            for path in sorted(path for path, mtime in current.items() if mtimes.get(path) != mtime):
+                output_path = output_dir / path.relative_to(input_dir).with_suffix(".json")
+                try:
+                    compile_file(path, output_path)
+                except (OSError, yaml.YAMLError) as e:
+                    print(f"  ERROR: {path.name}: {e}")
+            mtimes = current
+            time.sleep(interval)
+    except KeyboardInterrupt:
+        print("\nStopped watching")
+    return 0
+
+
 def main() -> int:
     parser = argparse.ArgumentParser(
         description="Compile optimal config YAML to JSON format"
@@ -150,30 +372,87 @@ def main() -> int:
         action="store_true",
         help="Check if generated files are up to date without writing",
     )
+    parser.add_argument(
+        "--jobs",
+        "-j",
+        type=int,
+        default=1,
+        help="Number of worker processes (0 uses all CPUs, default: 1)",
+    )
+    parser.add_argument(
+        "--watch",
+        action="store_true",
+        help="Keep running and recompile sources when they change",
+    )
+    parser.add_argument(
+        "--benchmarks",
+        type=Path,
+        help="Directory of bench_serving JSONL results mirroring the source layout "
+        "(e.g. DIR/v0.5.6/deepseek-r1.jsonl) to attach to configs",
+    )
+    parser.add_argument(
+        "--profile",
+        action="store_true",
+        help="Print per-phase and per-file timings, output counts and peak memory",
+    )
+    parser.add_argument(
+        "--profile-output",
+        type=Path,
+        metavar="PATH",
+        help="Also write the --profile report as JSON to PATH (implies --profile)",
+    )
     parser.add_argument("files", nargs="*")
 
     args = parser.parse_args()
 
+    profiling = args.profile or args.profile_output is not None
+
+    if args.watch:
+        if args.check or args.files or args.benchmarks or profiling:
+            parser.error(
+                "--watch cannot be combined with --check, --benchmarks, --profile or explicit files"
+            )
+        return watch(args.input_dir, args.output_dir)
+
+    if profiling:
+        profile = start_profile()
+
     if args.files:
         input_files = [Path(f) for f in args.files]
     else:
-        input_files = list(args.input_dir.glob("*.yaml"))
-        input_files.extend(args.input_dir.glob("*/*.yaml"))
+        input_files = sorted(args.input_dir.glob("*.yaml"))
+        input_files.extend(sorted(args.input_dir.glob("*/*.yaml")))
 
     if not input_files:
         print(f"No YAML files found in {args.input_dir}")
         return 1
 
-    all_ok = True
+    jobs = args.jobs if args.jobs > 0 else (os.cpu_count() or 1)
+
+    tasks = []
     for input_path in input_files:
         relative_path = input_path.relative_to(args.input_dir)
         output_path = args.output_dir / relative_path.with_suffix(".json")
-        if not compile_file(input_path, output_path, args.check):
-            all_ok = False
+        benchmark_path = None
+        if args.benchmarks:
+            benchmark_path = args.benchmarks / relative_path.with_suffix(".jsonl")
+        tasks.append((input_path, output_path, benchmark_path))
+
+    all_ok = all(compile_files(tasks, args.check, jobs))
+
+    if profiling:
+        report = profile_report(profile)
+        print("\n" + format_profile(report))
+        if args.profile_output:
+            write_profile(report, args.profile_output)
+            print(f"\nWrote profile to {args.profile_output}")
 
     if args.check and not all_ok:
         print("\nSome files are out of date. Run without --check to regenerate.")
         return 1
+    if not all_ok:
+        print("\nSome files failed to compile.")
+        return 1
 
     return 0
 
@@ -0,0 +1,656 @@
+"""
+Compiled Config Schemas
+
+Schemas of the documents the compilers emit, mirroring data/schema/types.ts
+(generated model configs) and data/schema/optimal-config-types.ts (generated
+optimal configs), and a compiler that turns them into validator functions.
+
+Schemas are written in a subset of JSON Schema:
+- type: "object", "array", "string", "integer", "number", "boolean" or
+  "null", or a list of them (integer and number exclude booleans)
+- enum, minimum, minLength, pattern
+- properties, required, additionalProperties (False or a schema)
+- items, and itemKey: the field that names array items in error paths,
+  e.g. models[DeepSeek-R1] instead of models[3]
+- anyOf, with an optional message reported when no branch matches
+
+compile_schema turns a schema into nested closures once: enums become sets,
+patterns are compiled, property checks become (key, validator) tuples. The
+module validators are compiled at import, so each process pays for it once
+and validating a document does no schema lookups.
+
+Validators return a list of errors, empty when the value is valid. Error
+paths are assembled only on the way out of a failing branch, so valid
+documents allocate no paths. Rendered errors read:
+
+    families[DeepSeek].models[DeepSeek-R1-0528].hardware.B200.configurations[default].engine.tp: must be >= 1, got 0
+"""
+
+import re
+from typing import Any, Callable
+
+from benchmark_results import BENCHMARK_METRICS
+
+# A validator returns errors as (reversed path segments, message) pairs
+Validator = Callable[[Any], list]
+
+JSON_TYPES = {
+    "object": lambda value: isinstance(value, dict),
+    "array": lambda value: isinstance(value, list),
+    "string": lambda value: isinstance(value, str),
+    "integer": lambda value: isinstance(value, int) and not isinstance(value, bool),
+    "number": lambda value: isinstance(value, (int, float)) and not isinstance(value, bool),
+    "boolean": lambda value: isinstance(value, bool),
+    "null": lambda value: value is None,
+}
+
+
+# =============================================================================
+# Schema Compiler
+# =============================================================================
+
+
+def type_name(value: Any) -> str:
+    """Name the JSON type of a value, with the value itself for scalars."""
+    if value is None:
+        return "null"
+    if isinstance(value, dict):
+        return "object"
+    if isinstance(value, list):
+        return "array"
+    if isinstance(value, bool):
+        return f"boolean {str(value).lower()}"
+    if isinstance(value, (int, float)):
+        return f"number {value!r}"
+    if isinstance(value, str):
+        return f"string {value!r}"
+    return type(value).__name__
+
+
+def prefix_errors(errors: list, segment: str) -> list:
+    """Add a path segment to errors returned by a child validator."""
+    for path, _ in errors:
+        path.append(segment)
+    return errors
+
+
+def compile_schema(schema: dict, compiled: dict[int, Validator] | None = None) -> Validator:
+    """
+    Compile a schema into a validator function.
+
+    Args:
+        schema: Schema in the subset described in the module docstring
+        compiled: Validators already compiled in this pass, by schema id, so a
+            sub-schema used in several places is compiled once
+
+    Returns:
+        Function taking a value and returning its errors (empty if valid)
+    """
+    if compiled is None:
+        compiled = {}
+    if id(schema) in compiled:
+        return compiled[id(schema)]
+
+    checks: list[Validator] = []
+
+    types = schema.get("type")
+    if types is not None:
+        types = [types] if isinstance(types, str) else list(types)
+        type_checks = tuple(JSON_TYPES[name] for name in types)
+        expected = " or ".join(types)
+
+        def check_type(value: Any) -> list:
+            for matches in type_checks:
+                if matches(value):
+                    return []
+            return [([], f"must be {expected}, got {type_name(value)}")]
+
+        checks.append(check_type)
+
+    if "enum" in schema:
+        allowed = frozenset(schema["enum"])
+        listed = ", ".join(str(option) for option in schema["enum"])
+
+        def check_enum(value: Any) -> list:
+            if isinstance(value, (dict, list)) or value not in allowed:
+                return [([], f"must be one of {listed}, got {type_name(value)}")]
+            return []
+
+        checks.append(check_enum)
+
+    if "minimum" in schema:
+        minimum = schema["minimum"]
+
+        def check_minimum(value: Any) -> list:
+            if JSON_TYPES["number"](value) and value < minimum:
+                return [([], f"must be >= {minimum}, got {value!r}")]
+            return []
+
+        checks.append(check_minimum)
+
+    if "minLength" in schema:
+        min_length = schema["minLength"]
+        message = "must not be empty" if min_length == 1 else f"must have at least {min_length} characters"
+
+        def check_min_length(value: Any) -> list:
+            if isinstance(value, str) and len(value) < min_length:
+                return [([], message)]
+            return []
+
+        checks.append(check_min_length)
+
+    if "pattern" in schema:
+        pattern = re.compile(schema["pattern"])
+
+        def check_pattern(value: Any) -> list:
+            if isinstance(value, str) and pattern.search(value) is None:
+                return [([], f"must match {pattern.pattern}, got {type_name(value)}")]
+            return []
+
+        checks.append(check_pattern)
+
+    if "required" in schema:
+        required = tuple(schema["required"])
+
+        def check_required(value: Any) -> list:
+            if not isinstance(value, dict):
+                return []
+            return [([key], "is required") for key in required if key not in value]
+
+        checks.append(check_required)
+
+    if "properties" in schema or "additionalProperties" in schema:
+        properties = {
+            key: compile_schema(subschema, compiled)
+            for key, subschema in schema.get("properties", {}).items()
+        }
+        additional = schema.get("additionalProperties", True)
+        if isinstance(additional, dict):
+            additional = compile_schema(additional, compiled)
+
+        def check_properties(value: Any) -> list:
+            if not isinstance(value, dict):
+                return []
+            errors = []
+            for key, item in value.items():
+                validate = properties.get(key)
+                if validate is None:
+                    if additional is False:
+                        errors.append(([str(key)], "is not allowed"))
+                        continue
+                    if additional is True:
+                        continue
+                    validate = additional
+                item_errors = validate(item)
+                if item_errors:
+                    errors.extend(prefix_errors(item_errors, str(key)))
+            return errors
+
+        checks.append(check_properties)
+
+    if "items" in schema:
+        validate_item = compile_schema(schema["items"], compiled)
+        item_key = schema.get("itemKey")
+
+        def check_items(value: Any) -> list:
+            if not isinstance(value, list):
+                return []
+            errors = []
+            for index, item in enumerate(value):
+                item_errors = validate_item(item)
+                if item_errors:
+                    label = index
+                    if item_key is not None and isinstance(item, dict) and isinstance(item.get(item_key), (str, int)):
+                        label = item[item_key]
+                    errors.extend(prefix_errors(item_errors, f"[{label}]"))
+            return errors
+
+        checks.append(check_items)
+
+    if "anyOf" in schema:
+        branches = tuple(compile_schema(branch, compiled) for branch in schema["anyOf"])
+        message = schema.get("message", "does not match any allowed form")
+
+        def check_any_of(value: Any) -> list:
+            for validate in branches:
+                if not validate(value):
+                    return []
+            return [([], message)]
+
+        checks.append(check_any_of)
+
+    # Later checks assume the type matched, so a type error ends validation
+    if not checks:
+        validator = lambda value: []  # noqa: E731
+    elif len(checks) == 1:
+        validator = checks[0]
+    elif types is not None:
+        first, rest = checks[0], tuple(checks[1:])
+
+        def validator(value: Any) -> list:
+            errors = first(value)
+            if errors:
+                return errors
+            for check in rest:
+                errors.extend(check(value))
+            return errors
+    else:
+        all_checks = tuple(checks)
+
+        def validator(value: Any) -> list:
+            errors = []
+            for check in all_checks:
+                errors.extend(check(value))
+            return errors
+
+    compiled[id(schema)] = validator
+    return validator
+
+
+def format_errors(errors: list) -> list[str]:
+    """Render validator errors as 'path: message' lines."""
+    lines = []
+    for path, message in errors:
+        rendered = ""
+        for segment in reversed(path):
+            rendered += segment if segment.startswith("[") else f".{segment}" if rendered else segment
+        lines.append(f"{rendered}: {message}" if rendered else message)
+    return lines
+
+
+# =============================================================================
+# Model Config Schema (types.ts)
+# =============================================================================
+
+
+NAME = {"type": "string", "minLength": 1}
+OPTIONAL_STRING = {"type": ["string", "null"]}
+
+ENGINE_CONFIG = {
+    "type": "object",
+    "properties": {
+        "env_vars": {"type": ["object", "null"], "additionalProperties": {"type": "string"}},
+        "tp": {"type": "integer", "minimum": 1},
+        "dp": {"type": ["integer", "null"], "minimum": 1},
+        "ep": {"type": ["integer", "null"], "minimum": 1},
+        "enable_dp_attention": {"type": ["boolean", "null"]},
+        "extra_args": {"type": ["array", "null"], "items": {"type": "string"}},
+    },
+    "required": ["tp"],
+    "additionalProperties": False,
+}
+
+OPTIONAL_ENGINE_CONFIG = dict(ENGINE_CONFIG, type=["object", "null"])
+
+RESOURCE_ESTIMATE = {
+    "type": "object",
+    "properties": {
+        "gpus": {"type": "integer", "minimum": 1},
+        "nodes": {"type": "integer", "minimum": 1},
+        "weight_memory_gb": {"type": "number"},
+        "weight_memory_per_gpu_gb": {"type": "number"},
+        "kv_cache_headroom_per_gpu_gb": {"type": "number"},
+        "max_concurrent_tokens": {"type": "integer"},
+        "fits": {"type": "boolean"},
+    },
+    "required": [
+        "gpus",
+        "nodes",
+        "weight_memory_gb",
+        "weight_memory_per_gpu_gb",
+        "kv_cache_headroom_per_gpu_gb",
+        "fits",
+    ],
+    "additionalProperties": False,
+}
+
+CONFIG_ATTRIBUTES = {
+    "type": "object",
+    "properties": {
+        "nodes": {"enum": ["single", "multi"]},
+        "optimization": {"enum": ["balanced", "low-latency", "high-throughput"]},
+        "quantization": {"enum": ["fp8", "int4", "bf16", "fp4", "mxfp4", "nvfp4"]},
+    },
+    "required": ["nodes", "optimization", "quantization"],
+    "additionalProperties": False,
+}
+
+NAMED_CONFIGURATION = {
+    "type": "object",
+    "properties": {
+        "name": NAME,
+        "attributes": CONFIG_ATTRIBUTES,
+        "quantized_model_path": OPTIONAL_STRING,
+        "engine": OPTIONAL_ENGINE_CONFIG,
+        "prefill": OPTIONAL_ENGINE_CONFIG,
+        "decode": OPTIONAL_ENGINE_CONFIG,
+        "estimate": RESOURCE_ESTIMATE,
+    },
+    "required": ["name", "attributes"],
+    "additionalProperties": False,
+    # Either engine alone or prefill and decode together
+    "anyOf": [
+        {
+            "properties": {"engine": {"type": "object"}, "prefill": {"type": "null"}, "decode": {"type": "null"}},
+            "required": ["engine"],
+        },
+        {
+            "properties": {"engine": {"type": "null"}, "prefill": {"type": "object"}, "decode": {"type": "object"}},
+            "required": ["prefill", "decode"],
+        },
+    ],
+    "message": "must set either engine, or both prefill and decode",
+}
+
+HARDWARE_CONFIG = {
+    "type": "object",
+    "properties": {
+        "configurations": {"type": "array", "items": NAMED_CONFIGURATION, "itemKey": "name"},
+    },
+    "required": ["configurations"],
+    "additionalProperties": False,
+}
+
+LLM_ATTRIBUTES = {
+    "type": "object",
+    "properties": {
+        "thinking_capability": {"enum": ["non_thinking", "thinking", "hybrid"]},
+        "tool_parser": OPTIONAL_STRING,
+        "reasoning_parser": OPTIONAL_STRING,
+        "chat_template": OPTIONAL_STRING,
+    },
+    "required": ["thinking_capability"],
+    "additionalProperties": False,
+}
+
+DIFFUSION_ATTRIBUTES = {
+    "type": "object",
+    "properties": {
+        "model_type": {"enum": ["image", "video", "image_edit"]},
+        "task_types": {"type": ["array", "null"], "items": {"type": "string"}},
+        "supports_lora": {"type": ["boolean", "null"]},
+        "ulysses_degree": {"type": ["integer", "null"], "minimum": 1},
+        "ring_degree": {"type": ["integer", "null"], "minimum": 1},
+        "dit_layerwise_offload": {"type": ["boolean", "null"]},
+    },
+    "required": ["model_type"],
+    "additionalProperties": False,
+}
+
+MODEL = {
+    "type": "object",
+    "properties": {
+        "name": NAME,
+        "model_path": NAME,
+        "speculative_draft_model": OPTIONAL_STRING,
+        "attributes": {
+            "type": "object",
+            "properties": {"llm": LLM_ATTRIBUTES, "diffusion": DIFFUSION_ATTRIBUTES},
+            "additionalProperties": False,
+            "anyOf": [{"required": ["llm"]}, {"required": ["diffusion"]}],
+            "message": "must have either llm or diffusion",
+        },
+        "hardware": {"type": "object", "additionalProperties": HARDWARE_CONFIG},
+    },
+    "required": ["name", "model_path", "attributes", "hardware"],
+    "additionalProperties": False,
+}
+
+MODEL_FAMILY = {
+    "type": "object",
+    "properties": {
+        "name": NAME,
+        "description": OPTIONAL_STRING,
+        "models": {"type": "array", "items": MODEL, "itemKey": "name"},
+    },
+    "required": ["name", "models"],
+    "additionalProperties": False,
+}
+
+# VendorConfig: one generated model config file
+MODEL_CONFIG_SCHEMA = {
+    "type": "object",
+    "properties": {
+        "vendor": NAME,
+        "families": {"type": "array", "items": MODEL_FAMILY, "itemKey": "name"},
+    },
+    "required": ["vendor", "families"],
+    "additionalProperties": False,
+}
+
+
+# =============================================================================
+# Optimal Config Schema (optimal-config-types.ts)
+# =============================================================================
+
+
+SCENARIO = {"enum": ["low-latency", "high-throughput"]}
+UI_DIMENSIONS = ("hardware", "quantization", "gpu_count", "scenario")
+
+UI_OPTION = {
+    "type": "object",
+    "properties": {
+        "id": {"type": ["string", "number"]},
+        "label": NAME,
+        "subtitle": {"type": "string"},
+        "default": {"type": "boolean"},
+    },
+    "required": ["id", "label", "default"],
+    "additionalProperties": False,
+}
+
+# Server parameters map to SGLang flags, so parameters not listed here are
+# allowed as long as they are scalars
+SERVER_PARAMETER_PROPERTIES = {
+    "model_path": NAME,
+    "env_vars": {"type": "string"},
+    "trust_remote_code": {"type": "boolean"},
+    "tensor_parallel_size": {"type": "integer", "minimum": 1},
+    "data_parallel_size": {"type": "integer", "minimum": 1},
+    "ep_size": {"type": "integer", "minimum": 1},
+    "cuda_graph_max_bs": {"type": "integer"},
+    "max_running_requests": {"type": "integer"},
+    "mem_fraction_static": {"type": "number"},
+    "kv_cache_dtype": {"type": "string"},
+    "chunked_prefill_size": {"type": "integer"},
+    "max_prefill_tokens": {"type": "integer"},
+    "enable_flashinfer_allreduce_fusion": {"type": "boolean"},
+    "scheduler_recv_interval": {"type": "integer"},
+    "enable_symm_mem": {"type": "boolean"},
+    "disable_radix_cache": {"type": "boolean"},
+    "attention_backend": {"type": "string"},
+    "moe_runner_backend": {"type": "string"},
+    "stream_interval": {"type": "integer"},
+    "quantization": {"type": "string"},
+    "decode_log_interval": {"type": "integer"},
+    "fp8_gemm_backend": {"type": "string"},
+}
+
+SERVER_PARAMETER_VALUE = {"type": ["string", "number", "boolean"]}
+
+SERVER_PARAMETERS = {
+    "type": "object",
+    "properties": SERVER_PARAMETER_PROPERTIES,
+    "required": ["model_path", "tensor_parallel_size"],
+    "additionalProperties": SERVER_PARAMETER_VALUE,
+}
+
+PARTIAL_SERVER_PARAMETERS = {
+    "type": "object",
+    "properties": SERVER_PARAMETER_PROPERTIES,
+    "additionalProperties": SERVER_PARAMETER_VALUE,
+}
+
+METRIC = {"enum": list(BENCHMARK_METRICS)}
+
+BENCHMARK_METRICS_SCHEMA = {
+    "type": "object",
+    "properties": {metric: {"type": "number"} for metric in BENCHMARK_METRICS},
+    "additionalProperties": False,
+}
+
+BENCHMARK_SUMMARY = {
+    "type": "object",
+    "properties": {
+        "objective": METRIC,
+        "runs": {"type": "integer", "minimum": 1},
+        "measured": dict(BENCHMARK_METRICS_SCHEMA, type=["object", "null"]),
+        "best": {
+            "type": "object",
+            "properties": {"parameters": PARTIAL_SERVER_PARAMETERS, "metrics": BENCHMARK_METRICS_SCHEMA},
+            "required": ["parameters", "metrics"],
+            "additionalProperties": False,
+        },
+        "is_best": {"type": "boolean"},
+    },
+    "required": ["runs", "measured"],
+    "additionalProperties": False,
+}
+
+OPTIMAL_CONFIG = {
+    "type": "object",
+    "properties": {
+        "hardware": NAME,
+        "quantization": NAME,
+        "gpu_count": {"type": "integer", "minimum": 1},
+        "scenario": SCENARIO,
+        "parameters": SERVER_PARAMETERS,
+        "benchmark": BENCHMARK_SUMMARY,
+    },
+    "required": ["hardware", "quantization", "gpu_count", "scenario", "parameters"],
+    "additionalProperties": False,
+}
+
+STRING_OR_STRINGS = {"type": ["string", "array"], "minLength": 1, "items": NAME}
+
+VALIDATION_RULE = {
+    "type": "object",
+    "properties": {"hardware": STRING_OR_STRINGS, "quantization": STRING_OR_STRINGS, "error": NAME},
+    "required": ["hardware", "quantization", "error"],
+    "additionalProperties": False,
+}
+
+FRONTIER_POINT = {
+    "type": "object",
+    "properties": {
+        "parameters": PARTIAL_SERVER_PARAMETERS,
+        "scenario": SCENARIO,
+        "metrics": BENCHMARK_METRICS_SCHEMA,
+    },
+    "required": ["parameters", "metrics"],
+    "additionalProperties": False,
+}
+
+POINT_INDEX = {"type": "integer", "minimum": 0}
+
+PARETO_FRONTIER = {
+    "type": "object",
+    "properties": {
+        "hardware": NAME,
+        "quantization": NAME,
+        "gpu_count": {"type": "integer", "minimum": 1},
+        "axes": {
+            "type": "object",
+            "properties": {"throughput": METRIC, "latency": METRIC},
+            "required": ["throughput", "latency"],
+            "additionalProperties": False,
+        },
+        "points": {"type": "array", "items": FRONTIER_POINT},
+        "scenarios": {
+            "type": "object",
+            "properties": {"low-latency": POINT_INDEX, "high-throughput": POINT_INDEX},
+            "required": ["low-latency", "high-throughput"],
+            "additionalProperties": False,
+        },
+    },
+    "required": ["hardware", "quantization", "gpu_count", "axes", "points", "scenarios"],
+    "additionalProperties": False,
+}
+
+
+def nested_lookup(depth: int) -> dict:
+    """Schema of a lookup map nested depth levels deep, ending in config indexes."""
+    schema = {"type": "integer", "minimum": 0}
+    for _ in range(depth):
+        schema = {"type": "object", "additionalProperties": schema}
+    return schema
+
+
+# OptimalConfigFile: one generated optimal config file
+OPTIMAL_CONFIG_SCHEMA = {
+    "type": "object",
+    "properties": {
+        "model": NAME,
+        "version": NAME,
+        "ui_options": {
+            "type": "object",
+            "properties": {
+                key: {"type": "array", "items": UI_OPTION, "itemKey": "id"} for key in UI_DIMENSIONS
+            },
+            "required": list(UI_DIMENSIONS),
+            "additionalProperties": False,
+        },
+        "configs": {"type": "array", "items": OPTIMAL_CONFIG},
+        "validation": {"type": "array", "items": VALIDATION_RULE},
+        "lookup": nested_lookup(len(UI_DIMENSIONS)),
+        "available": {
+            "type": "object",
+            "properties": {
+                "hardware": {"type": "array", "items": {"type": "string"}},
+                "quantization": {"type": "array", "items": {"type": "string"}},
+                "gpu_count": {"type": "array", "items": {"type": "integer"}},
+                "scenario": {"type": "array", "items": {"type": "string"}},
+            },
+            "required": list(UI_DIMENSIONS),
+            "additionalProperties": False,
+        },
+        "validity": {
+            "type": "object",
+            "properties": {
+                "dimensions": {"type": "array", "items": {"enum": list(UI_DIMENSIONS)}},
+                "strides": {"type": "array", "items": {"type": "integer"}},
+                "bits": {"type": "string", "pattern": "^([0-9a-f]{2})*$"},
+            },
+            "required": ["dimensions", "strides", "bits"],
+            "additionalProperties": False,
+        },
+        "frontiers": {"type": "array", "items": PARETO_FRONTIER},
+    },
+    "required": ["model", "version", "ui_options", "configs"],
+    "additionalProperties": False,
+}
+
+
+# =============================================================================
+# Validators
+# =============================================================================
+
+
+_model_config_validator = compile_schema(MODEL_CONFIG_SCHEMA)
+_optimal_config_validator = compile_schema(OPTIMAL_CONFIG_SCHEMA)
+
+
+def validate_model_config(document: dict) -> list[str]:
+    """
+    Validate a compiled model config document against MODEL_CONFIG_SCHEMA.
+
+    Args:
+        document: Compiled document in the full schema shape (not normalized)
+
+    Returns:
+        Errors as 'path: message' lines, empty if the document is valid
+    """
+    return format_errors(_model_config_validator(document))
+
+
+def validate_optimal_config(document: dict) -> list[str]:
+    """
+    Validate an optimal config document against OPTIMAL_CONFIG_SCHEMA.
+
+    Args:
+        document: Optimal config document, with or without its generated indexes
+
+    Returns:
+        Errors as 'path: message' lines, empty if the document is valid
+    """
+    return format_errors(_optimal_config_validator(document))
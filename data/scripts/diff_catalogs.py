@@ -0,0 +1,286 @@
+#!/usr/bin/env python3
+"""
+Compiled Config Diff
+
+Reports the semantic differences between two sets of compiled model configs,
+such as two SGLang version folders under data/models/generated/:
+
+    ~ DeepSeek / DeepSeek-R1-0528 / B200 / default: engine.tp 8 -> 4
+    + DeepSeek / DeepSeek-R1-0528 / B300: added
+    ~ Qwen3 / Qwen3-235B-A22B / H200 / default: engine.extra_args --chunked-prefill-size ["8192"] -> ["4096"]
+
+Usage:
+    python diff_catalogs.py OLD NEW [--json]
+
+OLD and NEW are generated files (.yaml, or .cbor from --format cbor) or
+directories of them. Models are matched by family and model name, not by
+file, so a model that moved to another file is compared with its old self.
+
+Files present on both sides with identical content are skipped without being
+parsed. The rest of each side is hashed into a Merkle tree: families, models,
+hardware entries and configurations are keyed by name, every other dict by key,
+and extra_args by flag. A node's hash covers its key and its children's
+hashes. Named lists hash in list order, since the order is significant (the
+first configuration is the default); a reordering is reported as such. Dict
+keys and flags hash in sorted order. The diff descends only into children
+whose hashes differ, so the walk costs O(changed nodes), while hashing costs
+O(nodes in changed files).
+
+Exits with 1 when differences are found, like diff.
+"""
+
+import argparse
+import hashlib
+import json
+import sys
+from pathlib import Path
+from typing import Any, Iterator
+
+from compact_format import load_compact
+from compile_models import ExtraArgs, OUTPUT_FORMATS, inflate_config, load_yaml
+
+# Keys whose children are named entries (families, models, hardware, configurations)
+NAMED_KEYS = ("families", "models", "hardware", "configurations")
+
+# Keys whose lists are server flags, diffed flag by flag
+FLAG_LIST_KEYS = ("extra_args",)
+
+
+class MerkleNode:
+    """A subtree of a compiled document with the hash of its contents."""
+
+    __slots__ = ("digest", "value", "children", "ordered")
+
+    def __init__(
+        self,
+        digest: bytes,
+        value: Any,
+        children: dict[str, "MerkleNode"] | None,
+        ordered: bool = False,
+    ) -> None:
+        self.digest = digest
+        self.value = value
+        self.children = children
+        self.ordered = ordered
+
+
+# =============================================================================
+# Merkle Trees
+# =============================================================================
+
+
+def leaf_digest(value: Any) -> bytes:
+    """Hash a leaf value by its canonical JSON form."""
+    canonical = json.dumps(value, sort_keys=True, ensure_ascii=False, default=str)
+    return hashlib.sha256(canonical.encode()).digest()
+
+
+def named_children(items: list) -> dict[str, Any] | None:
+    """Key a list of named dicts by name, or None if it is not one."""
+    if not all(isinstance(item, dict) and "name" in item for item in items):
+        return None
+    keyed: dict[str, Any] = {}
+    for item in items:
+        key = str(item["name"])
+        # Duplicate names stay distinct, in order
+        suffix = 2
+        while key in keyed:
+            key = f"{item['name']}#{suffix}"
+            suffix += 1
+        keyed[key] = item
+    return keyed
+
+
+def build_tree(value: Any, key: str | None = None) -> MerkleNode:
+    """
+    Hash a compiled value into a Merkle tree.
+
+    Args:
+        value: Compiled document, or a value inside one
+        key: Key the value is stored under in its parent, if any
+
+    Returns:
+        Root node; leaves hold scalars and lists that are not keyed
+    """
+    entries = None
+    ordered = False
+    if isinstance(value, dict):
+        entries = value
+    elif isinstance(value, list) and key in NAMED_KEYS:
+        entries = named_children(value)
+        ordered = entries is not None
+    elif isinstance(value, list) and key in FLAG_LIST_KEYS:
+        try:
+            entries = ExtraArgs(value).flags
+        except ValueError:
+            entries = None
+
+    if entries is None:
+        return MerkleNode(leaf_digest(value), value, None)
+
+    children = {str(child_key): build_tree(child, str(child_key)) for child_key, child in entries.items()}
+    digest = hashlib.sha256()
+    # Named lists hash in list order; dict keys and flags in key order, so
+    # reordering those alone is not a change
+    for child_key in children if ordered else sorted(children):
+        digest.update(child_key.encode())
+        digest.update(b"\0")
+        digest.update(children[child_key].digest)
+    return MerkleNode(digest.digest(), value, children, ordered)
+
+
+def generated_files(path: Path) -> dict[str, Path]:
+    """List the generated files of a file or directory, keyed by file name."""
+    if path.is_dir():
+        files = sorted(
+            file for suffix in OUTPUT_FORMATS.values() for file in path.glob(f"*{suffix}")
+        )
+    else:
+        files = [path]
+    return {file.name: file for file in files}
+
+
+def unchanged_files(old: dict[str, Path], new: dict[str, Path]) -> set[str]:
+    """Names of the files present on both sides with identical content."""
+    unchanged = set()
+    for name in old.keys() & new.keys():
+        old_path, new_path = old[name], new[name]
+        if old_path.stat().st_size != new_path.stat().st_size:
+            continue
+        if old_path.read_bytes() == new_path.read_bytes():
+            unchanged.add(name)
+    return unchanged
+
+
+def load_documents(files: list[Path]) -> list[dict]:
+    """Load compiled documents from generated files."""
+    documents = []
+    for file in files:
+        if file.suffix == OUTPUT_FORMATS["cbor"]:
+            document = load_compact(file.read_bytes())
+        else:
+            document = load_yaml(file)
+        documents.append(inflate_config(document))
+    return documents
+
+
+def build_catalog_tree(documents: list[dict]) -> MerkleNode:
+    """Hash the families of several compiled documents into one tree keyed by family name."""
+    families = [family for document in documents for family in document.get("families", [])]
+    return build_tree({"families": families})
+
+
+# =============================================================================
+# Diffing
+# =============================================================================
+
+
+def diff_trees(old: MerkleNode, new: MerkleNode, path: tuple = ()) -> Iterator[dict]:
+    """
+    Yield the changes between two trees, descending only into differing subtrees.
+
+    Each change has an op ("added", "removed", "changed" or "reordered"), the
+    path of keys from the root, and the old and/or new value. A reordered
+    change is reported on a named list and holds the names the two sides
+    share, in each side's order.
+    """
+    if old.digest == new.digest:
+        return
+    if old.children is None or new.children is None:
+        yield {"op": "changed", "path": list(path), "old": old.value, "new": new.value}
+        return
+    for key, old_child in old.children.items():
+        new_child = new.children.get(key)
+        if new_child is None:
+            yield {"op": "removed", "path": list(path + (key,)), "old": old_child.value}
+        else:
+            yield from diff_trees(old_child, new_child, path + (key,))
+    for key, new_child in new.children.items():
+        if key not in old.children:
+            yield {"op": "added", "path": list(path + (key,)), "new": new_child.value}
+    if old.ordered and new.ordered:
+        old_order = [key for key in old.children if key in new.children]
+        new_order = [key for key in new.children if key in old.children]
+        if old_order != new_order:
+            yield {"op": "reordered", "path": list(path), "old": old_order, "new": new_order}
+
+
+def format_path(path: list[str]) -> str:
+    """Render a change path as 'Family / Model / HW / config: field.path'."""
+    names = []
+    fields = []
+    named = False
+    for key in path:
+        if key in NAMED_KEYS and not fields and not named:
+            named = True
+            continue
+        if named:
+            names.append(key)
+            named = False
+        else:
+            fields.append(key)
+    label = " / ".join(names)
+    if fields:
+        field = ".".join(fields)
+        # Flags read better after their list than as a dotted key
+        for flag_key in FLAG_LIST_KEYS:
+            field = field.replace(f"{flag_key}.--", f"{flag_key} --")
+        label = f"{label}: {field}" if label else field
+    return label
+
+
+def format_value(value: Any) -> str:
+    """Render a changed value compactly."""
+    return json.dumps(value, ensure_ascii=False, default=str)
+
+
+def format_change(change: dict) -> str:
+    """Render a change as one line."""
+    if change["op"] == "reordered":
+        *parent, key = change["path"]
+        label = format_path(parent)
+        field = f"{label}: {key} order" if label else f"{key} order"
+        return f"~ {field} {format_value(change['old'])} -> {format_value(change['new'])}"
+    label = format_path(change["path"])
+    if change["op"] in ("added", "removed"):
+        sign = "+" if change["op"] == "added" else "-"
+        value = change["new" if change["op"] == "added" else "old"]
+        # Named entries are summarized, fields show their value
+        if isinstance(value, dict):
+            return f"{sign} {label}: {change['op']}"
+        return f"{sign} {label} {format_value(value)}"
+    return f"~ {label} {format_value(change['old'])} -> {format_value(change['new'])}"
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Semantic diff of compiled model configs")
+    parser.add_argument("old", type=Path, help="Generated file or directory to compare from")
+    parser.add_argument("new", type=Path, help="Generated file or directory to compare to")
+    parser.add_argument("--json", action="store_true", help="Print changes as JSON")
+    args = parser.parse_args()
+
+    for path in (args.old, args.new):
+        if not path.exists():
+            print(f"Error: {path} does not exist", file=sys.stderr)
+            return 2
+
+    old_files = generated_files(args.old)
+    new_files = generated_files(args.new)
+    # Unchanged files hold the same families on both sides, so neither side needs them
+    skip = unchanged_files(old_files, new_files)
+    old_tree = build_catalog_tree(load_documents([file for name, file in old_files.items() if name not in skip]))
+    new_tree = build_catalog_tree(load_documents([file for name, file in new_files.items() if name not in skip]))
+    changes = list(diff_trees(old_tree, new_tree))
+
+    if args.json:
+        print(json.dumps(changes, indent=2, ensure_ascii=False, default=str))
+    elif changes:
+        for change in changes:
+            print(format_change(change))
+    else:
+        print("No differences")
+    return 1 if changes else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,207 @@
+"""
+Compiler Profiling
+
+Collects the --profile report of the config compilers: per-phase and per-file
+timings, counts of generated objects, and peak memory.
+
+Code marks its phases with `with phase("load"):` and per-file work with
+`with profile_file(name):`. Both are no-ops unless a profile was started with
+start_profile(), so instrumented code costs nothing in normal runs. Phases may
+nest ("merge" runs inside "expand"), so phase totals can overlap.
+
+Worker processes start their own profile per task and hand the file record
+back to the parent, which folds it in with merge_file(). Phase totals then
+add up time spent across all workers.
+
+The headline compile_seconds runs from start_profile(), which the compilers
+call after imports and argument parsing, so it leaves out interpreter
+startup. bench_compile_models.py times whole processes for end-to-end
+numbers.
+"""
+
+import contextlib
+import json
+import sys
+import time
+from pathlib import Path
+from typing import Iterator
+
+try:
+    import resource
+except ImportError:  # Windows
+    resource = None
+
+_active: "CompileProfile | None" = None
+
+
+class CompileProfile:
+    """Timings and counts collected during one compiler run."""
+
+    def __init__(self) -> None:
+        # Start of the profiled run, after the compiler's imports
+        self.started = time.perf_counter()
+        self.phases: dict[str, dict] = {}
+        self.files: dict[str, dict] = {}
+        self.current_file: str | None = None
+
+    def add_phase(self, name: str, seconds: float) -> None:
+        entry = self.phases.setdefault(name, {"seconds": 0.0, "calls": 0})
+        entry["seconds"] += seconds
+        entry["calls"] += 1
+        if self.current_file is not None:
+            record = self.files[self.current_file]
+            record["phases"][name] = record["phases"].get(name, 0.0) + seconds
+            record["calls"][name] = record["calls"].get(name, 0) + 1
+
+
+def start_profile() -> CompileProfile:
+    """Start collecting a profile in this process, replacing any active one."""
+    global _active
+    _active = CompileProfile()
+    return _active
+
+
+def active_profile() -> CompileProfile | None:
+    """Return the profile being collected in this process, if any."""
+    return _active
+
+
+@contextlib.contextmanager
+def _timed_phase(profile: CompileProfile, name: str) -> Iterator[None]:
+    start = time.perf_counter()
+    try:
+        yield
+    finally:
+        profile.add_phase(name, time.perf_counter() - start)
+
+
+def phase(name: str) -> contextlib.AbstractContextManager:
+    """Time the enclosed block as phase name of the active profile (no-op if none)."""
+    if _active is None:
+        return contextlib.nullcontext()
+    return _timed_phase(_active, name)
+
+
+@contextlib.contextmanager
+def _timed_file(profile: CompileProfile, name: str) -> Iterator[None]:
+    record = profile.files.setdefault(name, {"seconds": 0.0, "phases": {}, "calls": {}, "counts": {}})
+    previous, profile.current_file = profile.current_file, name
+    start = time.perf_counter()
+    try:
+        yield
+    finally:
+        record["seconds"] += time.perf_counter() - start
+        profile.current_file = previous
+
+
+def profile_file(name: str) -> contextlib.AbstractContextManager:
+    """Attribute the enclosed phases and counts to file name (no-op if no profile)."""
+    if _active is None:
+        return contextlib.nullcontext()
+    return _timed_file(_active, name)
+
+
+def record_counts(**counts: int) -> None:
+    """Add counts (e.g. models=3) to the current file of the active profile."""
+    if _active is None or _active.current_file is None:
+        return
+    file_counts = _active.files[_active.current_file]["counts"]
+    for key, value in counts.items():
+        file_counts[key] = file_counts.get(key, 0) + value
+
+
+def merge_file(profile: CompileProfile, name: str, record: dict) -> None:
+    """
+    Fold a file record collected in a worker process into profile.
+
+    Phase calls are added from the record's per-phase call counts, so the
+    totals match a serial run that times the same spans in-process.
+    """
+    profile.files[name] = record
+    for phase_name, seconds in record["phases"].items():
+        entry = profile.phases.setdefault(phase_name, {"seconds": 0.0, "calls": 0})
+        entry["seconds"] += seconds
+        entry["calls"] += record["calls"][phase_name]
+
+
+def peak_memory_mb() -> float | None:
+    """Peak resident memory of this process or its largest worker, in MB."""
+    if resource is None:
+        return None
+    peak = max(
+        resource.getrusage(resource.RUSAGE_SELF).ru_maxrss,
+        resource.getrusage(resource.RUSAGE_CHILDREN).ru_maxrss,
+    )
+    # ru_maxrss is in bytes on macOS and kilobytes elsewhere
+    return round(peak / (1024 * 1024 if sys.platform == "darwin" else 1024), 1)
+
+
+def profile_report(profile: CompileProfile) -> dict:
+    """Build the machine-readable report of a finished profile."""
+    totals: dict[str, int] = {}
+    for record in profile.files.values():
+        for key, value in record["counts"].items():
+            totals[key] = totals.get(key, 0) + value
+    return {
+        "compile_seconds": round(time.perf_counter() - profile.started, 4),
+        "peak_memory_mb": peak_memory_mb(),
+        "phases": {
+            name: {"seconds": round(entry["seconds"], 4), "calls": entry["calls"]}
+            for name, entry in profile.phases.items()
+        },
+        "totals": totals,
+        "files": [
+            {
+                "file": name,
+                "seconds": round(record["seconds"], 4),
+                "phases": {key: round(value, 4) for key, value in record["phases"].items()},
+                "counts": record["counts"],
+            }
+            for name, record in profile.files.items()
+        ],
+    }
+
+
+def format_profile(report: dict) -> str:
+    """Render a profile report as human-readable tables."""
+    lines = [
+        f"Profile: {report['compile_seconds']:.3f}s compile (excluding startup), peak memory "
+        + (f"{report['peak_memory_mb']:.1f} MB" if report["peak_memory_mb"] is not None else "n/a"),
+        "",
+        f"{'Phase':<16}{'Calls':>8}{'Seconds':>10}",
+    ]
+    for name, entry in report["phases"].items():
+        lines.append(f"{name:<16}{entry['calls']:>8}{entry['seconds']:>10.3f}")
+
+    if report["files"]:
+        phase_names = [
+            name for name in report["phases"]
+            if any(name in record["phases"] for record in report["files"])
+        ]
+        count_names = list(report["totals"])
+        width = max(len("File"), *(len(record["file"]) for record in report["files"]))
+        header = f"{'File':<{width}}{'Total':>9}"
+        header += "".join(f"{name:>{max(len(name), 6) + 2}}" for name in phase_names)
+        header += "".join(f"{name:>{max(len(name), 5) + 2}}" for name in count_names)
+        lines += ["", header]
+        for record in sorted(report["files"], key=lambda record: -record["seconds"]):
+            row = f"{record['file']:<{width}}{record['seconds']:>9.3f}"
+            row += "".join(
+                f"{record['phases'].get(name, 0.0):>{max(len(name), 6) + 2}.3f}" for name in phase_names
+            )
+            row += "".join(
+                f"{record['counts'].get(name, 0):>{max(len(name), 5) + 2}}" for name in count_names
+            )
+            lines.append(row)
+        if count_names:
+            padding = 9 + sum(max(len(name), 6) + 2 for name in phase_names)
+            totals = "".join(f"{report['totals'][name]:>{max(len(name), 5) + 2}}" for name in count_names)
+            lines.append(f"{'Total':<{width}}{'':>{padding}}{totals}")
+    return "\n".join(lines)
+
+
+def write_profile(report: dict, path: Path) -> None:
+    """Write a profile report as JSON."""
+    with open(path, "w") as f:
+        json.dump(report, f, indent=2)
+        f.write("\n")
@@ -0,0 +1,176 @@
+#!/usr/bin/env python3
+"""
+Model Configuration Query
+
+Looks up compiled model configurations in the consolidated per-version catalogs
+written by `compile_models.py --catalog`, without recompiling or scanning the
+generated YAML files.
+
+Usage:
+    python query_models.py --model DeepSeek-V3.2 --hardware B200 --quant fp8 \\
+        [--optimization low-latency] [--config NAME] [--version v0.5.6] \\
+        [--command | --json]
+
+--model matches either the model name or its HuggingFace model_path. Without
+--version, the newest catalog that contains a match is used. By default the
+resolved engine block of each match is printed as YAML; --command prints the
+pre-rendered sglang launch command, --env-file its environment variables, and
+--json machine-readable results including the launch argv.
+"""
+
+import argparse
+import json
+import sys
+from pathlib import Path
+
+from compile_models import dump_yaml, load_catalog
+
+
+def version_key(version: str) -> tuple:
+    """Sort key for version folders like 'v0.5.10' (numeric, not lexicographic)."""
+    parts = version.lstrip("v").split(".")
+    return tuple(int(part) if part.isdigit() else -1 for part in parts)
+
+
+def find_configurations(
+    catalog: dict,
+    model: str | None = None,
+    hardware: str | None = None,
+    quantization: str | None = None,
+    optimization: str | None = None,
+    config_name: str | None = None,
+) -> list[tuple[dict, str, dict, dict]]:
+    """
+    Find configurations in a catalog using its indexes.
+
+    Returns (model, hardware name, configuration, launch) tuples in catalog order,
+    where launch holds the catalog's pre-rendered launch forms.
+    """
+    indexes = catalog["indexes"]
+    models = catalog["models"]
+    refs = catalog["configurations"]
+
+    # Intersect configuration-level indexes (each lookup is a key fetch)
+    candidates: set[int] | None = None
+    for index_name, value in (
+        ("hardware", hardware),
+        ("quantization", quantization),
+        ("optimization", optimization),
+    ):
+        if value is None:
+            continue
+        matches = set(indexes[index_name].get(value, []))
+        candidates = matches if candidates is None else candidates & matches
+
+    if model is not None:
+        model_ids = set(indexes["name"].get(model, [])) | set(indexes["model_path"].get(model, []))
+        if candidates is None:
+            candidates = {
+                ref_index for ref_index, (model_index, _, _) in enumerate(refs)
+                if model_index in model_ids
+            }
+        else:
+            candidates = {ref_index for ref_index in candidates if refs[ref_index][0] in model_ids}
+
+    ref_indexes = sorted(candidates) if candidates is not None else range(len(refs))
+
+    results = []
+    for ref_index in ref_indexes:
+        model_index, hw_name, config_index = refs[ref_index]
+        model_entry = models[model_index]
+        configuration = model_entry["hardware"][hw_name]["configurations"][config_index]
+        if config_name is not None and configuration["name"] != config_name:
+            continue
+        results.append((model_entry, hw_name, configuration, catalog["launch"][ref_index]))
+    return results
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(
+        description="Query compiled model configs from the consolidated catalogs"
+    )
+    parser.add_argument(
+        "--catalog-dir",
+        type=Path,
+        default=Path(__file__).parent.parent / "models" / "catalog",
+        help="Directory containing <version>.json catalogs",
+    )
+    parser.add_argument("--version", help="SGLang version folder (e.g. v0.5.6)")
+    parser.add_argument("--model", help="Model name or HuggingFace model_path")
+    parser.add_argument("--hardware", help="Hardware name (e.g. H200, B200)")
+    parser.add_argument("--quant", help="Quantization (e.g. fp8, bf16)")
+    parser.add_argument("--optimization", help="balanced, low-latency or high-throughput")
+    parser.add_argument("--config", help="Named configuration (e.g. default, speculative-mtp)")
+    output = parser.add_mutually_exclusive_group()
+    output.add_argument("--command", action="store_true", help="Print launch commands")
+    output.add_argument("--env-file", action="store_true", help="Print launch env vars as an env file")
+    output.add_argument("--json", action="store_true", help="Print results as JSON")
+
+    args = parser.parse_args()
+
+    if args.version:
+        catalog_paths = [args.catalog_dir / f"{args.version}.json"]
+    else:
+        catalog_paths = sorted(
+            args.catalog_dir.glob("*.json"), key=lambda path: version_key(path.stem), reverse=True
+        )
+    catalog_paths = [path for path in catalog_paths if path.exists()]
+    if not catalog_paths:
+        print(
+            f"No catalogs found in {args.catalog_dir}. "
+            "Run: python data/scripts/compile_models.py --catalog",
+            file=sys.stderr,
+        )
+        return 1
+
+    version = None
+    results = []
+    for catalog_path in catalog_paths:
+        catalog = load_catalog(catalog_path)
+        results = find_configurations(
+            catalog, args.model, args.hardware, args.quant, args.optimization, args.config
+        )
+        if results:
+            version = catalog["version"]
+            break
+
+    if not results:
+        print("No matching configurations", file=sys.stderr)
+        return 1
+
+    if args.json:
+        print(json.dumps(
+            [
+                {
+                    "version": version,
+                    "model": model["name"],
+                    "model_path": model["model_path"],
+                    "hardware": hw_name,
+                    "configuration": configuration["name"],
+                    "attributes": configuration["attributes"],
+                    "engine": configuration["engine"],
+                    "argv": launch["argv"],
+                    "env": launch["env"],
+                }
+                for model, hw_name, configuration, launch in results
+            ],
+            indent=2,
+        ))
+        return 0
+
+    for i, (model, hw_name, configuration, launch) in enumerate(results):
+        if i:
+            print()
+        print(f"# {version} {model['name']} on {hw_name}: {configuration['name']}")
+        if args.command:
+            print(launch["shell"])
+        elif args.env_file:
+            print(launch["env_file"], end="")
+        else:
+            print(dump_yaml(configuration["engine"]), end="")
+
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
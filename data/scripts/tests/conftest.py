@@ -0,0 +1,39 @@
+import shutil
+import sys
+from pathlib import Path
+
+import pytest
+
+# The scripts are run as top-level modules, so tests import them the same way
+SCRIPTS_DIR = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(SCRIPTS_DIR))
+
+import compile_models  # noqa: E402
+
+VENDORS_PATH = SCRIPTS_DIR.parent / "models" / "vendors.yaml"
+
+
+@pytest.fixture
+def models_dir(tmp_path: Path) -> Path:
+    """A models directory in tmp_path with the real vendors.yaml and an empty src/."""
+    models = tmp_path / "models"
+    (models / "src").mkdir(parents=True)
+    shutil.copy(VENDORS_PATH, models / "vendors.yaml")
+    return models
+
+
+@pytest.fixture
+def run_compiler(models_dir: Path, monkeypatch: pytest.MonkeyPatch, capsys: pytest.CaptureFixture):
+    """Run compile_models.main() on models_dir; returns (exit code, stdout)."""
+
+    def run(*args: str) -> tuple[int, str]:
+        monkeypatch.setattr(sys, "argv", [
+            "compile_models.py",
+            "--input-dir", str(models_dir / "src"),
+            "--output-dir", str(models_dir / "generated"),
+            *args,
+        ])
+        code = compile_models.main()
+        return code, capsys.readouterr().out
+
+    return run
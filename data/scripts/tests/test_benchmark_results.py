@@ -0,0 +1,154 @@
+"""
+Ingestion of the bench_serving fixture into optimal config summaries and
+Pareto frontiers.
+
+The fixture covers the b200/fp8/8 and h200/fp8/8 deployments of
+deepseek-r1: two scenario sweeps of scheduler_recv_interval, one run with
+parameters no entry uses, and an untagged concurrency sweep.
+"""
+
+import copy
+from pathlib import Path
+
+import pytest
+import yaml
+
+from benchmark_results import (
+    attach_benchmarks,
+    build_frontiers,
+    load_runs,
+    summarize_benchmarks,
+)
+
+SCRIPTS_DIR = Path(__file__).resolve().parent.parent
+FIXTURE = SCRIPTS_DIR / "fixtures" / "benchmarks" / "v0.5.6" / "deepseek-r1.jsonl"
+SOURCE = SCRIPTS_DIR.parent / "optimal-configs" / "src" / "v0.5.6" / "deepseek-r1.yaml"
+
+
+@pytest.fixture(scope="module")
+def runs() -> list[dict]:
+    return load_runs(FIXTURE)
+
+
+@pytest.fixture(scope="module")
+def configs() -> list[dict]:
+    with open(SOURCE) as f:
+        return yaml.safe_load(f)["configs"]
+
+
+def find_config(configs: list[dict], hardware: str, quantization: str, gpu_count: int, scenario: str) -> dict:
+    for config in configs:
+        if (config["hardware"], config["quantization"], config["gpu_count"], config["scenario"]) == (
+            hardware, quantization, gpu_count, scenario,
+        ):
+            return config
+    raise LookupError(f"no {hardware}/{quantization}/{gpu_count}/{scenario} entry in {SOURCE.name}")
+
+
+def test_load_runs_keeps_file_order(runs):
+    assert len(runs) == 14
+    assert [run["max_concurrency"] for run in runs[6:]] == [1, 4, 8, 16, 32, 64, 128, 256]
+
+
+def test_load_runs_rejects_missing_dimension(tmp_path):
+    path = tmp_path / "runs.jsonl"
+    path.write_text('{"hardware": "b200", "quantization": "fp8"}\n')
+    with pytest.raises(ValueError, match=r"runs\.jsonl:1: missing gpu_count"):
+        load_runs(path)
+
+
+def test_outperformed_parameters(configs, runs):
+    summary = summarize_benchmarks(find_config(configs, "b200", "fp8", 8, "low-latency"), runs)
+    assert summary["objective"] == "median_tpot_ms"
+    # Untagged sweep runs feed only the frontier
+    assert summary["runs"] == 2
+    assert summary["measured"]["median_tpot_ms"] == 8.41
+    assert summary["best"]["parameters"] == {"scheduler_recv_interval": 30, "stream_interval": 30}
+    assert summary["best"]["metrics"]["median_tpot_ms"] == 8.13
+    assert summary["is_best"] is False
+
+
+def test_best_parameters(configs, runs):
+    summary = summarize_benchmarks(find_config(configs, "b200", "fp8", 8, "high-throughput"), runs)
+    assert summary["objective"] == "output_throughput"
+    assert summary["runs"] == 2
+    assert summary["measured"] == summary["best"]["metrics"]
+    assert summary["measured"]["output_throughput"] == 10071.3
+    assert summary["is_best"] is True
+
+
+def test_unmeasured_parameters(configs, runs):
+    summary = summarize_benchmarks(find_config(configs, "h200", "fp8", 8, "high-throughput"), runs)
+    assert summary["runs"] == 1
+    assert summary["measured"] is None
+    assert summary["best"]["parameters"] == {"cuda_graph_max_bs": 256, "max_running_requests": 256}
+    assert summary["is_best"] is False
+
+
+def test_entry_without_runs(configs, runs):
+    assert summarize_benchmarks(find_config(configs, "mi300x", "fp8", 8, "low-latency"), runs) is None
+
+
+def test_run_without_parameters_backs_every_entry(configs, runs):
+    # A run that lists no parameters is measured for each entry sharing its
+    # dimensions, whatever that entry's parameters are
+    baseline = {**runs[0], "median_tpot_ms": 7.0}
+    del baseline["parameters"]
+    low_latency = find_config(configs, "b200", "fp8", 8, "low-latency")
+    changed = copy.deepcopy(low_latency)
+    changed["parameters"]["scheduler_recv_interval"] = 50
+
+    for config in (low_latency, changed):
+        summary = summarize_benchmarks(config, [*runs, baseline])
+        assert summary["runs"] == 3
+        assert summary["measured"]["median_tpot_ms"] == 7.0
+        assert summary["best"]["parameters"] == {}
+        assert summary["is_best"] is True
+
+
+def test_attach_benchmarks(configs, runs):
+    compiled = {"configs": copy.deepcopy(configs)}
+    warnings = attach_benchmarks(compiled, runs)
+
+    with_benchmark = [
+        "/".join(str(config[key]) for key in ("hardware", "quantization", "gpu_count", "scenario"))
+        for config in compiled["configs"] if "benchmark" in config
+    ]
+    assert with_benchmark == [
+        "b200/fp8/8/low-latency",
+        "b200/fp8/8/high-throughput",
+        "h200/fp8/8/low-latency",
+        "h200/fp8/8/high-throughput",
+    ]
+    assert warnings == [
+        "configs[4] (b200/fp8/8/low-latency): {'scheduler_recv_interval': 30, 'stream_interval': 30} "
+        "measured better median_tpot_ms (8.13 vs 8.41)",
+        "configs[7] (h200/fp8/8/high-throughput): parameters have no matching benchmark run",
+    ]
+
+
+def test_frontiers(runs):
+    frontiers = build_frontiers(runs)
+    assert [(f["hardware"], f["quantization"], f["gpu_count"]) for f in frontiers] == [
+        ("b200", "fp8", 8),
+        ("h200", "fp8", 8),
+    ]
+
+    b200, h200 = frontiers
+    # The scheduler_recv_interval=10 runs and the saturated 256-concurrency run are dominated
+    assert [point["metrics"]["max_concurrency"] for point in b200["points"]] == [1, 4, 8, 16, 32, 64, 128]
+    assert all(
+        point["parameters"] == {"scheduler_recv_interval": 30, "stream_interval": 30}
+        for point in b200["points"]
+    )
+    assert [point.get("scenario") for point in b200["points"]] == [
+        None, None, "low-latency", None, None, None, "high-throughput",
+    ]
+    assert b200["scenarios"] == {"low-latency": 0, "high-throughput": 6}
+
+    assert [point["parameters"] for point in h200["points"]] == [
+        {"stream_interval": 10},
+        {"cuda_graph_max_bs": 256, "max_running_requests": 256},
+    ]
+    assert h200["scenarios"] == {"low-latency": 0, "high-throughput": 1}
+    assert h200["axes"] == {"throughput": "output_throughput", "latency": "median_tpot_ms"}
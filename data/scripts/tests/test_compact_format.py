@@ -0,0 +1,75 @@
+"""
+Round trip of generated model configs through the compact CBOR format.
+
+load_compact must restore exactly the document load_yaml reads from the
+committed YAML, including key order, None values and int/float types.
+"""
+
+from pathlib import Path
+
+import pytest
+
+from compact_format import (
+    FORMAT_NAME,
+    FORMAT_VERSION,
+    RECORD_TAG,
+    STRING_REF_TAG,
+    _Decoder,
+    _Tagged,
+    dump_compact,
+    load_compact,
+)
+from compile_models import load_yaml
+
+GENERATED_DIR = Path(__file__).resolve().parent.parent.parent / "models" / "generated"
+GENERATED = sorted(GENERATED_DIR.glob("*/*.yaml"))
+
+
+def relative_id(path: Path) -> str:
+    return path.relative_to(path.parent.parent).as_posix()
+
+
+@pytest.mark.parametrize("path", GENERATED, ids=relative_id)
+def test_round_trip_matches_yaml(path):
+    document = load_yaml(path)
+    restored = load_compact(dump_compact(document))
+    assert restored == document
+    # repr also tells key order and 1 from 1.0 apart
+    assert repr(restored) == repr(document)
+
+
+def test_strings_and_shapes_are_stored_once():
+    document = {
+        "name": "a",
+        "models": [
+            {"name": "b", "tp": 8, "prefill": None},
+            {"name": "a", "tp": 4, "prefill": None},
+        ],
+    }
+    container = _Decoder(dump_compact(document)).decode()
+
+    assert container["format"] == FORMAT_NAME
+    assert container["version"] == FORMAT_VERSION
+    # A dict's keys are interned before its values
+    assert container["strings"] == ["name", "models", "a", "tp", "prefill", "b"]
+    # Both models share one shape; the None-valued key is negated and has no value
+    assert container["shapes"] == [[0, 1], [0, 3, -5]]
+
+    data = container["data"]
+    assert isinstance(data, _Tagged) and data.tag == RECORD_TAG
+    shape_index, name, models = data.content
+    assert shape_index == 0
+    assert isinstance(name, _Tagged) and (name.tag, name.content) == (STRING_REF_TAG, 2)
+    assert [model.content[0] for model in models] == [1, 1]
+    assert [model.content[1].content for model in models] == [5, 2]
+    assert [len(model.content) for model in models] == [3, 3]
+
+    assert load_compact(dump_compact(document)) == document
+
+
+def test_rejects_other_version():
+    raw = dump_compact({"name": "a"}).replace(
+        b"gversion" + bytes([FORMAT_VERSION]), b"gversion" + bytes([FORMAT_VERSION + 1])
+    )
+    with pytest.raises(ValueError, match="Unsupported compact format version"):
+        load_compact(raw)
@@ -0,0 +1,74 @@
+"""
+Parsing and merging of SGLang extra_args through ExtraArgs.
+"""
+
+import pytest
+
+from compile_models import ExtraArgs, build_engine_config, merge_extra_args
+
+
+def test_equals_form_is_normalized():
+    assert ExtraArgs(["--foo=1"]).to_argv() == ["--foo", "1"]
+    assert ExtraArgs(["--json-model-override-args={\"a\": 1}"]).get("--json-model-override-args") == ['{"a": 1}']
+
+
+def test_negative_number_is_a_value():
+    args = ExtraArgs(["--x", "-1", "--trust-remote-code"])
+    assert args.get("--x") == ["-1"]
+    assert args.get("--trust-remote-code") == []
+    assert args.to_argv() == ["--x", "-1", "--trust-remote-code"]
+
+
+def test_repeated_flag_keeps_first_position_and_last_values():
+    args = ExtraArgs(["--a", "1", "--b", "2", "--a", "3"])
+    assert args.to_argv() == ["--a", "3", "--b", "2"]
+
+
+def test_multi_value_flag():
+    args = ExtraArgs(["--cuda-graph-bs", "1", "2", "4", "--trust-remote-code"])
+    assert args.get("--cuda-graph-bs") == ["1", "2", "4"]
+
+
+def test_multi_value_flag_precedence_over_template():
+    merged = merge_extra_args(
+        ["--cuda-graph-bs", "1", "2", "4"],
+        ["--cuda-graph-bs", "8", "16", "--trust-remote-code"],
+    )
+    assert merged == ["--cuda-graph-bs", "1", "2", "4", "--trust-remote-code"]
+
+
+def test_template_flags_follow_hardware_flags():
+    merged = merge_extra_args(["--mem-fraction-static", "0.8"], ["--kv-cache-dtype", "fp8_e4m3", "--mem-fraction-static", "0.9"])
+    assert merged == ["--mem-fraction-static", "0.8", "--kv-cache-dtype", "fp8_e4m3"]
+
+
+def test_leading_value_is_rejected():
+    with pytest.raises(ValueError, match="does not follow a flag"):
+        ExtraArgs(["1", "--foo"])
+
+
+def test_value_after_boolean_flag_is_rejected():
+    with pytest.raises(ValueError, match="follows boolean flag --trust-remote-code"):
+        ExtraArgs(["--trust-remote-code", "model"])
+    with pytest.raises(ValueError, match="takes no value"):
+        ExtraArgs(["--trust-remote-code=true"])
+
+
+def test_second_value_of_single_value_flag_is_rejected():
+    with pytest.raises(ValueError, match="takes one value"):
+        ExtraArgs(["--mem-fraction-static", "0.8", "0.9"])
+
+
+def test_draft_model_path_set_once():
+    hw_config = {"tp": 8, "extra_args": ["--speculative-algorithm", "EAGLE"]}
+    template = {"extra_args": ["--speculative-num-steps", "3"]}
+
+    engine = build_engine_config(hw_config, template, draft_model_path="org/draft")
+    assert engine["extra_args"].count("--speculative-draft-model-path") == 1
+    assert ExtraArgs(engine["extra_args"]).get("--speculative-draft-model-path") == ["org/draft"]
+
+    # A path already in extra_args is kept and not duplicated
+    hw_config["extra_args"] += ["--speculative-draft-model-path", "org/own-draft"]
+    engine = build_engine_config(hw_config, template, draft_model_path="org/draft")
+    assert engine["extra_args"].count("--speculative-draft-model-path") == 1
+    assert ExtraArgs(engine["extra_args"]).get("--speculative-draft-model-path") == ["org/own-draft"]
@@ -0,0 +1,169 @@
+"""
+Incremental compilation: which files the content-hash manifest skips and
+which it recompiles.
+"""
+
+import json
+from pathlib import Path
+
+import pytest
+
+import compile_models
+from compile_models import MANIFEST_NAME
+
+
+def write_source(models_dir: Path, name: str, vendor: str) -> None:
+    path = models_dir / "src" / "v1" / f"{name}.yaml"
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(
+        f"vendor: {vendor}\n"
+        "defaults:\n"
+        "  hardware:\n"
+        "    H100: { tp: 8 }\n"
+        "  configurations:\n"
+        "    - name: default\n"
+        "families:\n"
+        f"  - name: {name}\n"
+        "    llm:\n"
+        "      thinking_capability: non_thinking\n"
+        "    models:\n"
+        f"      - name: {name}-7B\n"
+    )
+
+
+@pytest.fixture
+def tree(models_dir: Path) -> Path:
+    write_source(models_dir, "llama", "meta-llama")
+    write_source(models_dir, "qwen", "qwen")
+    return models_dir
+
+
+def compiled_files(out: str) -> list[str]:
+    return [line.split()[1].rstrip(".") for line in out.splitlines() if line.startswith("Compiling ")]
+
+
+def skipped_files(out: str) -> list[str]:
+    return [line.split()[1] for line in out.splitlines() if line.startswith("Skipping ")]
+
+
+def test_second_run_skips_every_file(tree, run_compiler):
+    code, out = run_compiler()
+    assert code == 0
+    assert compiled_files(out) == ["llama.yaml", "qwen.yaml"]
+
+    code, out = run_compiler()
+    assert code == 0
+    assert compiled_files(out) == []
+    assert skipped_files(out) == ["llama.yaml", "qwen.yaml"]
+
+    manifest = json.loads((tree / "generated" / MANIFEST_NAME).read_text())
+    assert sorted(manifest["files"]) == ["v1/llama.yaml", "v1/qwen.yaml"]
+
+
+def test_source_edit_recompiles_only_that_file(tree, run_compiler):
+    run_compiler()
+    source = tree / "src" / "v1" / "qwen.yaml"
+    source.write_text(source.read_text().replace("tp: 8", "tp: 4"))
+
+    _, out = run_compiler()
+    assert compiled_files(out) == ["qwen.yaml"]
+    assert skipped_files(out) == ["llama.yaml"]
+
+
+def test_tampered_output_is_rebuilt(tree, run_compiler):
+    run_compiler()
+    output = tree / "generated" / "v1" / "llama.yaml"
+    expected = output.read_text()
+    tampered = expected.replace("tp: 8", "tp: 2")
+    assert tampered != expected
+    output.write_text(tampered)
+
+    _, out = run_compiler()
+    assert compiled_files(out) == ["llama.yaml"]
+    assert output.read_text() == expected
+
+    output.unlink()
+    _, out = run_compiler()
+    assert compiled_files(out) == ["llama.yaml"]
+    assert output.read_text() == expected
+
+
+def test_layout_change_recompiles(tree, run_compiler):
+    run_compiler()
+    _, out = run_compiler("--normalize")
+    assert compiled_files(out) == ["llama.yaml", "qwen.yaml"]
+    _, out = run_compiler("--normalize")
+    assert compiled_files(out) == []
+    _, out = run_compiler()
+    assert compiled_files(out) == ["llama.yaml", "qwen.yaml"]
+
+
+def test_compiler_change_recompiles(tree, run_compiler, monkeypatch):
+    run_compiler()
+    monkeypatch.setattr(compile_models, "compiler_digest", lambda: "changed")
+    _, out = run_compiler()
+    assert compiled_files(out) == ["llama.yaml", "qwen.yaml"]
+
+
+def edit_vendor(models_dir: Path, vendor_id: str, org: str) -> None:
+    path = models_dir / "vendors.yaml"
+    text = path.read_text()
+    entry = f"  {vendor_id}:\n"
+    start = text.index(entry)
+    old = text[start:].split("huggingface_org:", 1)[1].split("\n", 1)[0]
+    path.write_text(text[:start] + text[start:].replace(f"huggingface_org:{old}", f"huggingface_org: {org}", 1))
+
+
+@pytest.fixture
+def vendor_tree(tree: Path) -> Path:
+    # A file whose own vendor is google but one model comes from meta-llama
+    write_source(tree, "mixed", "google")
+    path = tree / "src" / "v1" / "mixed.yaml"
+    path.write_text(path.read_text() + "      - name: Llama-3-8B\n        vendor: meta-llama\n")
+    return tree
+
+
+def test_vendor_edit_recompiles_dependents(vendor_tree, run_compiler):
+    run_compiler()
+    manifest = json.loads((vendor_tree / "generated" / MANIFEST_NAME).read_text())
+    assert manifest["vendor_index"] == {
+        "google": ["v1/mixed.yaml"],
+        "meta-llama": ["v1/llama.yaml", "v1/mixed.yaml"],
+        "qwen": ["v1/qwen.yaml"],
+    }
+
+    edit_vendor(vendor_tree, "meta-llama", "meta-llama-mirror")
+    _, out = run_compiler()
+    assert compiled_files(out) == ["llama.yaml", "mixed.yaml"]
+    assert skipped_files(out) == ["qwen.yaml"]
+    assert "meta-llama-mirror/Llama-3-8B" in (vendor_tree / "generated" / "v1" / "mixed.yaml").read_text()
+
+    # A vendor no source references touches nothing
+    edit_vendor(vendor_tree, "openai", "openai-mirror")
+    _, out = run_compiler()
+    assert compiled_files(out) == []
+
+
+def test_affected_by(vendor_tree, run_compiler):
+    generated = vendor_tree / "generated" / "v1"
+    vendors_path = str(vendor_tree / "vendors.yaml")
+
+    # Nothing recorded yet: every file referencing a vendor may be affected
+    code, out = run_compiler("--affected-by", vendors_path)
+    assert code == 0
+    assert out.split() == [str(generated / name) for name in ("llama.yaml", "mixed.yaml", "qwen.yaml")]
+    assert not generated.exists()
+
+    run_compiler()
+    _, out = run_compiler("--affected-by", vendors_path)
+    assert out.split() == []
+
+    edit_vendor(vendor_tree, "qwen", "Qwen-mirror")
+    _, out = run_compiler("--affected-by", vendors_path)
+    assert out.split() == [str(generated / "qwen.yaml")]
+
+    _, out = run_compiler("--affected-by", str(vendor_tree / "src" / "v1" / "llama.yaml"))
+    assert out.split() == [str(generated / "llama.yaml")]
+
+    _, out = run_compiler("--affected-by", compile_models.__file__)
+    assert len(out.split()) == 3
@@ -0,0 +1,83 @@
+"""
+Round trip of generated model configs through the --normalize layout.
+"""
+
+from pathlib import Path
+
+import pytest
+import yaml
+
+from compile_models import (
+    ENGINE_BLOCK_KEYS,
+    ENGINES_TABLE_KEY,
+    YAML_DUMP_OPTIONS,
+    inflate_config,
+    load_yaml,
+    normalize_config,
+)
+
+GENERATED_DIR = Path(__file__).resolve().parent.parent.parent / "models" / "generated"
+GENERATED = sorted(GENERATED_DIR.glob("*/*.yaml"))
+
+
+def relative_id(path: Path) -> str:
+    return path.relative_to(path.parent.parent).as_posix()
+
+
+def engine_blocks(document: dict) -> list:
+    return [
+        configuration[key]
+        for family in document["families"]
+        for model in family["models"]
+        for hw_config in model["hardware"].values()
+        for configuration in hw_config["configurations"]
+        for key in ENGINE_BLOCK_KEYS
+        if configuration.get(key) is not None
+    ]
+
+
+@pytest.mark.parametrize("path", GENERATED, ids=relative_id)
+def test_inflate_restores_document(path):
+    document = load_yaml(path)
+    normalized = normalize_config(document)
+
+    blocks = engine_blocks(normalized)
+    assert all(isinstance(block, str) for block in blocks)
+    assert set(blocks) == set(normalized[ENGINES_TABLE_KEY])
+
+    inflated = inflate_config(normalized)
+    assert inflated == document
+    assert repr(inflated) == repr(document)
+
+    # The normalized document survives being written as YAML
+    written = yaml.safe_load(yaml.dump(normalized, **YAML_DUMP_OPTIONS))
+    assert inflate_config(written) == document
+
+
+def test_identical_blocks_share_an_id():
+    engine = {"tp": 8, "extra_args": ["--trust-remote-code"]}
+    document = {
+        "vendor": "v",
+        "families": [{
+            "name": "f",
+            "models": [{
+                "name": "m",
+                "hardware": {
+                    "h100": {"configurations": [{"name": "a", "engine": dict(engine)}]},
+                    "h200": {"configurations": [{"name": "a", "engine": dict(engine)}, {"name": "b", "engine": {"tp": 4}}]},
+                },
+            }],
+        }],
+    }
+    normalized = normalize_config(document)
+    assert len(normalized[ENGINES_TABLE_KEY]) == 2
+    assert inflate_config(normalized) == document
+    # Inflated blocks are copies, not shared references into the table
+    inflated = inflate_config(normalized)
+    h100, h200 = (inflated["families"][0]["models"][0]["hardware"][hw] for hw in ("h100", "h200"))
+    assert h100["configurations"][0]["engine"] is not h200["configurations"][0]["engine"]
+
+
+def test_document_without_table_is_unchanged():
+    document = {"vendor": "v", "families": []}
+    assert inflate_config(document) is document
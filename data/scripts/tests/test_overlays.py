@@ -0,0 +1,110 @@
+"""
+Version overlays: compiling the fixtures/overlays tree, by-name merging,
+recompiling overlays when their base changes, and reuse of unchanged
+families from the base output.
+"""
+
+import shutil
+from pathlib import Path
+
+import pytest
+
+from compile_models import load_yaml, merge_overlay
+
+FIXTURE_DIR = Path(__file__).resolve().parent.parent / "fixtures" / "overlays"
+
+
+@pytest.fixture
+def overlay_tree(models_dir: Path) -> Path:
+    shutil.copytree(FIXTURE_DIR, models_dir / "src", dirs_exist_ok=True)
+    return models_dir
+
+
+def engine(hardware: dict, configuration: str) -> dict:
+    return next(c for c in hardware["configurations"] if c["name"] == configuration)["engine"]
+
+
+def test_merge_overlay_by_name():
+    base = {
+        "vendor": "v",
+        "families": [
+            {"name": "a", "models": [{"name": "m1", "hardware": {"H100": {"tp": 8}}}, {"name": "m2"}]},
+            {"name": "b", "models": []},
+        ],
+        "defaults": {"configurations": [{"name": "default", "extra_args": ["--x", "1"]}]},
+    }
+    overlay = {
+        "families": [
+            {"name": "a", "models": [{"name": "m1", "hardware": {"H200": {"tp": 4}}}, {"name": "m3"}]},
+            {"name": "c"},
+        ],
+        "defaults": {"configurations": [{"name": "default", "extra_args": ["--y"]}, {"name": "tp4", "tp": 4}]},
+    }
+    merged = merge_overlay(base, overlay)
+
+    assert [family["name"] for family in merged["families"]] == ["a", "b", "c"]
+    models = merged["families"][0]["models"]
+    assert [model["name"] for model in models] == ["m1", "m2", "m3"]
+    assert models[0]["hardware"] == {"H100": {"tp": 8}, "H200": {"tp": 4}}
+    # Other lists, such as extra_args, are replaced
+    assert merged["defaults"]["configurations"] == [
+        {"name": "default", "extra_args": ["--y"]},
+        {"name": "tp4", "tp": 4},
+    ]
+    # The base is not modified
+    assert base["families"][0]["models"][0]["hardware"] == {"H100": {"tp": 8}}
+
+
+def test_compile_fixture_tree(overlay_tree, run_compiler):
+    code, _ = run_compiler()
+    assert code == 0
+
+    compiled = load_yaml(overlay_tree / "generated" / "v0.2.0" / "llama.yaml")
+    assert compiled["vendor"] == "meta-llama"
+    assert [family["name"] for family in compiled["families"]] == ["Llama-3.1", "Llama-3.3"]
+
+    (model,) = compiled["families"][1]["models"]
+    assert model["name"] == "Llama-3.3-70B-Instruct"
+    assert list(model["hardware"]) == ["H100", "H200", "B200"]
+    assert engine(model["hardware"]["H100"], "default")["tp"] == 4
+    assert engine(model["hardware"]["H200"], "default")["tp"] == 2
+    b200 = model["hardware"]["B200"]
+    assert [configuration["name"] for configuration in b200["configurations"]] == ["default", "low-latency"]
+    assert engine(b200, "default")["extra_args"] == ["--enable-torch-compile"]
+    assert engine(b200, "low-latency")["extra_args"] == ["--enable-torch-compile", "--cuda-graph-max-bs", "16"]
+
+    base = load_yaml(overlay_tree / "generated" / "v0.1.0" / "llama.yaml")
+    assert compiled["families"][0] == base["families"][0]
+
+
+def test_base_edit_recompiles_overlay(overlay_tree, run_compiler):
+    run_compiler()
+    base_path = overlay_tree / "src" / "v0.1.0" / "llama.yaml"
+    base_path.write_text(base_path.read_text().replace("H100: { tp: 4 }", "H100: { tp: 2 }"))
+
+    code, out = run_compiler()
+    assert code == 0
+    assert "Skipping" not in out
+    assert out.count("Compiling llama.yaml...") == 2
+
+    compiled = load_yaml(overlay_tree / "generated" / "v0.2.0" / "llama.yaml")
+    llama_3_3 = compiled["families"][1]["models"][0]
+    assert engine(llama_3_3["hardware"]["H100"], "default")["tp"] == 2
+
+
+def test_family_reuse_is_byte_identical(overlay_tree, run_compiler):
+    overlay_output = overlay_tree / "generated" / "v0.2.0" / "llama.yaml"
+    run_compiler()
+    rebuilt = overlay_output.read_bytes()
+
+    # With the base current and not recompiled, an overlay edit reuses Llama-3.1
+    overlay_path = overlay_tree / "src" / "v0.2.0" / "llama.yaml"
+    overlay_path.write_text(overlay_path.read_text() + "# edited\n")
+    code, out = run_compiler()
+    assert code == 0
+    assert "Reusing 1 unchanged family" in out
+    assert overlay_output.read_bytes() == rebuilt
+
+    code, out = run_compiler("--no-cache")
+    assert "Reusing" not in out
+    assert overlay_output.read_bytes() == rebuilt
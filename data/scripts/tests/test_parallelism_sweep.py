@@ -0,0 +1,80 @@
+"""
+Expansion and pruning of parallelism_sweep specs.
+"""
+
+from compile_models import build_hardware_config, expand_parallelism_sweep
+
+SWEEP = {"tp": [4, 8, 16], "dp": [1, 8], "ep": [1, 8]}
+
+
+def names(templates: list[dict]) -> list[str]:
+    return [template["name"] for template in templates]
+
+
+def test_divisibility_and_gpus_per_node():
+    # tp4 cannot hold dp8 or ep8, and tp16 needs two H200 nodes
+    templates = expand_parallelism_sweep(SWEEP, "H200", {}, "fp8", set())
+    assert names(templates) == [
+        "sweep-tp4",
+        "sweep-tp8",
+        "sweep-tp8-ep8",
+        "sweep-tp8-dp8",
+        "sweep-tp8-dp8-ep8",
+    ]
+    assert templates[3] == {
+        "name": "sweep-tp8-dp8",
+        "nodes": "single",
+        "optimization": "balanced",
+        "quantization": "fp8",
+        "tp": 8,
+        "dp": 8,
+        "enable_dp_attention": True,
+    }
+
+
+def test_gpus_per_node_of_hardware():
+    assert names(expand_parallelism_sweep({"tp": [4, 8]}, "GB200", {}, "fp8", set())) == ["sweep-tp4"]
+
+
+def test_multi_node_keeps_large_tp():
+    sweep = {"tp": [8, 16], "nodes": "multi"}
+    assert names(expand_parallelism_sweep(sweep, "H200", {}, "fp8", set())) == ["sweep-tp8", "sweep-tp16"]
+
+
+def test_pinned_dp_and_ep():
+    assert names(expand_parallelism_sweep(SWEEP, "H200", {"ep": 8}, "fp8", set())) == [
+        "sweep-tp8-ep8",
+        "sweep-tp8-dp8-ep8",
+    ]
+    assert names(expand_parallelism_sweep(SWEEP, "H200", {"dp": 8}, "fp8", set())) == [
+        "sweep-tp8-dp8",
+        "sweep-tp8-dp8-ep8",
+    ]
+
+
+def test_valid_quants():
+    hw_config = {"valid_quants": ["fp8"]}
+    assert expand_parallelism_sweep(SWEEP, "H200", hw_config, "bf16", set()) == []
+    assert expand_parallelism_sweep({**SWEEP, "quantization": "bf16"}, "H200", hw_config, "fp8", set()) == []
+    assert len(expand_parallelism_sweep(SWEEP, "H200", hw_config, "fp8", set())) == 5
+
+
+def test_name_collisions():
+    existing = {"sweep-tp8"}
+    templates = expand_parallelism_sweep({"tp": [4, 8, 4]}, "H200", {}, "fp8", existing)
+    assert names(templates) == ["sweep-tp4"]
+    assert existing == {"sweep-tp8", "sweep-tp4"}
+
+
+def test_sweep_in_hardware_config():
+    defaults = {
+        "configurations": [{"name": "default"}, {"name": "sweep-tp4", "optimization": "low-latency"}],
+        "parallelism_sweep": {"tp": [4, 8], "extra_args": ["--trust-remote-code"]},
+    }
+    hardware = build_hardware_config("H200", {"tp": 8}, defaults, "fp8")
+    configurations = hardware["configurations"]
+    assert names(configurations) == ["default", "sweep-tp4", "sweep-tp8"]
+    # The hand-written sweep-tp4 wins over the generated one
+    assert configurations[1]["attributes"]["optimization"] == "low-latency"
+    assert configurations[2]["engine"]["tp"] == 8
+    assert configurations[2]["engine"]["extra_args"] == ["--trust-remote-code"]
@@ -0,0 +1,52 @@
+"""
+The validity bitset of compiled optimal configs.
+"""
+
+import itertools
+from pathlib import Path
+
+from compile_optimal_configs import UI_DIMENSIONS, add_metadata, build_validity, load_yaml
+
+SOURCE = Path(__file__).resolve().parent.parent.parent / "optimal-configs" / "src" / "v0.5.6" / "deepseek-r1.yaml"
+
+
+def is_set(validity: dict, positions: tuple[int, ...]) -> bool:
+    index = sum(position * stride for position, stride in zip(positions, validity["strides"]))
+    return bool(int(validity["bits"][(index >> 3) * 2:(index >> 3) * 2 + 2], 16) >> (index & 7) & 1)
+
+
+def test_bits_match_configs():
+    config = add_metadata(load_yaml(SOURCE), SOURCE)
+    validity = build_validity(config)
+    options = [[option["id"] for option in config["ui_options"][key]] for key in UI_DIMENSIONS]
+
+    assert validity["dimensions"] == list(UI_DIMENSIONS)
+    sizes = [len(ids) for ids in options]
+    assert validity["strides"] == [sizes[1] * sizes[2] * sizes[3], sizes[2] * sizes[3], sizes[3], 1]
+    assert len(validity["bits"]) == 2 * ((sizes[0] * sizes[1] * sizes[2] * sizes[3] + 7) // 8)
+
+    backed = {tuple(cfg[key] for key in UI_DIMENSIONS) for cfg in config["configs"]}
+    for positions in itertools.product(*(range(size) for size in sizes)):
+        combination = tuple(ids[position] for ids, position in zip(options, positions))
+        assert is_set(validity, positions) == (combination in backed), combination
+
+
+def test_bit_order():
+    config = {
+        "ui_options": {
+            "hardware": [{"id": "a"}, {"id": "b"}, {"id": "c"}],
+            "quantization": [{"id": "fp8"}],
+            "gpu_count": [{"id": 8}],
+            "scenario": [{"id": "low-latency"}, {"id": "high-throughput"}, {"id": "balanced"}],
+        },
+        "configs": [
+            {"hardware": "a", "quantization": "fp8", "gpu_count": 8, "scenario": "high-throughput"},
+            {"hardware": "c", "quantization": "fp8", "gpu_count": 8, "scenario": "balanced"},
+        ],
+    }
+    # Bits 1 and 8 of 9: 0b00000010, then 0b00000001
+    assert build_validity(config) == {
+        "dimensions": list(UI_DIMENSIONS),
+        "strides": [3, 3, 3, 1],
+        "bits": "0201",
+    }
@@ -1,6 +1,6 @@
 import React from 'react';
 import ConfigGenerator from '../../base/ConfigGenerator';
-import { findConfig, generateCommandFromConfig, validateSelection, shouldShowElement, lookupData, getAvailableGpuCounts } from './configLoader';
+import { findConfig, generateCommandFromConfig, validateSelection, shouldShowElement, lookupData, getAvailableGpuCounts, isAvailable } from './configLoader';
 
 const DeepSeekR1AdvancedConfigGenerator = () => {
   // Build UI options dynamically from lookup.yaml
@@ -34,25 +34,24 @@ const DeepSeekR1AdvancedConfigGenerator = () => {
         title: 'Quantization',
         items: [],
         getDynamicItems: (values) => {
+          const isQuantAvailable = id => isAvailable({ hardware: values.hardware, quantization: id });
+          const defaultQuant = uiOptions.quantization.find(opt => opt.default && isQuantAvailable(opt.id))
+            || uiOptions.quantization.find(opt => isQuantAvailable(opt.id));
           return uiOptions.quantization.map(opt => {
-            // H200 only supports FP8, disable FP4
-            if (
-              (values.hardware === 'h200' && opt.id === 'fp4') ||
-              (values.hardware === 'mi300x' && opt.id === 'fp4') ||
-              (values.hardware === 'mi325x' && opt.id === 'fp4')
-            ) {
+            if (!isQuantAvailable(opt.id)) {
+              const hw = values.hardware ? values.hardware.toUpperCase() : 'selected hardware';
               return {
                 id: opt.id,
                 label: opt.label,
                 default: false,
                 disabled: true,
-                disabledReason: 'FP4 not supported on H200, MI300X, MI325X'
+                disabledReason: `${opt.label} not supported on ${hw}`
               };
             }
             return {
               id: opt.id,
               label: opt.label,
-              default: (values.hardware === 'h200' || values.hardware === 'mi300x' || values.hardware === 'mi325x') ? opt.id === 'fp8' : opt.default
+              default: defaultQuant ? opt.id === defaultQuant.id : opt.default
             };
           });
         }
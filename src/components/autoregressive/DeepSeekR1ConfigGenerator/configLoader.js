@@ -5,37 +5,52 @@ import lookupData from '@optimal-configs/v0.5.6/deepseek-r1.json';
  * Find the appropriate config based on user selections
  */
 export function findConfig(hardware, quantization, gpuCount, scenario) {
-  if (!lookupData || !lookupData.configs) {
+  if (!lookupData || !lookupData.configs || !lookupData.lookup) {
     console.error('Lookup data not loaded properly:', lookupData);
     return null;
   }
 
-  // Find matching config from lookup
-  const matchingEntry = lookupData.configs.find(entry => {
-    const hardwareMatch = entry.hardware === hardware;
-    const quantizationMatch = entry.quantization === quantization;
-    const gpuCountMatch = !entry.gpu_count || entry.gpu_count === parseInt(gpuCount, 10);
-    const scenarioMatch = entry.scenario === scenario;
-
-    return hardwareMatch && quantizationMatch && gpuCountMatch && scenarioMatch;
-  });
-
-  return matchingEntry ? matchingEntry.parameters : null;
+  // Precomputed by the compiler: hardware -> quantization -> gpu_count -> scenario -> index
+  const index = lookupData.lookup[hardware]?.[quantization]?.[parseInt(gpuCount, 10)]?.[scenario];
+  return index === undefined ? null : lookupData.configs[index].parameters;
 }
 
 /**
  * Get available GPU counts for a hardware/quantization combination
  */
 export function getAvailableGpuCounts(hardware, quantization) {
-  if (!lookupData || !lookupData.configs) {
+  const byGpuCount = lookupData?.lookup?.[hardware]?.[quantization];
+  if (!byGpuCount) {
     return [8]; // Default fallback
   }
 
-  const entries = lookupData.configs.filter(
-    entry => entry.hardware === hardware && entry.quantization === quantization
-  );
-  const gpuCounts = [...new Set(entries.map(e => e.gpu_count))].filter(Boolean);
-  return gpuCounts.length > 0 ? gpuCounts.sort((a, b) => a - b) : [8];
+  return Object.keys(byGpuCount).map(Number).sort((a, b) => a - b);
+}
+
+/**
+ * Check whether any config backs a (partial) selection, using the compiled validity matrix.
+ * selection maps dimension names (hardware, quantization, gpu_count, scenario) to IDs;
+ * dimensions left out match any option.
+ */
+export function isAvailable(selection) {
+  if (!lookupData?.validity) {
+    return true;
+  }
+
+  // Hex-encoded bitset: bit i is bit (i % 8) of byte floor(i / 8)
+  const { dimensions, strides, bits } = lookupData.validity;
+  let indices = [0];
+  dimensions.forEach((dimension, axis) => {
+    const ids = lookupData.ui_options[dimension].map(opt => String(opt.id));
+    const value = selection[dimension];
+    const positions = value === undefined || value === null
+      ? ids.map((_, position) => position)
+      : [ids.indexOf(String(value))];
+    indices = positions[0] === -1
+      ? []
+      : indices.flatMap(base => positions.map(position => base + position * strides[axis]));
+  });
+  return indices.some(index => (parseInt(bits.substr((index >> 3) * 2, 2), 16) >> (index & 7)) & 1);
 }
 
 /**